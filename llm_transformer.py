@@ -5,7 +5,7 @@ from datetime import datetime
 import os
 
 class TShirtPromptTransformer:
-    def __init__(self, model_instance=None, model_name="qwen/qwen3-vl-30b@4bit", output_dir="./poc_output/prompts", use_vision=True):
+    def __init__(self, model_instance=None, model_name="qwen/qwen3-vl-30b@4bit", output_dir="./poc_output/prompts", use_vision=True, loader=None):
         """
         Initialize transformer with either an external model instance or by creating one
 
@@ -14,9 +14,12 @@ class TShirtPromptTransformer:
             model_name: Model name to load if model_instance is None (fallback)
             output_dir: Directory for saving prompts
             use_vision: Enable vision/multimodal capabilities
+            loader: Callable taking a model name and returning a model instance,
+                used to connect and reconnect (defaults to lms.llm)
         """
         self.model_name = model_name
         self.use_vision = use_vision
+        self.loader = loader or lms.llm
 
         if model_instance is not None:
             # Use provided model instance
@@ -27,7 +30,7 @@ class TShirtPromptTransformer:
         else:
             # Fallback: create model instance
             try:
-                self.model = lms.llm(model_name)
+                self.model = self.loader(model_name)
                 print(f"✅ Connected to LMStudio model: {model_name}")
                 if use_vision:
                     print("🔍 Vision mode enabled - will process images when available")
@@ -87,7 +90,7 @@ class TShirtPromptTransformer:
 
         try:
             print(f"🔄 Attempting to reconnect to model: {self.model_name}")
-            self.model = lms.llm(self.model_name)
+            self.model = self.loader(self.model_name)
             print(f"✅ Model reconnected successfully: {self.model_name}")
             return True
         except Exception as e:
@@ -95,19 +98,28 @@ class TShirtPromptTransformer:
             self.model = None
             return False
 
+    def check_and_reconnect(self):
+        """Validate the model and reconnect once if validation fails
+
+        Returns:
+            str: 'ok' if the model was usable, 'reconnected' if a reconnect
+                fixed it, 'failed' otherwise
+        """
+        if self.validate_model():
+            return 'ok'
+        print("🔄 Model validation failed, attempting reconnection...")
+        return 'reconnected' if self.reconnect_model() else 'failed'
+
     def transform_reddit_to_tshirt_prompt(self, trend_data):
         """Transform Reddit trend into optimized ComfyUI t-shirt design prompt with optional image analysis"""
 
-        # Validate model before proceeding
-        if not self.validate_model():
-            # Attempt reconnection if validation fails
-            print("🔄 Model validation failed, attempting reconnection...")
-            if not self.reconnect_model():
-                return {
-                    "success": False,
-                    "error": "LMStudio model not available - validation and reconnection failed",
-                    "trend_id": trend_data['id']
-                }
+        # Validate model before proceeding, reconnecting if needed
+        if self.check_and_reconnect() == 'failed':
+            return {
+                "success": False,
+                "error": "LMStudio model not available - validation and reconnection failed",
+                "trend_id": trend_data['id']
+            }
 
         # Check if we have images to analyze
         has_images = self.use_vision and trend_data.get('images') and len(trend_data['images']) > 0
@@ -10,12 +10,33 @@ from tkinter import font
 import threading
 import queue
 import json
+import logging
+import logging.handlers
+import mmap
 import os
+import random
+import re
+import hashlib
+import io
+import heapq
+import concurrent.futures
+import contextlib
+import gc
+import bisect
+import shutil
+import struct
+import subprocess
+import sys
 import time
+import traceback
+import types
+from collections import OrderedDict, defaultdict, deque
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-import glob
+
+logger = logging.getLogger('synthwave_gui')
 
 # Import our existing backend modules with error handling
 try:
@@ -23,6 +44,7 @@ try:
 except ImportError:
     print("Warning: Script analyzer not available")
     ComfyUIScriptAnalyzer = None
+    PromptMapping = None
 
 try:
     from reddit_collector import get_trending_memes, get_user_subreddit_choice
@@ -48,6 +70,761 @@ except ImportError as e:
     print(f"⚠️ File organizer not available: {e}")
     FILE_ORG_AVAILABLE = False
 
+try:
+    import lmstudio as lms
+except ImportError:
+    print("⚠️ lmstudio not available - model selection disabled")
+    lms = None
+
+try:
+    from PIL import Image, ImageTk, PngImagePlugin
+except ImportError:
+    print("⚠️ Pillow not available - gallery previews disabled")
+    Image = None
+    ImageTk = None
+    PngImagePlugin = None
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    print("⚠️ watchdog not available - gallery will poll for new images")
+    Observer = None
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
+# Gallery file extensions, built once for O(1) suffix lookups
+_IMAGE_EXTS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.webp'})
+
+# Directory entries scanned per Tk event-loop tick while refreshing the gallery
+_GALLERY_SCAN_BATCH = 500
+
+
+# Persistent gallery thumbnails, named by a hash of (file path, mtime)
+_THUMB_DIR = Path('./output/.thumbs')
+_THUMB_SIZE = (800, 600)
+_THUMB_SUFFIXES = ('.jpg', '.png')  # JPEG for opaque images, PNG for ones with transparency
+_THUMB_VERSION = 2  # Bumped when the thumbnail format changes, so older files are evicted
+
+
+def _thumb_stem(file_path, mtime):
+    """Return the thumbnail file name, minus its suffix, for one version of an image file"""
+    return hashlib.sha1(f"{file_path}{mtime}:{_THUMB_VERSION}".encode()).hexdigest()
+
+
+def _ensure_thumbnail(file_path, mtime):
+    """Create the thumbnail for an image if it doesn't exist yet and return its path
+
+    Images with transparency get a PNG thumbnail so the preview keeps its
+    alpha; everything else a quality-85 JPEG. The original size is stored
+    in the thumbnail's comment so views never reopen the original.
+    """
+    stem = _THUMB_DIR / _thumb_stem(file_path, mtime)
+    for suffix in _THUMB_SUFFIXES:
+        thumb_path = stem.with_suffix(suffix)
+        if thumb_path.exists():
+            return thumb_path
+
+    with Image.open(file_path) as pil_image:
+        original_size = pil_image.size
+        has_alpha = pil_image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in pil_image.info
+        pil_image.draft('RGB', _THUMB_SIZE)
+        pil_image.thumbnail(_THUMB_SIZE, Image.Resampling.LANCZOS)
+        thumb = pil_image.convert('RGBA' if has_alpha else 'RGB')
+    comment = "%dx%d" % original_size
+
+    # Write under a temporary name so readers never see a partial file
+    _THUMB_DIR.mkdir(parents=True, exist_ok=True)
+    thumb_path = stem.with_suffix('.png' if has_alpha else '.jpg')
+    tmp_path = thumb_path.with_name(f"{thumb_path.stem}.{threading.get_ident()}.tmp")
+    if has_alpha:
+        pnginfo = PngImagePlugin.PngInfo()
+        pnginfo.add_text('comment', comment)
+        thumb.save(tmp_path, 'PNG', pnginfo=pnginfo)
+    else:
+        thumb.save(tmp_path, 'JPEG', quality=85, optimize=True, comment=comment.encode())
+    os.replace(tmp_path, thumb_path)
+    return thumb_path
+
+
+def _thumb_original_size(thumb):
+    """Original (width, height) recorded in an open thumbnail, or None if it has none"""
+    comment = thumb.info.get('comment')
+    if isinstance(comment, bytes):
+        comment = comment.decode('ascii', 'replace')
+    try:
+        width, height = comment.split('x')
+        return int(width), int(height)
+    except (AttributeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=32)
+def _decode_thumb(path, mtime, max_w, max_h, high_quality=False):
+    """Decode an image scaled to fit max_w x max_h
+
+    The default path reads the persistent thumbnail (creating it on first
+    view); high_quality decodes the original with LANCZOS instead.
+    mtime is part of the cache key so regenerated files are decoded again.
+
+    Returns:
+        (PIL image, original (width, height))
+    """
+    if high_quality:
+        with Image.open(path) as pil_image:
+            original_size = pil_image.size
+            pil_image.draft('RGB', (max_w, max_h))
+            pil_image.thumbnail((max_w, max_h), Image.Resampling.LANCZOS)
+            pil_image.load()
+        return pil_image, original_size
+
+    thumb_path = _ensure_thumbnail(path, mtime)
+    with Image.open(thumb_path) as pil_image:
+        original_size = _thumb_original_size(pil_image)
+        pil_image.thumbnail((max_w, max_h), Image.Resampling.BILINEAR)
+        pil_image.load()
+    if original_size is None:
+        with Image.open(path) as original:
+            original_size = original.size  # header only, no pixel decode
+    return pil_image, original_size
+
+
+# GIMP executable location, resolved on first use by _find_gimp()
+_cached_gimp_path: Optional[str] = None
+
+
+def _gimp_candidates():
+    """Common GIMP install locations for the current platform"""
+    if sys.platform.startswith('darwin'):  # macOS
+        return (
+            '/Volumes/Tikbalang2TB/Apps2/GIMP.app/Contents/MacOS/GIMP',
+            '/Volumes/Tikbalang2TB/Apps2/GIMP-2.10.app/Contents/MacOS/GIMP',
+            '/Applications/GIMP.app/Contents/MacOS/GIMP',
+            '/Applications/GIMP-2.10.app/Contents/MacOS/GIMP',
+            '/usr/local/bin/gimp',
+        )
+    if sys.platform.startswith('win'):  # Windows
+        return (
+            'C:\\Program Files\\GIMP 2\\bin\\gimp-2.10.exe',
+            'C:\\Program Files (x86)\\GIMP 2\\bin\\gimp-2.10.exe',
+            'C:\\Program Files\\GIMP\\bin\\gimp.exe',
+            'C:\\Program Files (x86)\\GIMP\\bin\\gimp.exe',
+        )
+    return (  # Linux
+        '/usr/bin/gimp',
+        '/usr/local/bin/gimp',
+        '/snap/bin/gimp',
+        '/usr/bin/gimp-2.10',
+    )
+
+
+def _find_gimp():
+    """Return the GIMP executable path, probing the filesystem only until it is found
+
+    Each candidate is stat'ed on a worker with a 0.5s timeout so a sleeping
+    external volume can't stall the GUI; the system PATH is checked last.
+    """
+    global _cached_gimp_path
+    if _cached_gimp_path:
+        return _cached_gimp_path
+
+    candidates = _gimp_candidates()
+    probe_pool = concurrent.futures.ThreadPoolExecutor(max_workers=len(candidates))
+    try:
+        probes = [probe_pool.submit(os.path.exists, path) for path in candidates]
+        for path, probe in zip(candidates, probes):
+            try:
+                if probe.result(timeout=0.5):
+                    _cached_gimp_path = path
+                    break
+            except concurrent.futures.TimeoutError:
+                print(f"[WARNING] Timed out probing GIMP location: {path}")
+    finally:
+        probe_pool.shutdown(wait=False)
+
+    if not _cached_gimp_path:
+        _cached_gimp_path = shutil.which('gimp')
+    return _cached_gimp_path
+
+
+def _forget_gimp_path():
+    """Drop the cached GIMP location so the next launch probes again"""
+    global _cached_gimp_path
+    _cached_gimp_path = None
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling LMStudio while its circuit breaker is open"""
+
+
+class CircuitBreaker:
+    """Closed/Open/Half-Open breaker that fails fast after repeated failures
+
+    Used as a context manager around a call: exceptions raised inside count
+    as failures, a clean exit as a success. After fail_threshold consecutive
+    failures the breaker opens and __enter__ raises CircuitOpenError until
+    reset_timeout seconds have passed; the next call is then a half-open
+    trial that either closes the breaker or re-opens it. on_open, if given,
+    is called (on the failing thread) each time a failure leaves it open.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, fail_threshold=3, reset_timeout=30.0, name="LMStudio", on_open=None):
+        self.name = name
+        self.on_open = on_open
+        self.fail_threshold = fail_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failure_count = 0
+        self.last_failure_ts = 0.0
+        self._lock = threading.Lock()
+
+    def is_open(self):
+        """True while calls are being short-circuited"""
+        with self._lock:
+            return (self.state == self.OPEN
+                    and time.monotonic() - self.last_failure_ts < self.reset_timeout)
+
+    def record_success(self):
+        with self._lock:
+            self.failure_count = 0
+            self.state = self.CLOSED
+
+    def record_failure(self):
+        with self._lock:
+            self.failure_count += 1
+            self.last_failure_ts = time.monotonic()
+            if self.state == self.HALF_OPEN or self.failure_count >= self.fail_threshold:
+                self.state = self.OPEN
+            opened = self.state == self.OPEN
+        if opened and self.on_open is not None:
+            self.on_open()
+
+    def __enter__(self):
+        with self._lock:
+            if self.state == self.OPEN:
+                remaining = self.reset_timeout - (time.monotonic() - self.last_failure_ts)
+                if remaining > 0:
+                    raise CircuitOpenError(f"{self.name} unavailable, retrying in {remaining:.0f}s")
+                self.state = self.HALF_OPEN
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        if exc_type is None:
+            self.record_success()
+        else:
+            self.record_failure()
+        return False
+
+
+# Single worker for blocking lms.llm() loads, so model loads never overlap
+_MODEL_LOAD_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+# Runs the raw lms.llm() call so a load can be abandoned after its timeout
+_LMS_CALL_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
+# lms.llm() calls still running, by model name; an abandoned one is joined rather than started again
+_running_lms_calls = {}
+_running_lms_lock = threading.Lock()
+
+# Default load budget; overridable through model_preferences.json.
+# A cold load of a 30B model can take minutes, so the timeout is generous.
+_DEFAULT_LOAD_BUDGET = {'timeout': 300.0, 'max_retries': 2, 'base_backoff': 0.5}
+
+# Rolling load health: models failing more than this share of loads in the window are skipped
+_HEALTH_WINDOW = 60.0
+_HEALTH_MAX_FAIL_RATE = 0.5
+_HEALTH_LABEL_SEP = "  ⚠ "
+
+# Scan-results lines kept; older ones are trimmed on each log flush
+_SCAN_LOG_MAX_LINES = 2000
+
+# Most result dicts kept for reuse by the next demo scan
+_RESULT_POOL_MAX = 1024
+
+# Demo-mode score ranges per time filter (used when reddit_collector is unavailable)
+_DEMO_SCORE_RANGES = {
+    'hour': (500, 2000),
+    'day': (1000, 5000),
+    'week': (2000, 10000),
+    'month': (5000, 20000),
+}
+
+
+def _is_transient_load_error(error):
+    """Connection problems are worth retrying; anything else, timeouts included, fails immediately"""
+    if isinstance(error, (concurrent.futures.TimeoutError, TimeoutError)):
+        return False
+    return isinstance(error, ConnectionError) or 'connection' in str(error).lower()
+
+
+def _lms_call(model_name):
+    """Future for lms.llm(model_name), joining a call for the same model that is still running
+
+    A timed-out attempt can't be cancelled once lms.llm() has started, so
+    a later load waits on that call instead of asking LMStudio for a
+    second copy of the model.
+    """
+    with _running_lms_lock:
+        future = _running_lms_calls.get(model_name)
+        if future is not None and not future.done():
+            logger.info("Joining the still-running lms.llm() call for %s", model_name)
+            return future
+        future = _running_lms_calls[model_name] = _LMS_CALL_POOL.submit(lms.llm, model_name)
+
+    def forget(done):
+        with _running_lms_lock:
+            if _running_lms_calls.get(model_name) is done:
+                del _running_lms_calls[model_name]
+    future.add_done_callback(forget)
+    return future
+
+
+def _load_model_with_budget(model_name, timeout, max_retries, base_backoff):
+    """Call lms.llm() with a per-attempt timeout, retrying connection errors with backoff + jitter
+
+    A timeout is reported straight away: the abandoned call keeps running
+    on _LMS_CALL_POOL, so retrying would only load the model a second time.
+    """
+    for attempt in range(max_retries + 1):
+        future = _lms_call(model_name)
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            if future.done():
+                raise  # lms.llm() itself timed out (the same class on Python 3.11+)
+            raise TimeoutError(f"Loading {model_name} timed out after {timeout:.0f}s") from None
+        except Exception as e:
+            if attempt >= max_retries or not _is_transient_load_error(e):
+                raise
+            delay = base_backoff * 2 ** attempt + random.uniform(0.01, 0.05)
+            logger.warning("Load attempt %d for %s failed (%s), retrying in %.2fs", attempt + 1, model_name, e, delay)
+            time.sleep(delay)
+
+
+def _do_load(model_name, *breakers, **budget):
+    """Load a model through LMStudio behind circuit breakers (blocking; runs on _MODEL_LOAD_POOL)
+
+    budget may override the timeout, max_retries and base_backoff in _DEFAULT_LOAD_BUDGET.
+    """
+    if lms is None:
+        raise ImportError("lmstudio package not found")
+    with contextlib.ExitStack() as stack:
+        for breaker in breakers:
+            stack.enter_context(breaker)
+        return _load_model_with_budget(model_name, **{**_DEFAULT_LOAD_BUDGET, **budget})
+
+
+def _probe_lmstudio(*breakers):
+    """Cheapest real round trip to LMStudio, behind circuit breakers (blocking)
+
+    Listing the downloaded models needs the server but loads nothing, so
+    it makes a good half-open trial.
+    """
+    if lms is None:
+        raise ImportError("lmstudio package not found")
+    with contextlib.ExitStack() as stack:
+        for breaker in breakers:
+            stack.enter_context(breaker)
+        lms.list_downloaded_models()
+
+
+def _prewarm_lmstudio():
+    """Touch the lmstudio entry points so lazily imported submodules load off the GUI thread"""
+    try:
+        getattr(lms, '__version__', None)
+        lms.llm
+        lms.list_downloaded_models
+    except Exception as e:
+        logger.warning("LMStudio prewarm failed: %s", e)
+
+
+def _unload_model(model_instance):
+    """Ask LMStudio to unload a model handle's weights (blocking; runs on the LMStudio worker)"""
+    unload = getattr(model_instance, 'unload', None)
+    if callable(unload):
+        try:
+            unload()
+        except Exception as e:
+            logger.warning("LMStudio unload failed: %s", e)
+
+
+def _model_key(model):
+    """Model key from a list_downloaded_models() entry (dict or DownloadedLlm object)"""
+    if isinstance(model, dict):
+        return model.get('key', model.get('name', str(model)))
+    return getattr(model, 'model_key', None) or str(model)
+
+
+# Python files in the working directory that are never workflow scripts (GUI files and backend modules)
+_EXCLUDE_PY = frozenset({
+    "synthwave_gui.py",
+    "synthwave_gui_fixed.py",
+    "synthwave_gui_simple.py",
+    "demo_gui.py",
+    "reddit_collector.py",
+    "llm_transformer.py",
+    "comfyui_simple.py",
+    "file_organizer.py",
+    "tshirt_executor.py",
+})
+
+# Filename / leading-content keywords that mark a .py file as a ComfyUI workflow script
+_SCRIPT_NAME_KEYWORDS = (b'workflow', b'comfy', b'poc', b'tshirt', b'flux')
+_SCRIPT_CONTENT_KEYWORDS = (b'comfyui', b'workflow', b'queue_prompt')
+
+
+def _sniff_script_header(path, size=512):
+    """True if the first bytes of path mention ComfyUI (raw read, no decoding)"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        # If we can't read the file, skip it
+        return False
+    try:
+        head = os.read(fd, size).lower()
+    except OSError:
+        return False
+    finally:
+        os.close(fd)
+    return any(keyword in head for keyword in _SCRIPT_CONTENT_KEYWORDS)
+
+
+# Markers validate_comfyui_script looks for. Initialisations come before the bare
+# names they contain, since matches don't overlap (an init implies usage).
+_SCRIPT_MARKERS_RE = re.compile(
+    rb'(?P<main>def main\()'
+    rb'|(?P<saveimage>(?i:saveimage))'
+    rb'|(?P<return_dict>return dict\()'
+    rb'|(?P<comfyui>(?i:comfyui|workflow|queue_prompt|get_value_at_index))'
+    rb'|(?P<manager_usage>if has_manager:)'
+    rb'|(?P<manager_init>has_manager = (?:False|True))'
+    rb'|(?P<nodes_init>_custom_nodes_imported = (?:False|True))'
+    rb'|(?P<nodes_usage>_custom_nodes_imported)'
+    rb'|(?P<path_init>_custom_path_added = (?:False|True))'
+    rb'|(?P<path_usage>_custom_path_added)'
+)
+
+
+@lru_cache(maxsize=64)
+def _validate_script_cached(path, mtime_ns, size):
+    """Check a workflow script's source for module-import compatibility
+
+    Keyed by (path, mtime_ns, size) so an unchanged file is only read once;
+    editing the file changes the key. Returns (ok, message).
+    """
+    with open(path, 'rb') as f:
+        content = f.read()
+
+    # One regex pass records which of the markers below appear anywhere
+    found = {m.lastgroup for m in _SCRIPT_MARKERS_RE.finditer(content)}
+
+    # Check for required components
+    has_main_function = 'main' in found
+    has_saveimage = 'saveimage' in found
+    has_return_dict = 'return_dict' in found
+
+    # Check for ComfyUI patterns
+    has_comfyui_patterns = 'comfyui' in found
+
+    # Check for common SaveAsScript bugs: missing variable initializations
+    has_manager_usage = 'manager_usage' in found
+    has_manager_init = 'manager_init' in found
+
+    custom_nodes_init = 'nodes_init' in found
+    custom_nodes_usage = custom_nodes_init or 'nodes_usage' in found
+
+    custom_path_init = 'path_init' in found
+    custom_path_usage = custom_path_init or 'path_usage' in found
+
+    issues = []
+    warnings = []
+
+    if not has_main_function:
+        issues.append("Missing 'def main(' function")
+    if not has_saveimage:
+        issues.append("No SaveImage node detected")
+    if not has_return_dict:
+        issues.append("Missing 'return dict(' statement")
+    if not has_comfyui_patterns:
+        issues.append("No ComfyUI patterns detected")
+
+    # Check for SaveAsScript bugs (warnings, not errors - we can fix these)
+    auto_fixable = []
+    if has_manager_usage and not has_manager_init:
+        auto_fixable.append("has_manager")
+    if custom_nodes_usage and not custom_nodes_init:
+        auto_fixable.append("_custom_nodes_imported")
+    if custom_path_usage and not custom_path_init:
+        auto_fixable.append("_custom_path_added")
+
+    if auto_fixable:
+        warnings.append(f"Missing variable initializations: {', '.join(auto_fixable)} (will be auto-fixed)")
+
+    if issues:
+        return False, "; ".join(issues)
+    else:
+        message = "Script appears compatible"
+        if warnings:
+            message += f" (warnings: {'; '.join(warnings)})"
+        return True, message
+
+
+# Channel count -> PIL mode for images handed to Image.frombuffer
+_RAW_IMAGE_MODES = {1: 'L', 3: 'RGB', 4: 'RGBA'}
+
+
+def _create_unique_png(directory, stem, taken):
+    """Atomically create an empty <stem>.png, or <stem>_NNN.png if that name is in use
+
+    Names in taken (a set of names known to exist) are skipped without a
+    syscall; O_EXCL catches anything created since, including by another run.
+
+    Returns:
+        (fd, path) for the new file, opened for writing; the chosen name is added to taken
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+    filename = f"{stem}.png"
+    counter = 0
+    while True:
+        if filename not in taken:
+            path = os.path.join(directory, filename)
+            try:
+                fd = os.open(path, flags, 0o644)
+            except FileExistsError:
+                pass
+            else:
+                taken.add(filename)
+                return fd, path
+            taken.add(filename)
+        counter += 1
+        filename = f"{stem}_{counter:03d}.png"
+
+
+def _write_png(pil_img, fd, filepath):
+    """Encode pil_img to PNG in memory, then write it to fd (from _create_unique_png) in one call
+
+    PIL streams a PNG to disk chunk by chunk; encoding first turns that into
+    one write per image. Uses a fast compression level. On failure the
+    placeholder file is removed.
+    """
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            buffer = io.BytesIO()
+            pil_img.save(buffer, format='PNG', optimize=False, compress_level=1)
+            f.write(buffer.getbuffer())
+    except Exception:
+        with contextlib.suppress(OSError):
+            os.unlink(filepath)
+        raise
+
+
+@lru_cache(maxsize=1)
+def _resolve_comfyui_root():
+    """Find the ComfyUI checkout (the directory holding comfy_extras) and put it on sys.path
+
+    Cached: the probe's answer doesn't change while the process runs, so the
+    stats and the sys.path insert happen on the first generation only.
+
+    Returns:
+        The ComfyUI directory as a string, or None if none of the candidates has comfy_extras
+    """
+    comfy_paths = [
+        "/Volumes/Tikbalang2TB/Users/tikbalang/comfy_env/ComfyUI",  # Known path
+        str(Path.cwd().parent),  # Parent directory
+        str(Path.cwd()),  # Current directory
+    ]
+    for comfy_path in comfy_paths:
+        if os.path.isdir(os.path.join(comfy_path, "comfy_extras")):
+            if comfy_path not in sys.path:
+                sys.path.insert(0, comfy_path)
+            print(f"🔍 Using ComfyUI path: {comfy_path}")
+            return comfy_path
+    return None
+
+
+def _images_to_uint8_batch(images):
+    """Convert an IMAGE batch to one contiguous (N, H, W, C) uint8 numpy array
+
+    Torch tensors are scaled, cast and moved to the CPU as a whole batch;
+    layout is decided once from the batch shape rather than per image.
+    """
+    import numpy as np  # Deferred: only the fallback saver needs it, and not at startup
+
+    torch = sys.modules.get('torch')  # A tensor means torch is already imported
+    if torch is not None and isinstance(images, (list, tuple)) and images and torch.is_tensor(images[0]):
+        images = torch.stack(list(images))
+
+    if torch is not None and torch.is_tensor(images):
+        batch = images.detach() if images.requires_grad else images
+        if batch.dim() == 3:
+            batch = batch.unsqueeze(0)
+        elif batch.dim() == 5:  # (N, 1, H, W, C): one image per entry
+            batch = batch[:, 0]
+        if batch.is_floating_point():
+            # ComfyUI floats are 0-1; a full max() (cheap next to PNG encoding)
+            # spots a batch that is already 0-255 in any channel. The first op
+            # copies, so the in-place clamp never touches the caller's tensor.
+            if batch.max() <= 1.0:
+                batch = batch.mul(255).clamp_(0, 255)
+            else:
+                batch = batch.clamp(0, 255)
+        # Each step only runs when needed, so a contiguous CPU uint8 batch is
+        # handed to numpy as a view of the tensor's own storage
+        if batch.dtype != torch.uint8:
+            batch = batch.to(torch.uint8)
+        if batch.shape[1] in (1, 3, 4):  # (N, C, H, W); permuted after the cast, on 1-byte values
+            batch = batch.permute(0, 2, 3, 1)
+        if not batch.is_contiguous():
+            batch = batch.contiguous()  # On the device, before the transfer
+        if batch.device.type != 'cpu':
+            batch = batch.cpu()  # After the cast: one byte per channel crosses the bus
+        return batch.numpy()
+
+    batch = np.asarray(images)
+    if batch.ndim == 3:
+        batch = batch[np.newaxis]
+    elif batch.ndim == 5:
+        batch = batch[:, 0]
+    if batch.shape[1] in (1, 3, 4):
+        batch = batch.transpose(0, 2, 3, 1)
+    if batch.dtype != np.uint8:
+        if batch.max() <= 1.0:
+            batch = batch * 255
+        batch = np.clip(batch, 0, 255).astype(np.uint8)
+    return np.ascontiguousarray(batch)
+
+
+@lru_cache(maxsize=8)
+def _compile_script_cached(path, mtime_ns, size):
+    """Compile a workflow script to a code object, once per (path, mtime_ns, size)"""
+    with open(path, 'rb') as f:
+        return compile(f.read(), path, 'exec')
+
+
+def _find_comfyui_scripts():
+    """Sorted ComfyUI workflow scripts in the current directory (safe to call off the GUI thread)"""
+    # Look for all Python files in one directory pass, then filter out GUI files
+    with os.scandir('.') as it:
+        entries = [e for e in it
+                   if e.name.endswith('.py') and e.name not in _EXCLUDE_PY and e.is_file()]
+
+    # Filter to likely ComfyUI workflow scripts
+    workflow_scripts = []
+    to_sniff = []
+    for entry in entries:
+        # Include files that likely contain ComfyUI workflows
+        # Check for common ComfyUI patterns in filename or prioritize POC files
+        name = entry.name.lower().encode()
+        if any(keyword in name for keyword in _SCRIPT_NAME_KEYWORDS):
+            workflow_scripts.append(entry.name)
+        else:
+            to_sniff.append(entry)
+
+    # For other .py files, a quick check of the first bytes; the reads overlap across threads
+    if to_sniff:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(to_sniff))) as pool:
+            matches = pool.map(_sniff_script_header, [entry.path for entry in to_sniff])
+            workflow_scripts.extend(entry.name for entry, hit in zip(to_sniff, matches) if hit)
+
+    scripts = sorted(workflow_scripts)
+
+    # Ensure default script is included, keeping the list sorted for import_script's insort
+    if "tshirtPOC_768x1024.py" not in workflow_scripts:
+        bisect.insort(scripts, "tshirtPOC_768x1024.py")
+    return scripts
+
+
+def _strip_health_label(value):
+    """Model name from a combobox entry that may carry a "⚠ 80% fail" suffix"""
+    return value.split(_HEALTH_LABEL_SEP, 1)[0]
+
+
+# Keys a read-only Text still honours: scrolling/caret movement, plus Ctrl/Cmd+C and +A
+_READONLY_NAV_KEYS = frozenset({'Up', 'Down', 'Left', 'Right', 'Prior', 'Next', 'Home', 'End'})
+_READONLY_SHORTCUT_KEYS = frozenset({'c', 'a'})
+
+
+def _readonly_text_key(event):
+    """<Key> handler that swallows edits but lets navigation and copy through"""
+    if event.keysym in _READONLY_NAV_KEYS:
+        return None
+    if event.state & 0x0C and event.keysym.lower() in _READONLY_SHORTCUT_KEYS:  # Control / Command
+        return None
+    return 'break'
+
+
+@lru_cache(maxsize=1)
+def _log_time(second):
+    """HH:MM:SS for an integer epoch second; consecutive log lines share one format call"""
+    return time.strftime("%H:%M:%S", time.localtime(second))
+
+
+def _strip_py(name):
+    """Strip a trailing '.py' extension without touching mid-name occurrences"""
+    return name[:-3] if name.endswith('.py') else name
+
+
+# Demo-mode prompt file, filled with str.format_map in create_mock_prompt
+_MOCK_PROMPT_TEMPLATE = """# T-Shirt Design Prompt (Demo Mode)
+
+## Source Information
+- **Reddit ID**: {reddit_id}
+- **Original Title**: {title}
+- **Text Content**: {text_content}
+- **Popularity Score**: {score}
+- **Generated**: {generated}
+- **Generation Type**: Demo Mode
+
+## ComfyUI Prompt
+
+```
+Vector illustration of {prompt_concept},
+bold graphic design style, high contrast colors, minimalist composition,
+suitable for t-shirt printing, 768x1024 pixels, 300 DPI, RGB, transparent background
+```
+
+## Technical Specifications
+- **Dimensions**: 768x1024 pixels
+- **Resolution**: 300 DPI
+- **Color Mode**: RGB
+- **Background**: Transparent
+- **Format**: PNG
+- **Design Type**: Demo visual graphic design
+
+## Notes
+- Demo mode prompt - LLM not available
+- Generated for GUI demonstration purposes
+"""
+
+
+class GalleryEventHandler(FileSystemEventHandler):
+    """Forward any filesystem event in a watched output folder to a callback"""
+
+    def __init__(self, callback):
+        super().__init__()
+        self.callback = callback
+
+    def on_any_event(self, event):
+        self.callback()
+
+
+class NotifyingQueue(queue.Queue):
+    """Queue that invokes a callback after every put so consumers need not poll"""
+
+    def __init__(self, maxsize=0):
+        super().__init__(maxsize)
+        self.on_put = None
+
+    def put(self, item, block=True, timeout=None):
+        super().put(item, block, timeout)
+        if self.on_put is not None:
+            self.on_put()
+
 
 class SynthwaveColors:
     """Enhanced Synthwave color palette with glowing effects"""
@@ -109,9 +886,95 @@ class ModelState:
     RECONNECTING = "reconnecting"
 
 
+_STATE_COLORS = {
+    ModelState.LOADED: SynthwaveColors.SUCCESS,
+    ModelState.LOADING: SynthwaveColors.WARNING,
+    ModelState.RECONNECTING: SynthwaveColors.WARNING,
+    ModelState.FAILED: SynthwaveColors.ERROR,
+    ModelState.ACTIVE: SynthwaveColors.NEON_CYAN,
+}
+
+_NOTIFICATION_COLORS = {
+    "info": SynthwaveColors.NEON_CYAN,
+    "warning": SynthwaveColors.WARNING,
+    "error": SynthwaveColors.ERROR,
+}
+
+# check_and_reconnect() result -> (new model state or None, status message, model ready)
+_RECONNECT_OUTCOMES = {
+    'ok': (None, None, True),
+    'reconnected': (ModelState.LOADED, "Model reconnected successfully", True),
+    'failed': (ModelState.FAILED, "Model reconnection failed", False),
+}
+
+# Load errors worth retrying with the fallback chain
+_RECOVERABLE_ERROR_RE = re.compile(r'model not found|connection|timeout|network', re.IGNORECASE)
+
+# The fenced prompt block in a generated prompt file (searched on the raw bytes)
+_PROMPT_RE = re.compile(rb'## ComfyUI Prompt\s*```([^`]+)```', re.DOTALL)
+
+
+def _ascii_cell(ch, w, h):
+    """Pixels (x, y) to light for one block/box-drawing character in a w x h cell"""
+    if ch == '█':
+        return {(x, y) for x in range(w) for y in range(h)}
+    # Double box-drawing lines: two strokes either side of the cell centre
+    xs, ys = (w // 2 - 2, w // 2 + 1), (h // 2 - 2, h // 2 + 1)
+    if ch == '═':
+        return {(x, y) for y in ys for x in range(w)}
+    if ch == '║':
+        return {(x, y) for x in xs for y in range(h)}
+    # Corners: (horizontal arm, vertical arm, outer stroke corner, inner stroke corner)
+    corner = {
+        '╔': ('r', 'd', (xs[0], ys[0]), (xs[1], ys[1])),
+        '╗': ('l', 'd', (xs[1], ys[0]), (xs[0], ys[1])),
+        '╚': ('r', 'u', (xs[0], ys[1]), (xs[1], ys[0])),
+        '╝': ('l', 'u', (xs[1], ys[1]), (xs[0], ys[0])),
+    }.get(ch)
+    if corner is None:
+        return set()
+    h_arm, v_arm, *points = corner
+    pixels = set()
+    for px, py in points:
+        x_range = range(px, w) if h_arm == 'r' else range(0, px + 1)
+        y_range = range(py, h) if v_arm == 'd' else range(0, py + 1)
+        pixels |= {(x, py) for x in x_range} | {(px, y) for y in y_range}
+    return pixels
+
+
+def _render_ascii_art(master, lines, fg, bg, cell_w=7, cell_h=12):
+    """Render block/box-drawing ASCII art into a tk.PhotoImage with a single put()"""
+    width = cell_w * max(map(len, lines))
+    rows = [[bg] * width for _ in range(cell_h * len(lines))]
+    cells = {}
+    for row, line in enumerate(lines):
+        for col, ch in enumerate(line):
+            if ch == ' ':
+                continue
+            if ch not in cells:
+                cells[ch] = _ascii_cell(ch, cell_w, cell_h)
+            for x, y in cells[ch]:
+                rows[row * cell_h + y][col * cell_w + x] = fg
+    image = tk.PhotoImage(master=master, width=width, height=len(rows))
+    image.put(' '.join('{' + ' '.join(r) + '}' for r in rows))
+    return image
+
+
 class SplashScreen:
     """Synthwave-themed splash screen with loading animation"""
 
+    LOGO_LINES = (
+        "╔═══════════════════════════════════════╗",
+        "║  ██████╗ ███████╗██████╗ ██████╗ ██╗  ║",
+        "║  ██╔══██╗██╔════╝██╔══██╗██╔══██╗██║  ║",
+        "║  ██████╔╝█████╗  ██║  ██║██║  ██║██║  ║",
+        "║  ██╔══██╗██╔══╝  ██║  ██║██║  ██║██║  ║",
+        "║  ██║  ██║███████╗██████╔╝██████╔╝██║  ║",
+        "║  ╚═╝  ╚═╝╚══════╝╚═════╝ ╚═════╝ ╚═╝  ║",
+        "╚═══════════════════════════════════════╝",
+    )
+    LOGO_IMG = None  # PhotoImage of LOGO_LINES, built on first show
+
     def __init__(self, parent_callback):
         self.parent_callback = parent_callback
 
@@ -167,27 +1030,16 @@ class SplashScreen:
         )
         subtitle_label.pack(pady=(0, 30))
 
-        # ASCII art style logo
-        logo_font = font.Font(family="Courier New", size=8)
-        logo_text = """
-    ╔═══════════════════════════════════════╗
-    ║  ██████╗ ███████╗██████╗ ██████╗ ██╗  ║
-    ║  ██╔══██╗██╔════╝██╔══██╗██╔══██╗██║  ║
-    ║  ██████╔╝█████╗  ██║  ██║██║  ██║██║  ║
-    ║  ██╔══██╗██╔══╝  ██║  ██║██║  ██║██║  ║
-    ║  ██║  ██║███████╗██████╔╝██████╔╝██║  ║
-    ║  ╚═╝  ╚═╝╚══════╝╚═════╝ ╚═════╝ ╚═╝  ║
-    ╚═══════════════════════════════════════╝
-        """
+        # ASCII art style logo, drawn into an image once and blitted from then on
+        if SplashScreen.LOGO_IMG is None:
+            SplashScreen.LOGO_IMG = _render_ascii_art(
+                self.root, self.LOGO_LINES, SynthwaveColors.TERTIARY_ACCENT, SynthwaveColors.BACKGROUND)
         logo_label = tk.Label(
             main_frame,
-            text=logo_text,
-            font=logo_font,
-            fg=SynthwaveColors.TERTIARY_ACCENT,
-            bg=SynthwaveColors.BACKGROUND,
-            justify='center'
+            image=SplashScreen.LOGO_IMG,
+            bg=SynthwaveColors.BACKGROUND
         )
-        logo_label.pack(pady=(10, 20))
+        logo_label.pack(pady=(22, 32))
 
         # Loading indicator
         self.loading_label = tk.Label(
@@ -199,60 +1051,46 @@ class SplashScreen:
         )
         self.loading_label.pack(pady=(20, 10))
 
-        # Progress bar with synthwave styling
-        style = ttk.Style()
-        style.theme_use('clam')
-        style.configure(
-            "Synthwave.Horizontal.TProgressbar",
-            background=SynthwaveColors.PRIMARY_ACCENT,
-            troughcolor=SynthwaveColors.SECONDARY,
-            borderwidth=0,
-            lightcolor=SynthwaveColors.PRIMARY_ACCENT,
-            darkcolor=SynthwaveColors.PRIMARY_ACCENT
-        )
-
-        self.progress_bar = ttk.Progressbar(
+        # Step meter, redrawn only when the loading step changes
+        self.spinner_label = tk.Label(
             main_frame,
-            style="Synthwave.Horizontal.TProgressbar",
-            length=400,
-            mode='indeterminate'
+            text="",
+            font=subtitle_font,
+            fg=SynthwaveColors.PRIMARY_ACCENT,
+            bg=SynthwaveColors.BACKGROUND
         )
-        self.progress_bar.pack(pady=(10, 20))
+        self.spinner_label.pack(pady=(10, 20))
+
+    # Simulated loading steps, one per SPLASH_STEP_MS
+    LOADING_STEPS = (
+        "INITIALIZING...",
+        "LOADING MODULES...",
+        "CONFIGURING AI...",
+        "PREPARING INTERFACE...",
+        "READY TO LAUNCH!",
+    )
+    SPLASH_STEP_MS = 800
 
     def animate_splash(self):
         """Animate the splash screen"""
         print("🎬 Starting splash animation...")
-        self.progress_bar.start(10)
-
-        # Simulate loading steps with simpler timing
-        loading_steps = [
-            "INITIALIZING...",
-            "LOADING MODULES...",
-            "CONFIGURING AI...",
-            "PREPARING INTERFACE...",
-            "READY TO LAUNCH!"
-        ]
-
-        # Use a more reliable timing approach
-        total_steps = len(loading_steps)
-        step_duration = 800  # milliseconds per step
-
-        def update_loading(step_index=0):
-            if step_index < total_steps:
-                print(f"📋 Splash step {step_index + 1}/{total_steps}: {loading_steps[step_index]}")
-                self.loading_label.config(text=loading_steps[step_index])
-                # Schedule next step
-                if step_index < total_steps - 1:
-                    self.root.after(step_duration, lambda idx=step_index + 1: update_loading(idx))
-                else:
-                    # Last step, launch main app after delay
-                    self.root.after(step_duration, self.launch_main_app)
-            else:
-                # Fallback - should not reach here
-                self.launch_main_app()
+        self._splash_step = 0
+        self._splash_tick()
+
+    def _splash_tick(self):
+        """Show the current loading step, then re-arm for the next one or launch the app"""
+        step = self._splash_step
+        total_steps = len(self.LOADING_STEPS)
+        if step >= total_steps:
+            # Last step shown for its full duration; launch main app
+            self.launch_main_app()
+            return
 
-        # Start the animation
-        update_loading(0)
+        print(f"📋 Splash step {step + 1}/{total_steps}: {self.LOADING_STEPS[step]}")
+        self.loading_label.config(text=self.LOADING_STEPS[step])
+        self.spinner_label.config(text='▰' * (step + 1) + '▱' * (total_steps - step - 1))
+        self._splash_step = step + 1
+        self.root.after(self.SPLASH_STEP_MS, self._splash_tick)
 
     def launch_main_app(self):
         """Close splash and launch main application"""
@@ -262,29 +1100,252 @@ class SplashScreen:
         self.parent_callback()
 
 
+class VirtualListbox(tk.Canvas):
+    """Listbox-like canvas that only draws the rows inside the visible viewport
+
+    Supports the subset of the tk.Listbox API the gallery uses (insert, delete,
+    curselection, select_set/select_clear, see, nearest, size) and generates
+    <<ListboxSelect>> on click and keyboard navigation (arrows, Page Up/Down,
+    Home/End).
+    """
+
+    def __init__(self, parent, font, fg, selectbackground, selectforeground, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.row_font = font
+        self.fg = fg
+        self.selectbackground = selectbackground
+        self.selectforeground = selectforeground
+        self.row_height = font.metrics('linespace') + 2
+        self.items = []
+        self.selected = None
+
+        # One scroll "unit" is one row, so wheel scrolling lands on row boundaries
+        self.configure(yscrollincrement=self.row_height)
+
+        self.bind('<Configure>', lambda event: self.redraw())
+        self.bind('<Button-1>', self._on_click)
+        self.bind('<Up>', lambda event: self._move_selection(-1))
+        self.bind('<Down>', lambda event: self._move_selection(1))
+        self.bind('<Prior>', lambda event: self._move_selection(-self._page_rows()))
+        self.bind('<Next>', lambda event: self._move_selection(self._page_rows()))
+        self.bind('<Home>', lambda event: self._select_index(0))
+        self.bind('<End>', lambda event: self._select_index(len(self.items) - 1))
+        self.bind('<MouseWheel>', self._on_mousewheel)
+        self.bind('<Button-4>', self._on_mousewheel)
+        self.bind('<Button-5>', self._on_mousewheel)
+
+    # Scrolling: every viewport change re-renders the visible rows
+    def yview(self, *args):
+        result = super().yview(*args)
+        if args:
+            self.redraw()
+        return result
+
+    def yview_moveto(self, fraction):
+        super().yview_moveto(fraction)
+        self.redraw()
+
+    def yview_scroll(self, number, what):
+        super().yview_scroll(number, what)
+        self.redraw()
+
+    # Listbox-compatible API
+    def size(self):
+        return len(self.items)
+
+    def insert(self, index, *names):
+        if index == tk.END:
+            self.items.extend(names)
+        else:
+            self.items[index:index] = names
+        self._update_scrollregion()
+        self.redraw()
+
+    def delete(self, first, last=None):
+        if last == tk.END:
+            del self.items[first:]
+        else:
+            del self.items[first:(first if last is None else last) + 1]
+        self.selected = None
+        self._update_scrollregion()
+        self.redraw()
+
+    def curselection(self):
+        return () if self.selected is None else (self.selected,)
+
+    def select_set(self, index):
+        self.selected = index
+        self.redraw()
+
+    def select_clear(self, first, last=None):
+        self.selected = None
+        self.redraw()
+
+    def nearest(self, y):
+        if not self.items:
+            return -1
+        return max(0, min(int(self.canvasy(y) // self.row_height), len(self.items) - 1))
+
+    def see(self, index):
+        top = index * self.row_height
+        view_top = self.canvasy(0)
+        view_height = self.winfo_height()
+        if top < view_top or top + self.row_height > view_top + view_height:
+            self.yview_moveto(top / max(len(self.items) * self.row_height, 1))
+
+    def redraw(self):
+        """Draw only the rows that intersect the current viewport"""
+        self.delete_rows()
+        if not self.items:
+            return
+
+        width = self.winfo_width()
+        first = int(self.canvasy(0) // self.row_height)
+        last = min(first + self.winfo_height() // self.row_height + 2, len(self.items))
+        for i in range(max(first, 0), last):
+            y = i * self.row_height
+            fill = self.fg
+            if i == self.selected:
+                self.create_rectangle(0, y, width, y + self.row_height, fill=self.selectbackground, outline='', tags='row')
+                fill = self.selectforeground
+            self.create_text(4, y + 1, anchor='nw', text=self.items[i], font=self.row_font, fill=fill, tags='row')
+
+    def delete_rows(self):
+        # Canvas.delete is shadowed by the Listbox-style delete above
+        super().delete('row')
+
+    def _update_scrollregion(self):
+        self.configure(scrollregion=(0, 0, 0, len(self.items) * self.row_height))
+
+    def _on_click(self, event):
+        self.focus_set()
+        index = self.nearest(event.y)
+        if index >= 0:
+            self.select_set(index)
+            self.event_generate('<<ListboxSelect>>')
+
+    def _move_selection(self, step):
+        self._select_index(0 if self.selected is None else self.selected + step)
+
+    def _select_index(self, index):
+        if not self.items:
+            return
+        index = max(0, min(index, len(self.items) - 1))
+        self.select_set(index)
+        self.see(index)
+        self.event_generate('<<ListboxSelect>>')
+
+    def _page_rows(self):
+        """Rows in one Page Up/Down step: a viewport less one row of overlap"""
+        return max(1, self.winfo_height() // self.row_height - 1)
+
+    def _on_mousewheel(self, event):
+        if event.num == 4:
+            self.yview_scroll(-1, 'units')
+        elif event.num == 5:
+            self.yview_scroll(1, 'units')
+        elif event.delta:
+            # Windows reports 120 per notch; macOS and precision touchpads send deltas of a few units
+            steps = max(1, abs(event.delta) // 120) if sys.platform.startswith('win') else 1
+            self.yview_scroll(-steps if event.delta > 0 else steps, 'units')
+
+
 class SynthwaveGUI:
     """Main synthwave-themed GUI application"""
 
+    # The old RESULTS tab builders below are no-ops unless this is switched on
+    _enable_legacy_results_tab = False
+
+    # Where generated designs land; check_design_exists lists it
+    DESIGNS_DIR = Path("poc_output/generated_designs")
+
+    # Prompts run_comfyui_execution executes at once. Each one execs a
+    # SaveAsScript workflow in this process and samples on the GPU, so more
+    # than one means several models in VRAM and races in ComfyUI's global
+    # model management, sys.path and module cache. Keep it at 1 unless the
+    # workflows are known to be safe to run side by side.
+    EXECUTION_WORKERS = 1
+
     def __init__(self):
         self.root = None
         self.notebook = None
-        self.queue = queue.Queue()
+        self.queue = NotifyingQueue()
+        self._queue_drain_scheduled = False
+        self._queue_drain_lock = threading.Lock()
+        # Message type -> handler taking the message; see handle_queue_message and call_soon
+        self._message_handlers = {
+            'scan_progress': self.update_scan_progress,
+            'scan_complete': self.handle_scan_complete,
+            'transform_progress': self.update_transform_progress,
+            'transform_complete': self.handle_transform_complete,
+            'comfyui_progress': self.update_comfyui_progress,
+            'comfyui_complete': self.handle_comfyui_complete,
+            'error': self.handle_error,
+            'log_message': self.handle_log_message,
+            'gallery_changed': lambda message: self.handle_gallery_changed(),
+            'image_decoded': self.handle_image_decoded,
+            'models_listed': self.populate_models,
+        }
 
         # Backend instances
         self.llm_transformer = None
+        self._transformer_caps = {}  # Optional transformer methods, see _set_transformer
         self.current_model_instance = None  # Track the loaded model instance
         self.current_model_state = ModelState.UNLOADED  # Track model lifecycle state
-        self.default_fallback_model = "qwen/qwen3-vl-30b@4bit"  # Default model for fallback
+        self.fallback_chain = ["qwen/qwen3-vl-30b@4bit"]  # Fallback models, tried in order
+        self.served_fallback_model = None  # Which fallback is currently serving, if any
         self.config_file = Path("model_preferences.json")  # Configuration file
+        self._lms_breaker = CircuitBreaker(  # Shared by all lms.llm() calls
+            fail_threshold=3, reset_timeout=30.0, on_open=lambda: self.call_soon(self.schedule_half_open_probe))
+        self._last_probe_ts = 0.0  # When refresh_model_connection last probed an open breaker
+        self._model_breakers = {}  # model name -> CircuitBreaker, see _model_breaker
+        self._model_health = defaultdict(lambda: deque(maxlen=20))  # model name -> (timestamp, ok) load outcomes
+        self._inflight_loads = {}  # model name -> Future of the lms.llm() load in progress
+        self._inflight_lock = threading.Lock()
+        self._queued_loads = set()  # Models the Load button has submitted and not yet installed (GUI thread)
+        if lms is not None:
+            threading.Thread(target=_prewarm_lmstudio, daemon=True).start()
         self.comfyui = None
         self.file_organizer = None
 
         # GUI state
         self.current_scan_results = []
+        self._result_pool = []  # Result dicts from finished scans, refilled by run_scan
         self.generated_prompts = []
         self.current_session_prompts = []  # Prompts from current scan session only
         self.selected_comfyui_script = "tshirtPOC_768x1024.py"
         self.available_scripts = []
+        self._available_scripts_set = set()  # O(1) membership for available_scripts
+        self._script_index = {}  # script name -> position in available_scripts
+        self._scripts_cache = None  # Last _find_comfyui_scripts result ...
+        self._scripts_cache_mtime = 0  # ... and the working directory's st_mtime_ns when it was taken
+        self._script_analysis_cache = {}  # (script, mtime_ns) -> (arg count, text args, mapping)
+        self._mapping_cache = {}  # script base name -> PromptMapping (or None if unsaved)
+        self._detection_status_after_id = None  # Pending debounced status update
+        self._pending_detection_status = None
+        self._last_progress = None  # (value, maximum) last written to scan_progress
+        self._scan_pulse_after_id = None  # Pending _pulse_scan_progress while a scan runs
+        self._last_operation_text = None  # Text last written to current_operation_label
+        self._pending_updates = {}  # schedule_ui key -> latest queued widget update
+        self._render_after_id = None  # Pending _flush_ui, if any
+        self._pending_state = None  # (status text, color) waiting for _flush_state
+        self._state_flush_queued = False  # An after_idle _flush_state is pending (GUI thread)
+        self._last_state_message = None  # Message of the last set_model_state call
+        self._state_lock = threading.Lock()  # Guards current_model_state/_last_state_message together
+        self._toasts = []  # Notification toasts currently on screen, oldest first
+        self._log_buffer = deque()  # Timestamped scan-results lines waiting for _flush_log
+        self._log_flush_after_id = None  # Pending _flush_log, if any
+        self._designs_index = None  # PNG names in DESIGNS_DIR (see _design_names)
+        self._designs_index_ts = 0.0  # time.monotonic() of the last designs scan
+        self._designs_index_stale = False  # Set by the folder watcher when the listing may be out of date
+
+        # Gallery image decoding runs on a single worker; newer selections supersede older ones
+        self._decode_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._pending_decode = None
+        self._lmstudio_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)  # LMStudio API calls
+        self._execution_stop = threading.Event()  # Set by STOP; queued prompts are skipped
+        self._execution_buttons_running = None  # Mode last applied by _set_execution_buttons
+        self._active_index = None  # Gallery row last selected, tracked without asking Tk
 
         # Threading
         self.scan_thread = None
@@ -310,6 +1371,9 @@ class SynthwaveGUI:
             self.root.configure(bg=SynthwaveColors.BACKGROUND)
             self.root.resizable(True, True)
 
+            # Shared fonts are created once per window and reused by every section
+            self.build_fonts()
+
             print("🎨 Configuring styles...")
             # Configure ttk styling for synthwave theme
             self.configure_styles()
@@ -323,15 +1387,16 @@ class SynthwaveGUI:
             self.create_main_interface()
 
             print("⚙️ Starting queue processing...")
-            # Start queue processing
+            # Drain the queue whenever a background thread posts a message
+            self.queue.on_put = self.schedule_queue_drain
             self.process_queue()
 
             # Set up cleanup on window close
             self.root.protocol("WM_DELETE_WINDOW", self.on_window_close)
 
-            # Attempt to restore model session from previous run
+            # Start warming the last used model as soon as the main loop is running
             if LLM_AVAILABLE:
-                self.root.after(1000, self.restore_model_session, self.model_config)
+                self.root.after_idle(self.restore_model_session, self.model_config)
 
             print("🚀 Starting main loop...")
             # Start the main loop
@@ -340,9 +1405,25 @@ class SynthwaveGUI:
 
         except Exception as e:
             print(f"❌ Error creating main window: {e}")
-            import traceback
             traceback.print_exc()
 
+    def build_fonts(self):
+        """Create the application's shared Font objects (requires self.root)"""
+        self.fonts = {
+            'header': font.Font(family="Courier New", size=14, weight="bold"),
+            'label': font.Font(family="Courier New", size=10),
+            'button': font.Font(family="Courier New", size=10, weight="bold"),
+            'mono9': font.Font(family="Courier New", size=9),
+            'mono8': font.Font(family="Courier New", size=8),
+            'title': font.Font(family="Courier New", size=18, weight="bold"),
+            'subheader': font.Font(family="Courier New", size=12, weight="bold"),
+            'button_md': font.Font(family="Courier New", size=11, weight="bold"),
+            'button_sm': font.Font(family="Courier New", size=9, weight="bold"),
+        }
+        # Same faces under the names the sections use them for
+        self.fonts['button_lg'] = self.fonts['subheader']
+        self.fonts['button_plain'] = self.fonts['label']
+
     def configure_styles(self):
         """Configure enhanced synthwave theme with glowing effects"""
         style = ttk.Style()
@@ -360,7 +1441,7 @@ class SynthwaveGUI:
             background=SynthwaveColors.SECONDARY,
             foreground=SynthwaveColors.TEXT_BRIGHT,
             padding=[25, 12],
-            font=('Courier New', 11, 'bold'),
+            font=self.fonts['button_md'],
             borderwidth=2,
             relief='raised'
         )
@@ -390,7 +1471,7 @@ class SynthwaveGUI:
             "Synthwave.TButton",
             background=SynthwaveColors.PRIMARY_ACCENT,
             foreground=SynthwaveColors.BACKGROUND,
-            font=('Courier New', 10, 'bold'),
+            font=self.fonts['button'],
             padding=[20, 10],
             borderwidth=3,
             relief='raised'
@@ -416,7 +1497,7 @@ class SynthwaveGUI:
             "SynthwaveGlow.TButton",
             background=SynthwaveColors.NEON_CYAN,
             foreground=SynthwaveColors.BACKGROUND,
-            font=('Courier New', 11, 'bold'),
+            font=self.fonts['button_md'],
             padding=[25, 12],
             borderwidth=4,
             relief='raised'
@@ -437,18 +1518,6 @@ class SynthwaveGUI:
         """Initialize backend modules"""
         print("🔧 Initializing backend modules...")
 
-        # Initialize file organizer
-        if FILE_ORG_AVAILABLE:
-            try:
-                self.file_organizer = POCFileOrganizer()
-                print("✅ File organizer initialized")
-            except Exception as e:
-                print(f"❌ File organizer failed: {e}")
-                self.file_organizer = None
-        else:
-            print("❌ File organizer not available")
-            self.file_organizer = None
-
         # Initialize LLM transformer - will be created when model is loaded
         if LLM_AVAILABLE:
             print("✅ LLM functionality available - transformer will be created when model is loaded")
@@ -465,8 +1534,40 @@ class SynthwaveGUI:
         self.comfyui = None  # Not needed - we execute scripts directly
         print("✅ ComfyUI script execution ready (SaveAsScript approach)")
 
-        # Scan for available ComfyUI scripts
-        self.scan_comfyui_scripts()
+        # File organizer setup and the script scan hit the disk; run them while the window is built
+        threading.Thread(target=self._init_backend_async, daemon=True).start()
+
+    def _init_backend_async(self):
+        """Create the file organizer and scan for ComfyUI scripts (worker thread)"""
+        # Initialize file organizer
+        file_organizer = None
+        if FILE_ORG_AVAILABLE:
+            try:
+                file_organizer = POCFileOrganizer()
+                print("✅ File organizer initialized")
+            except Exception as e:
+                print(f"❌ File organizer failed: {e}")
+        else:
+            print("❌ File organizer not available")
+
+        # Scan for available ComfyUI scripts (stat first so a change during the scan isn't missed)
+        try:
+            mtime = os.stat('.').st_mtime_ns
+            scripts = _find_comfyui_scripts()
+        except OSError as e:
+            print(f"❌ Script scan failed: {e}")
+            mtime, scripts = None, ["tshirtPOC_768x1024.py"]
+
+        self.call_soon(self._backend_ready, file_organizer, scripts, mtime)
+
+    def _backend_ready(self, file_organizer, scripts, scripts_mtime):
+        """Install the results of _init_backend_async (GUI thread)"""
+        self.file_organizer = file_organizer
+        if scripts_mtime is not None:
+            self._scripts_cache, self._scripts_cache_mtime = scripts, scripts_mtime
+        self._set_available_scripts(list(scripts))
+        if hasattr(self, 'scripts_listbox'):
+            self.populate_scripts_list()
 
         # Log summary
         available_count = sum([
@@ -480,117 +1581,39 @@ class SynthwaveGUI:
             print("⚠️ Running in demo mode - no backend functionality available")
 
     def scan_comfyui_scripts(self):
-        """Scan for available ComfyUI scripts in the current directory"""
-        # Look for all Python files, then filter out GUI files
-        all_py_files = glob.glob("*.py")
-
-        # Files to exclude (GUI files and backend modules)
-        exclude_files = {
-            "synthwave_gui.py",
-            "synthwave_gui_fixed.py",
-            "synthwave_gui_simple.py",
-            "demo_gui.py",
-            "reddit_collector.py",
-            "llm_transformer.py",
-            "comfyui_simple.py",
-            "file_organizer.py",
-            "tshirt_executor.py"
-        }
-
-        # Filter to likely ComfyUI workflow scripts
-        workflow_scripts = []
-        for script in all_py_files:
-            if script not in exclude_files:
-                # Include files that likely contain ComfyUI workflows
-                # Check for common ComfyUI patterns in filename or prioritize POC files
-                if any(keyword in script.lower() for keyword in ['workflow', 'comfy', 'poc', 'tshirt', 'flux']):
-                    workflow_scripts.append(script)
-                else:
-                    # For other .py files, do a quick content check
-                    try:
-                        with open(script, 'r', encoding='utf-8') as f:
-                            content = f.read(200)  # Read first 200 chars
-                            if any(keyword in content.lower() for keyword in ['comfyui', 'workflow', 'queue_prompt']):
-                                workflow_scripts.append(script)
-                    except:
-                        # If we can't read the file, skip it
-                        pass
-
-        self.available_scripts = workflow_scripts
-
-        # Ensure default script is included
-        if "tshirtPOC_768x1024.py" not in self.available_scripts:
-            self.available_scripts.insert(0, "tshirtPOC_768x1024.py")
+        """Scan for available ComfyUI scripts in the current directory
 
+        Skipped while the directory's mtime is unchanged: adding, removing or
+        renaming a file bumps it, so the cached list is still accurate.
+        """
+        mtime = os.stat('.').st_mtime_ns
+        if self._scripts_cache is None or mtime != self._scripts_cache_mtime:
+            self._scripts_cache, self._scripts_cache_mtime = _find_comfyui_scripts(), mtime
+        self._set_available_scripts(list(self._scripts_cache))
+
+    def _set_available_scripts(self, scripts):
+        """Install a fresh script list from _find_comfyui_scripts"""
+        self.available_scripts = scripts
+        self._reindex_scripts()
         print(f"📜 Found {len(self.available_scripts)} ComfyUI scripts: {self.available_scripts}")
 
+    def _reindex_scripts(self):
+        """Rebuild the membership set and name->index map after available_scripts changes"""
+        self._available_scripts_set = set(self.available_scripts)
+        self._script_index = {name: i for i, name in enumerate(self.available_scripts)}
+
     def validate_comfyui_script(self, script_path):
         """Validate that script is compatible with module import"""
         try:
-            if not Path(script_path).exists():
-                return False, "Script file does not exist"
-
-            with open(script_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Check for required components
-            has_main_function = 'def main(' in content
-            has_saveimage = 'SaveImage' in content or 'saveimage' in content.lower()
-            has_return_dict = 'return dict(' in content
-
-            # Check for ComfyUI patterns
-            has_comfyui_patterns = any(pattern in content.lower() for pattern in [
-                'comfyui', 'workflow', 'queue_prompt', 'get_value_at_index'
-            ])
-
-            # Check for common SaveAsScript bugs: missing variable initializations
-            has_manager_usage = 'if has_manager:' in content
-            has_manager_init = 'has_manager = False' in content or 'has_manager = True' in content
-
-            custom_nodes_usage = '_custom_nodes_imported' in content
-            custom_nodes_init = '_custom_nodes_imported = False' in content or '_custom_nodes_imported = True' in content
-
-            custom_path_usage = '_custom_path_added' in content
-            custom_path_init = '_custom_path_added = False' in content or '_custom_path_added = True' in content
-
-            issues = []
-            warnings = []
-
-            if not has_main_function:
-                issues.append("Missing 'def main(' function")
-            if not has_saveimage:
-                issues.append("No SaveImage node detected")
-            if not has_return_dict:
-                issues.append("Missing 'return dict(' statement")
-            if not has_comfyui_patterns:
-                issues.append("No ComfyUI patterns detected")
-
-            # Check for SaveAsScript bugs (warnings, not errors - we can fix these)
-            auto_fixable = []
-            if has_manager_usage and not has_manager_init:
-                auto_fixable.append("has_manager")
-            if custom_nodes_usage and not custom_nodes_init:
-                auto_fixable.append("_custom_nodes_imported")
-            if custom_path_usage and not custom_path_init:
-                auto_fixable.append("_custom_path_added")
-
-            if auto_fixable:
-                warnings.append(f"Missing variable initializations: {', '.join(auto_fixable)} (will be auto-fixed)")
-
-            if issues:
-                return False, "; ".join(issues)
-            else:
-                message = "Script appears compatible"
-                if warnings:
-                    message += f" (warnings: {'; '.join(warnings)})"
-                return True, message
-
+            st = os.stat(script_path)
+            return _validate_script_cached(os.fspath(script_path), st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            return False, "Script file does not exist"
         except Exception as e:
             return False, f"Error reading script: {str(e)}"
 
     def clear_module_cache(self, module_name):
         """Clear cached module to force reload"""
-        import sys
         if module_name in sys.modules:
             del sys.modules[module_name]
             print(f"🔄 Cleared cached module: {module_name}")
@@ -606,7 +1629,7 @@ class SynthwaveGUI:
         header_frame.pack(fill='x', pady=(0, 10))
         header_frame.pack_propagate(False)
 
-        title_font = font.Font(family="Courier New", size=18, weight="bold")
+        title_font = self.fonts['title']
         title_label = tk.Label(
             header_frame,
             text="REDDIT → COMFYUI PIPELINE",
@@ -661,7 +1684,7 @@ class SynthwaveGUI:
     def create_subreddit_selection(self, parent):
         """Create subreddit selection section"""
         # Section header
-        header_font = font.Font(family="Courier New", size=14, weight="bold")
+        header_font = self.fonts['header']
         section_label = tk.Label(
             parent,
             text="┌─ SUBREDDIT SELECTION ─┐",
@@ -679,31 +1702,30 @@ class SynthwaveGUI:
         self.subreddit_var = tk.StringVar(value="memes")
         self.custom_subreddit_var = tk.StringVar()
 
-        # Content frame
-        content_frame = tk.Frame(subreddit_frame, bg=SynthwaveColors.SECONDARY)
+        # Content frame; its radio buttons take their styling from the option database
+        content_frame = tk.Frame(subreddit_frame, bg=SynthwaveColors.SECONDARY, name='subredditChoices')
         content_frame.pack(fill='x', padx=15, pady=15)
+        self.root.option_add('*subredditChoices*Radiobutton.font', self.fonts['button_plain'])
+        self.root.option_add('*subredditChoices*Radiobutton.foreground', SynthwaveColors.TEXT)
+        self.root.option_add('*subredditChoices*Radiobutton.background', SynthwaveColors.SECONDARY)
+        self.root.option_add('*subredditChoices*Radiobutton.activeBackground', SynthwaveColors.PRIMARY_ACCENT)
+        self.root.option_add('*subredditChoices*Radiobutton.activeForeground', SynthwaveColors.BACKGROUND)
+        self.root.option_add('*subredditChoices*Radiobutton.selectColor', SynthwaveColors.PRIMARY_ACCENT)
 
         # Predefined subreddits in a vertical list (more compact for side-by-side)
         predefined_subreddits = ["memes", "dankmemes", "wholesomememes", "ProgrammerHumor", "gaming", "funny"]
 
-        button_font = font.Font(family="Courier New", size=10)
         for subreddit in predefined_subreddits:
             radio_btn = tk.Radiobutton(
                 content_frame,
                 text=f"r/{subreddit}",
                 variable=self.subreddit_var,
-                value=subreddit,
-                font=button_font,
-                fg=SynthwaveColors.TEXT,
-                bg=SynthwaveColors.SECONDARY,
-                activebackground=SynthwaveColors.PRIMARY_ACCENT,
-                activeforeground=SynthwaveColors.BACKGROUND,
-                selectcolor=SynthwaveColors.PRIMARY_ACCENT,
-                command=self.on_subreddit_change
+                value=subreddit
             )
             radio_btn.pack(anchor='w', pady=2)
 
         # Custom subreddit section
+        button_font = self.fonts['button_plain']
         custom_frame = tk.Frame(content_frame, bg=SynthwaveColors.SECONDARY)
         custom_frame.pack(fill='x', pady=(10, 0))
 
@@ -712,13 +1734,8 @@ class SynthwaveGUI:
             text="Custom:",
             variable=self.subreddit_var,
             value="custom",
-            font=button_font,
-            fg=SynthwaveColors.TEXT,
-            bg=SynthwaveColors.SECONDARY,
             activebackground=SynthwaveColors.SECONDARY_ACCENT,
-            activeforeground=SynthwaveColors.BACKGROUND,
-            selectcolor=SynthwaveColors.SECONDARY_ACCENT,
-            command=self.on_subreddit_change
+            selectcolor=SynthwaveColors.SECONDARY_ACCENT
         )
         custom_radio.pack(side='left', anchor='w')
 
@@ -734,11 +1751,14 @@ class SynthwaveGUI:
         )
         self.custom_entry.pack(side='left', padx=(10, 0))
 
+        # One variable trace instead of a command per radio; also fires on programmatic set()
+        self.subreddit_var.trace_add('write', lambda *_: self.on_subreddit_change())
+
         # Help text
         help_label = tk.Label(
             content_frame,
             text="(Enter subreddit name without 'r/' prefix)",
-            font=('Courier New', 8),
+            font=self.fonts['mono8'],
             fg=SynthwaveColors.SECONDARY_ACCENT,
             bg=SynthwaveColors.SECONDARY
         )
@@ -746,7 +1766,7 @@ class SynthwaveGUI:
 
     def create_trend_parameters(self, parent):
         """Create trend scan parameters section"""
-        header_font = font.Font(family="Courier New", size=14, weight="bold")
+        header_font = self.fonts['header']
         section_label = tk.Label(
             parent,
             text="┌─ TREND SCAN PARAMETERS ─┐",
@@ -762,7 +1782,7 @@ class SynthwaveGUI:
         content_frame = tk.Frame(params_frame, bg=SynthwaveColors.SECONDARY)
         content_frame.pack(fill='x', padx=15, pady=15)
 
-        label_font = font.Font(family="Courier New", size=10)
+        label_font = self.fonts['label']
 
         # Min Score parameter
         score_frame = tk.Frame(content_frame, bg=SynthwaveColors.SECONDARY)
@@ -785,7 +1805,7 @@ class SynthwaveGUI:
             to=5000,
             orient='horizontal',
             variable=self.min_score_var,
-            font=('Courier New', 9),
+            font=self.fonts['mono9'],
             fg=SynthwaveColors.TEXT,
             bg=SynthwaveColors.SECONDARY,
             activebackground=SynthwaveColors.TERTIARY_ACCENT,
@@ -816,7 +1836,7 @@ class SynthwaveGUI:
             to=50,
             orient='horizontal',
             variable=self.max_posts_var,
-            font=('Courier New', 9),
+            font=self.fonts['mono9'],
             fg=SynthwaveColors.TEXT,
             bg=SynthwaveColors.SECONDARY,
             activebackground=SynthwaveColors.SECONDARY_ACCENT,
@@ -841,8 +1861,14 @@ class SynthwaveGUI:
         ).pack(anchor='w')
 
         # Time filter options
-        time_options_frame = tk.Frame(time_frame, bg=SynthwaveColors.SECONDARY)
+        time_options_frame = tk.Frame(time_frame, bg=SynthwaveColors.SECONDARY, name='timeFilterChoices')
         time_options_frame.pack(fill='x', pady=(5, 0))
+        self.root.option_add('*timeFilterChoices.Radiobutton.font', self.fonts['mono9'])
+        self.root.option_add('*timeFilterChoices.Radiobutton.foreground', SynthwaveColors.TEXT)
+        self.root.option_add('*timeFilterChoices.Radiobutton.background', SynthwaveColors.SECONDARY)
+        self.root.option_add('*timeFilterChoices.Radiobutton.selectColor', SynthwaveColors.TERTIARY_ACCENT)
+        self.root.option_add('*timeFilterChoices.Radiobutton.indicatorOn', 0)
+        self.root.option_add('*timeFilterChoices.Radiobutton.width', 6)
 
         self.time_filter_var = tk.StringVar(value="day")
         time_options = [("Hour", "hour"), ("Day", "day"), ("Week", "week"), ("Month", "month")]
@@ -852,13 +1878,7 @@ class SynthwaveGUI:
                 time_options_frame,
                 text=label,
                 variable=self.time_filter_var,
-                value=value,
-                font=('Courier New', 9),
-                fg=SynthwaveColors.TEXT,
-                bg=SynthwaveColors.SECONDARY,
-                selectcolor=SynthwaveColors.TERTIARY_ACCENT,
-                indicatoron=0,
-                width=6
+                value=value
             )
             radio_btn.pack(side='left', padx=1)
 
@@ -868,8 +1888,8 @@ class SynthwaveGUI:
         controls_frame = tk.Frame(parent, bg=SynthwaveColors.BACKGROUND)
         controls_frame.pack(fill='x', pady=10)
 
-        button_font = font.Font(family="Courier New", size=12, weight="bold")
-        label_font = font.Font(family="Courier New", size=10)
+        button_font = self.fonts['button_lg']
+        label_font = self.fonts['label']
 
         # Left section: Buttons
         buttons_frame = tk.Frame(controls_frame, bg=SynthwaveColors.BACKGROUND)
@@ -985,7 +2005,7 @@ class SynthwaveGUI:
 
     def create_scan_results_display(self, parent):
         """Create scan results display area"""
-        header_font = font.Font(family="Courier New", size=14, weight="bold")
+        header_font = self.fonts['header']
         section_label = tk.Label(
             parent,
             text="┌─ SCAN RESULTS ─┐",
@@ -1005,15 +2025,18 @@ class SynthwaveGUI:
 
         self.scan_results_textbox = tk.Text(
             textbox_frame,
-            font=font.Font(family="Courier New", size=9),
+            font=self.fonts['mono9'],
             bg=SynthwaveColors.BACKGROUND,
             fg=SynthwaveColors.TEXT,
             selectbackground=SynthwaveColors.PRIMARY_ACCENT,
             selectforeground=SynthwaveColors.BACKGROUND,
             height=12,
-            wrap=tk.WORD,
-            state=tk.DISABLED  # Read-only by default
+            wrap=tk.WORD
         )
+        # Read-only for the user through bindings, so code can insert without toggling state
+        self.scan_results_textbox.bind('<Key>', _readonly_text_key)
+        for sequence in ('<<Paste>>', '<<PasteSelection>>', '<<Cut>>', '<<Clear>>'):
+            self.scan_results_textbox.bind(sequence, lambda e: 'break')
 
         scrollbar_results = ttk.Scrollbar(textbox_frame, orient="vertical", command=self.scan_results_textbox.yview)
         self.scan_results_textbox.configure(yscrollcommand=scrollbar_results.set)
@@ -1022,34 +2045,51 @@ class SynthwaveGUI:
         scrollbar_results.pack(side="right", fill="y")
 
     def write_to_scan_results(self, text, color=None):
-        """Helper method to write text to scan results textbox"""
-        try:
-            self.scan_results_textbox.config(state=tk.NORMAL)
+        """Helper method to write text to scan results textbox
 
-            # Add timestamp
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            full_text = f"[{timestamp}] {text}\n"
+        Lines are buffered and written by _flush_log at most every 50ms, so a
+        burst of messages costs one insert and one redraw instead of one each.
+        """
+        # Add timestamp now so it reflects when the line was logged, not flushed
+        timestamp = _log_time(int(time.time()))
+        self._log_buffer.append(f"[{timestamp}] {text}\n")
+        if threading.current_thread() is threading.main_thread():
+            self._schedule_log_flush()
+        else:
+            # Execution workers log here too; only the Tk thread may arm after()
+            self.call_soon(self._schedule_log_flush)
+
+    def _schedule_log_flush(self):
+        """Arm _flush_log unless one is already pending (GUI thread)"""
+        if self._log_flush_after_id is None:
+            self._log_flush_after_id = self.root.after(50, self._flush_log)
+
+    def _flush_log(self):
+        """Write all buffered scan-results lines in one insert"""
+        self._log_flush_after_id = None
+        if not self._log_buffer:
+            return
+        # popleft() a counted number of lines so ones appended meanwhile by a worker stay queued
+        buffer = self._log_buffer
+        batch = ''.join([buffer.popleft() for _ in range(len(buffer))])
+        try:
+            self.scan_results_textbox.insert(tk.END, batch)
 
-            self.scan_results_textbox.insert(tk.END, full_text)
+            # Keep only the newest lines; Text redraws slow down as it grows
+            line_count = int(self.scan_results_textbox.index('end-1c').split('.')[0])
+            if line_count > _SCAN_LOG_MAX_LINES:
+                self.scan_results_textbox.delete('1.0', f'end-{_SCAN_LOG_MAX_LINES}l')
 
             # Auto-scroll to bottom
             self.scan_results_textbox.see(tk.END)
-
-            # Make read-only again
-            self.scan_results_textbox.config(state=tk.DISABLED)
-
-            # Update the display
-            self.scan_results_textbox.update_idletasks()
         except Exception as e:
             print(f"Error writing to scan results: {e}")
 
     def clear_scan_results(self):
         """Helper method to clear scan results textbox"""
+        self._log_buffer.clear()
         try:
-            self.scan_results_textbox.config(state=tk.NORMAL)
             self.scan_results_textbox.delete(1.0, tk.END)
-            self.scan_results_textbox.config(state=tk.DISABLED)
         except Exception as e:
             print(f"Error clearing scan results: {e}")
 
@@ -1061,6 +2101,16 @@ class SynthwaveGUI:
         else:
             self.custom_entry.config(state='disabled')
 
+    def _recycle_scan_results(self):
+        """Clear current_scan_results, keeping its dicts for the next scan to refill"""
+        results, self.current_scan_results = self.current_scan_results, []
+        transform_thread = getattr(self, 'transform_thread', None)
+        if transform_thread is not None and transform_thread.is_alive():
+            return  # run_transform_all is still reading them
+        room = _RESULT_POOL_MAX - len(self._result_pool)
+        if room > 0:
+            self._result_pool.extend(results[:room])
+
     def start_scan(self):
         """Start the Reddit scan process"""
         # Get selected subreddit
@@ -1079,13 +2129,16 @@ class SynthwaveGUI:
 
         # Disable scan button and show progress
         self.start_scan_btn.config(state='disabled', text="SCANNING...")
-        self.scan_progress.config(mode='indeterminate')
-        self.scan_progress.start()
+        self.cancel_ui('progress')
+        self.scan_progress.config(value=0, maximum=100)
+        self._last_progress = None  # The pulse moves the value behind _set_progress
+        self._stop_scan_pulse()
+        self._scan_pulse_after_id = self.root.after(100, self._pulse_scan_progress)
 
         # Clear previous results
         self.clear_scan_results()
         self.write_to_scan_results(f"🔍 Starting scan of r/{subreddit} ({time_filter})...")
-        self.current_scan_results = []
+        self._recycle_scan_results()
         self.current_session_prompts = []  # Clear prompts from previous scan
 
         print(f"🎯 Scanning r/{subreddit} for {max_posts} posts (min score: {min_score}, time: {time_filter})")
@@ -1098,13 +2151,20 @@ class SynthwaveGUI:
         )
         self.scan_thread.start()
 
-    def on_subreddit_change(self):
-        """Handle subreddit selection change"""
-        if self.subreddit_var.get() == "custom":
-            self.custom_entry.config(state='normal')
-            self.custom_entry.focus()
-        else:
-            self.custom_entry.config(state='disabled')
+    def _pulse_scan_progress(self):
+        """Step the (determinate) scan bar every 100ms until the scan thread finishes"""
+        scan_thread = getattr(self, 'scan_thread', None)
+        if scan_thread is None or not scan_thread.is_alive():
+            self._scan_pulse_after_id = None
+            return
+        self.scan_progress.step(5)  # Wraps back to 0 at maximum
+        self._scan_pulse_after_id = self.root.after(100, self._pulse_scan_progress)
+
+    def _stop_scan_pulse(self):
+        """Cancel a pending _pulse_scan_progress, if any"""
+        if self._scan_pulse_after_id is not None:
+            self.root.after_cancel(self._scan_pulse_after_id)
+            self._scan_pulse_after_id = None
 
     def run_scan(self, subreddit, min_score, max_posts, time_filter):
         """Run the scan in background thread"""
@@ -1124,34 +2184,30 @@ class SynthwaveGUI:
                     results = [post for post in results if post.get('score', 0) >= min_score]
             else:
                 # Generate mock data for demo with time filter indication
-                import random
-                import time
+                # Adjust scores based on time filter for demo
+                base_range = _DEMO_SCORE_RANGES.get(time_filter, _DEMO_SCORE_RANGES['month'])
+
+                # Ensure score is at least min_score
+                score_min = max(min_score, base_range[0])
+                score_max = max(score_min + 100, base_range[1])  # Ensure range is valid
+
+                scores = [random.randint(score_min, score_max) for _ in range(max_posts)]
+                pool = self._result_pool
                 results = []
-                for i in range(max_posts):
-                    # Adjust scores based on time filter for demo
-                    if time_filter == "hour":
-                        base_range = (500, 2000)
-                    elif time_filter == "day":
-                        base_range = (1000, 5000)
-                    elif time_filter == "week":
-                        base_range = (2000, 10000)
-                    else:  # month
-                        base_range = (5000, 20000)
-
-                    # Ensure score is at least min_score
-                    score_min = max(min_score, base_range[0])
-                    score_max = max(score_min + 100, base_range[1])  # Ensure range is valid
-
-                    results.append({
+                for i, score in enumerate(scores):
+                    # Refill a dict from the previous scan when one is available
+                    post = pool.pop() if pool else {}
+                    post.clear()
+                    post.update({
                         'id': f'demo_{time_filter}_{i}',
                         'title': f'Demo Post {i+1}: {subreddit} trending ({time_filter}, min score: {min_score})',
-                        'score': random.randint(score_min, score_max),
+                        'score': score,
                         'url': 'https://demo.url',
                         'created': '2024-01-01T00:00:00',
                         'text_content': f'Demo text {i+1} from {time_filter}',
                         'images': []
                     })
-                    time.sleep(0.5)  # Simulate processing
+                    results.append(post)
 
             self.queue.put({
                 'type': 'scan_complete',
@@ -1167,10 +2223,14 @@ class SynthwaveGUI:
 
     # =========================================================================
     # RESULTS TAB METHODS - NO LONGER USED (functionality moved to Scan Setup tab)
+    # Gated by _enable_legacy_results_tab: create_execution_controls would
+    # otherwise replace the Scan Setup tab's start/stop execution buttons.
     # =========================================================================
 
     def create_results_tab_DEPRECATED(self):
         """Create the results display tab"""
+        if not self._enable_legacy_results_tab:
+            return
         results_frame = ttk.Frame(self.notebook, style="Synthwave.TFrame")
         self.notebook.add(results_frame, text="RESULTS")
 
@@ -1189,7 +2249,9 @@ class SynthwaveGUI:
 
     def create_prompts_section(self, parent):
         """Create the generated prompts section"""
-        header_font = font.Font(family="Courier New", size=14, weight="bold")
+        if not self._enable_legacy_results_tab:
+            return
+        header_font = self.fonts['header']
         section_label = tk.Label(
             parent,
             text="┌─ GENERATED PROMPTS ─┐",
@@ -1207,7 +2269,7 @@ class SynthwaveGUI:
         toolbar = tk.Frame(prompts_container, bg=SynthwaveColors.SECONDARY)
         toolbar.pack(fill='x', padx=10, pady=(10, 0))
 
-        button_font = font.Font(family="Courier New", size=9, weight="bold")
+        button_font = self.fonts['button_sm']
 
         # Refresh prompts button
         refresh_btn = tk.Button(
@@ -1258,13 +2320,13 @@ class SynthwaveGUI:
             background=SynthwaveColors.BACKGROUND,
             foreground=SynthwaveColors.TEXT,
             fieldbackground=SynthwaveColors.BACKGROUND,
-            font=('Courier New', 9)
+            font=self.fonts['mono9']
         )
         style.configure(
             "Synthwave.Treeview.Heading",
             background=SynthwaveColors.PRIMARY_ACCENT,
             foreground=SynthwaveColors.BACKGROUND,
-            font=('Courier New', 10, 'bold')
+            font=self.fonts['button']
         )
 
         columns = ('status', 'source', 'title', 'score', 'generated')
@@ -1300,7 +2362,9 @@ class SynthwaveGUI:
 
     def create_execution_controls(self, parent):
         """Create ComfyUI execution controls"""
-        header_font = font.Font(family="Courier New", size=14, weight="bold")
+        if not self._enable_legacy_results_tab:
+            return
+        header_font = self.fonts['header']
         section_label = tk.Label(
             parent,
             text="┌─ COMFYUI EXECUTION ─┐",
@@ -1316,8 +2380,8 @@ class SynthwaveGUI:
         controls_frame = tk.Frame(controls_container, bg=SynthwaveColors.SECONDARY)
         controls_frame.pack(fill='x', padx=15, pady=15)
 
-        button_font = font.Font(family="Courier New", size=11, weight="bold")
-        label_font = font.Font(family="Courier New", size=10)
+        button_font = self.fonts['button_md']
+        label_font = self.fonts['label']
 
         # Auto-execute checkbox
         self.auto_execute_var = tk.BooleanVar(value=False)
@@ -1381,7 +2445,9 @@ class SynthwaveGUI:
 
     def create_progress_section(self, parent):
         """Create progress monitoring section"""
-        header_font = font.Font(family="Courier New", size=14, weight="bold")
+        if not self._enable_legacy_results_tab:
+            return
+        header_font = self.fonts['header']
         section_label = tk.Label(
             parent,
             text="┌─ PROGRESS MONITOR ─┐",
@@ -1397,7 +2463,7 @@ class SynthwaveGUI:
         progress_frame = tk.Frame(progress_container, bg=SynthwaveColors.SECONDARY)
         progress_frame.pack(fill='x', padx=15, pady=15)
 
-        label_font = font.Font(family="Courier New", size=10)
+        label_font = self.fonts['label']
 
         # Current operation label
         self.current_operation_label = tk.Label(
@@ -1442,8 +2508,9 @@ class SynthwaveGUI:
     def refresh_prompts(self):
         """Refresh the prompts list from current scan session"""
         try:
-            # Use prompts from current scan session only (Results tab removed - using text logging)
-            self.generated_prompts = self.current_session_prompts.copy()
+            # Use prompts from current scan session only (Results tab removed - using text logging).
+            # Both names share one list; start_comfyui_execution snapshots it for its worker.
+            self.generated_prompts = self.current_session_prompts
 
             print(f"📋 Refreshing prompts display: {len(self.generated_prompts)} prompts")
             self.write_to_scan_results(f"📋 Refreshed prompts: {len(self.generated_prompts)} prompts available")
@@ -1467,6 +2534,7 @@ class SynthwaveGUI:
 
             # Update count and enable execution if prompts exist
             count = len(self.current_session_prompts)
+            self._execution_buttons_running = None  # Start button set directly below
 
             if count > 0:
                 # Enable ComfyUI execution button when we have prompts
@@ -1485,11 +2553,27 @@ class SynthwaveGUI:
 
     def check_design_exists(self, reddit_id):
         """Check if a design exists for the given reddit ID"""
-        designs_dir = Path("poc_output/generated_designs")
-        if designs_dir.exists():
-            pattern = f"*{reddit_id}*.png"
-            return len(list(designs_dir.glob(pattern))) > 0
-        return False
+        return any(reddit_id in name for name in self._design_names())
+
+    def _design_names(self):
+        """PNG file names in the designs folder
+
+        While the gallery watcher runs the listing is kept until a folder event
+        marks it stale; without one it is rescanned at most every 2 seconds.
+        """
+        now = time.monotonic()
+        watched = getattr(self, '_gallery_observer', None) is not None
+        if (self._designs_index is None or self._designs_index_stale
+                or (not watched and now - self._designs_index_ts > 2.0)):
+            # Cleared before scanning so an event during the scan triggers another
+            self._designs_index_stale = False
+            try:
+                with os.scandir(self.DESIGNS_DIR) as it:
+                    self._designs_index = [e.name for e in it if e.name.endswith('.png')]
+            except OSError:
+                self._designs_index = []
+            self._designs_index_ts = now
+        return self._designs_index
 
     def clear_prompts(self):
         """Clear all prompts (Results tab removed - using text logging)"""
@@ -1497,6 +2581,7 @@ class SynthwaveGUI:
             self.generated_prompts = []
             self.current_session_prompts = []  # Also clear current session prompts
             self.start_execution_btn.config(state='disabled')
+            self._execution_buttons_running = None
             self.write_to_scan_results("🗑️ All prompts cleared")
 
     def start_comfyui_execution(self):
@@ -1506,59 +2591,85 @@ class SynthwaveGUI:
             return
 
         # Update UI state
-        self.start_execution_btn.config(state='disabled', text="EXECUTING...")
-        self.stop_execution_btn.config(state='normal')
+        self._set_execution_buttons(running=True)
         # Use scan_progress bar for execution progress (operation_progress removed with Results tab)
-        self.scan_progress.config(mode='determinate', value=0, maximum=len(self.generated_prompts))
+        self.cancel_ui('progress')
+        self.scan_progress.config(value=0, maximum=len(self.generated_prompts))
+        self._last_progress = (0, len(self.generated_prompts))
+        self._execution_stop.clear()
 
         # Start execution in background thread
         self.comfyui_thread = threading.Thread(
             target=self.run_comfyui_execution,
+            args=(list(self.generated_prompts),),
             daemon=True
         )
         self.comfyui_thread.start()
 
+    def _set_execution_buttons(self, running):
+        """Switch the start/stop execution buttons together, skipping a repeat of the current mode"""
+        if running == self._execution_buttons_running:
+            return
+        self._execution_buttons_running = running
+        if running:
+            self.start_execution_btn.config(state='disabled', text="EXECUTING...")
+            self.stop_execution_btn.config(state='normal')
+        else:
+            self.start_execution_btn.config(state='normal', text="▶ START COMFYUI")
+            self.stop_execution_btn.config(state='disabled')
+
     def stop_comfyui_execution(self):
         """Stop ComfyUI execution"""
-        # Implementation for stopping execution
-        self.start_execution_btn.config(state='normal', text="▶ START COMFYUI")
-        self.stop_execution_btn.config(state='disabled')
-        if hasattr(self, 'current_operation_label'):
-            self.current_operation_label.config(text="Status: Stopped")
-
-    def run_comfyui_execution(self):
-        """Run ComfyUI execution in background thread"""
-        try:
-            total_prompts = len(self.generated_prompts)
-            script_name = self.selected_comfyui_script.replace('.py', '')
-
-            for i, prompt_data in enumerate(self.generated_prompts):
-                # Update progress
-                self.queue.put({
-                    'type': 'comfyui_progress',
-                    'current': i + 1,
-                    'total': total_prompts,
-                    'prompt_title': prompt_data['title']
-                })
+        # Prompts already running finish; the rest are skipped
+        self._execution_stop.set()
+        self._set_execution_buttons(running=False)
+        self._set_progress(text="Status: Stopped")
 
-                try:
-                    # Execute ComfyUI script with correct arguments
-                    success = self.execute_comfyui_script(prompt_data, script_name)
+    def run_comfyui_execution(self, prompts):
+        """Run ComfyUI execution in background thread
 
-                    if not success:
+        Args:
+            prompts: Snapshot of generated_prompts taken when execution started
+        """
+        try:
+            total_prompts = len(prompts)
+            script_name = _strip_py(self.selected_comfyui_script)
+            processed = 0
+
+            # One prompt at a time by default; see EXECUTION_WORKERS
+            workers = max(1, min(self.EXECUTION_WORKERS, total_prompts))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    pool.submit(self._execute_unless_stopped, prompt_data, script_name): (i, prompt_data)
+                    for i, prompt_data in enumerate(prompts)
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    i, prompt_data = futures[future]
+                    try:
+                        # Execute ComfyUI script with correct arguments
+                        success = future.result()
+                    except Exception as e:
+                        success = False
                         self.queue.put({
                             'type': 'error',
-                            'error': f"Failed to execute prompt {i+1}: {prompt_data['title'][:50]}..."
+                            'error': f"Error executing prompt {i+1}: {str(e)}"
                         })
-                except Exception as e:
-                    self.queue.put({
-                        'type': 'error',
-                        'error': f"Error executing prompt {i+1}: {str(e)}"
-                    })
+                    else:
+                        if success is None:
+                            continue  # Skipped after STOP
+                        if not success:
+                            self.queue.put({
+                                'type': 'error',
+                                'error': f"Failed to execute prompt {i+1}: {prompt_data['title'][:50]}..."
+                            })
+                    processed += 1
+
+                    # Update progress
+                    self.call_soon(self._on_comfyui_progress, processed, total_prompts, prompt_data['title'])
 
             self.queue.put({
                 'type': 'comfyui_complete',
-                'total_processed': total_prompts
+                'total_processed': processed
             })
 
         except Exception as e:
@@ -1567,14 +2678,14 @@ class SynthwaveGUI:
                 'error': f"ComfyUI execution failed: {str(e)}"
             })
 
+    def _execute_unless_stopped(self, prompt_data, script_name):
+        """execute_comfyui_script, or None if STOP was pressed before this prompt started"""
+        if self._execution_stop.is_set():
+            return None
+        return self.execute_comfyui_script(prompt_data, script_name)
+
     def execute_comfyui_script(self, prompt_data, script_name):
         """Execute ComfyUI script as imported module (ENHANCED WITH ALL IMPROVEMENTS)"""
-        import random
-        import importlib.util
-        import sys
-        import importlib
-        from pathlib import Path
-
         try:
             # Step 1: Validate script compatibility before execution
             script_path = Path(self.selected_comfyui_script)
@@ -1591,16 +2702,19 @@ class SynthwaveGUI:
 
             print(f"✅ Script validation passed: {validation_message}")
 
-            # Step 2: Read and extract prompt content
+            # Step 2: Extract the prompt text straight from a mapping of the file
             prompt_file = prompt_data['file']
-            with open(prompt_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Extract the prompt text
-            import re
-            prompt_match = re.search(r'## ComfyUI Prompt\s*```([^`]+)```', content, re.DOTALL)
-            if prompt_match:
-                prompt_text = prompt_match.group(1).strip()
+            with open(prompt_file, 'rb') as f:
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        prompt_match = _PROMPT_RE.search(mm)
+                        prompt_bytes = prompt_match.group(1) if prompt_match else None
+                except ValueError:
+                    # Empty files can't be mapped
+                    prompt_bytes = None
+
+            if prompt_bytes is not None:
+                prompt_text = prompt_bytes.decode('utf-8').strip()
             else:
                 # Fallback: use title as prompt
                 prompt_text = prompt_data['title']
@@ -1637,21 +2751,16 @@ class SynthwaveGUI:
             # Clear any cached version to force reload
             self.clear_module_cache(module_name)
 
-            # Load the module with unique name
-            spec = importlib.util.spec_from_file_location(module_name, script_path)
-            if spec is None:
-                print(f"❌ Failed to create module spec for: {script_path}")
-                return False
-
-            module = importlib.util.module_from_spec(spec)
-            if module is None:
-                print(f"❌ Failed to create module from spec for: {script_path}")
-                return False
+            # Fresh module each run; only the compiled code is reused across prompts
+            module = types.ModuleType(module_name)
+            module.__file__ = str(script_path)
 
             # Step 5: Execute the script with enhanced error handling
             try:
-                # Execute the module
-                spec.loader.exec_module(module)
+                # Execute the module (compiled once per script version)
+                stat = script_path.stat()
+                code = _compile_script_cached(str(script_path), stat.st_mtime_ns, stat.st_size)
+                exec(code, module.__dict__)
 
                 # Fix: Ensure common SaveAsScript variables are defined (common bugs)
                 fixes_applied = []
@@ -1697,29 +2806,12 @@ class SynthwaveGUI:
 
                         # Method 1: Try ComfyUI's native SaveImage
                         try:
-                            # Find ComfyUI directory and add to path
-                            comfy_paths = [
-                                "/Volumes/Tikbalang2TB/Users/tikbalang/comfy_env/ComfyUI",  # Known path
-                                str(Path.cwd().parent),  # Parent directory
-                                str(Path.cwd()),  # Current directory
-                            ]
-
-                            comfyui_found = False
-                            for comfy_path in comfy_paths:
-                                comfy_extras_path = Path(comfy_path) / "comfy_extras"
-                                if comfy_extras_path.exists():
-                                    if str(comfy_path) not in sys.path:
-                                        sys.path.insert(0, str(comfy_path))
-                                    print(f"🔍 Using ComfyUI path: {comfy_path}")
-                                    comfyui_found = True
-                                    break
-
-                            if comfyui_found:
+                            # Find ComfyUI directory (probed once per process) and add to path
+                            if _resolve_comfyui_root() is not None:
                                 from comfy_extras.nodes_saveimage import SaveImage
                                 saveimage = SaveImage()
 
                                 # Add timestamp to filename_prefix for uniqueness
-                                import time
                                 timestamp = int(time.time() * 1000)  # Millisecond timestamp
                                 unique_prefix = f"{filename_prefix}_{timestamp}"
                                 print(f"🔧 Using unique filename prefix: {unique_prefix}")
@@ -1756,68 +2848,53 @@ class SynthwaveGUI:
 
                             # Method 2: Fallback - Direct tensor to image saving
                             try:
-                                import torch
-                                from PIL import Image
-                                import numpy as np
+                                if Image is None:
+                                    raise ImportError("Pillow not installed")
 
                                 # Create output directory
                                 output_dir = Path("output") / "synthwave_generated"
                                 output_dir.mkdir(parents=True, exist_ok=True)
 
-                                saved_files = []
-
-                                # Convert tensor images to PIL and save
-                                for i, img_tensor in enumerate(images):
-                                    # Convert from torch tensor to numpy array
-                                    if hasattr(img_tensor, 'cpu'):
-                                        img_array = img_tensor.cpu().numpy()
-                                    else:
-                                        img_array = np.array(img_tensor)
-
-                                    # Ensure proper format (0-255, uint8)
-                                    if img_array.max() <= 1.0:
-                                        img_array = (img_array * 255).astype(np.uint8)
-                                    else:
-                                        img_array = img_array.astype(np.uint8)
-
-                                    # Handle different tensor shapes
-                                    if len(img_array.shape) == 4:  # (batch, height, width, channels)
-                                        img_array = img_array[0]
-                                    if len(img_array.shape) == 3 and img_array.shape[0] in [1, 3, 4]:  # (channels, height, width)
-                                        img_array = np.transpose(img_array, (1, 2, 0))
-
-                                    # Create PIL Image
-                                    if img_array.shape[-1] == 1:  # Grayscale
-                                        pil_img = Image.fromarray(img_array.squeeze(), mode='L')
-                                    elif img_array.shape[-1] == 3:  # RGB
-                                        pil_img = Image.fromarray(img_array, mode='RGB')
-                                    elif img_array.shape[-1] == 4:  # RGBA
-                                        pil_img = Image.fromarray(img_array, mode='RGBA')
-                                    else:
-                                        # Default to RGB by taking first 3 channels
-                                        pil_img = Image.fromarray(img_array[:, :, :3], mode='RGB')
-
-                                    # Generate unique filename to prevent overwrites
-                                    import time
-                                    base_name = filename_prefix.replace('/', '_')
-                                    timestamp = int(time.time() * 1000)  # Millisecond timestamp for uniqueness
-
-                                    # Try basic filename first
-                                    base_filename = f"{base_name}_{i+1:05d}_{timestamp}.png"
-                                    filepath = output_dir / base_filename
-
-                                    # If file exists, increment counter until we find a unique name
-                                    counter = 0
-                                    while filepath.exists():
-                                        counter += 1
-                                        unique_filename = f"{base_name}_{i+1:05d}_{timestamp}_{counter:03d}.png"
-                                        filepath = output_dir / unique_filename
-
-                                    print(f"🔧 Saving to unique filename: {filepath.name}")
-
-                                    # Save the image
-                                    pil_img.save(filepath)
-                                    saved_files.append(str(filepath))
+                                # Names already taken, listed once instead of stat-ing every candidate
+                                with os.scandir(output_dir) as it:
+                                    existing = {e.name for e in it}
+
+                                # Generate unique filenames to prevent overwrites; one stamp for the batch
+                                base_name = filename_prefix.replace('/', '_')
+                                timestamp = int(time.time() * 1000)  # Millisecond timestamp for uniqueness
+
+                                # Convert the whole batch at once, then wrap each image for PIL
+                                batch = _images_to_uint8_batch(images)
+                                workers = max(1, min(os.cpu_count() or 1, batch.shape[0]))
+                                futures = {}
+                                with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as save_pool:
+                                    for i in range(batch.shape[0]):
+                                        img_array = batch[i]
+
+                                        # Create PIL Image straight from the batch's buffer: each
+                                        # batch[i] of a C-contiguous array is contiguous too. L and
+                                        # RGBA share the memory (the batch outlives the saves below)
+                                        height, width, channels = img_array.shape
+                                        if channels in _RAW_IMAGE_MODES:
+                                            mode = _RAW_IMAGE_MODES[channels]
+                                            pil_img = Image.frombuffer(mode, (width, height), img_array, 'raw', mode, 0, 1)
+                                        else:
+                                            # Default to RGB by taking first 3 channels
+                                            pil_img = Image.fromarray(img_array[:, :, :3], mode='RGB')
+
+                                        # Claim the basic filename, or the first free _NNN variant
+                                        fd, filepath = _create_unique_png(
+                                            output_dir, f"{base_name}_{i+1:05d}_{timestamp}", existing)
+
+                                        print(f"🔧 Saving to unique filename: {os.path.basename(filepath)}")
+
+                                        # Encode and write on the pool
+                                        futures[save_pool.submit(_write_png, pil_img, fd, filepath)] = filepath
+
+                                    # PNG encoding releases the GIL, so saves overlap; surface any failure
+                                    for future in concurrent.futures.as_completed(futures):
+                                        future.result()
+                                saved_files = list(futures.values())
 
                                 print(f"📁 Images saved successfully via fallback method:")
                                 for i, filepath in enumerate(saved_files, 1):
@@ -1874,7 +2951,12 @@ class SynthwaveGUI:
             return False
 
     def create_comfyui_config_tab(self):
-        """Create the ComfyUI configuration tab"""
+        """Create the ComfyUI configuration tab
+
+        The model section is built now, since model loading and status updates
+        use its widgets from startup. The script sections are built the first
+        time the tab is shown.
+        """
         config_frame = ttk.Frame(self.notebook, style="Synthwave.TFrame")
         self.notebook.add(config_frame, text="COMFYUI CONFIG")
 
@@ -1886,20 +2968,30 @@ class SynthwaveGUI:
         top_row_frame = tk.Frame(main_container, bg=SynthwaveColors.BACKGROUND)
         top_row_frame.pack(fill='x', pady=(0, 20))
 
-        # Script Selection Section (left half)
-        self.create_script_selection_section(top_row_frame)
-
         # Model Selection Section (right half)
         self.create_model_selection_section(top_row_frame)
 
-        # Script Import Section
-        self.create_script_import_section(main_container)
+        # Initialize script analyzer (execution uses it even if the tab is never opened)
+        if ComfyUIScriptAnalyzer:
+            self.script_analyzer = ComfyUIScriptAnalyzer()
+        else:
+            self.script_analyzer = None
+
+        def build_script_sections(event):
+            config_frame.unbind('<Map>', map_binding)
+
+            # Script Selection Section (left half; packs to the left of the model section)
+            self.create_script_selection_section(top_row_frame)
+
+            # Script Import Section
+            self.create_script_import_section(main_container)
 
-        # Prompt Argument Configuration Section
-        self.create_prompt_config_section(main_container)
+            # Prompt Argument Configuration Section
+            self.create_prompt_config_section(main_container)
 
-        # Script Preview Section
-        self.create_script_preview_section(main_container)
+            # Script Preview Section
+            self.create_script_preview_section(main_container)
+        map_binding = config_frame.bind('<Map>', build_script_sections, add='+')
 
     def create_script_selection_section(self, parent):
         """Create ComfyUI script selection section (left half)"""
@@ -1907,7 +2999,7 @@ class SynthwaveGUI:
         left_container = tk.Frame(parent, bg=SynthwaveColors.BACKGROUND)
         left_container.pack(side='left', fill='both', expand=True, padx=(0, 10))
 
-        header_font = font.Font(family="Courier New", size=14, weight="bold")
+        header_font = self.fonts['header']
         section_label = tk.Label(
             left_container,
             text="┌─ SCRIPT SELECTION ─┐",
@@ -1923,8 +3015,8 @@ class SynthwaveGUI:
         selection_frame = tk.Frame(selection_container, bg=SynthwaveColors.SECONDARY)
         selection_frame.pack(fill='x', padx=15, pady=15)
 
-        label_font = font.Font(family="Courier New", size=10)
-        button_font = font.Font(family="Courier New", size=10, weight="bold")
+        label_font = self.fonts['label']
+        button_font = self.fonts['button']
 
         # Current script display
         current_frame = tk.Frame(selection_frame, bg=SynthwaveColors.SECONDARY)
@@ -1941,7 +3033,7 @@ class SynthwaveGUI:
         self.current_script_display = tk.Label(
             current_frame,
             text=self.selected_comfyui_script,
-            font=font.Font(family="Courier New", size=10, weight="bold"),
+            font=self.fonts['button'],
             fg=SynthwaveColors.WARNING,
             bg=SynthwaveColors.SECONDARY
         )
@@ -1976,8 +3068,8 @@ class SynthwaveGUI:
         self.scripts_listbox.pack(side="left", fill="both", expand=True)
         scripts_scrollbar.pack(side="right", fill="y")
 
-        # Load available scripts
-        self.refresh_scripts_list()
+        # Show the scripts found so far; _backend_ready fills in the startup scan
+        self.populate_scripts_list()
 
         # Script control buttons
         buttons_frame = tk.Frame(selection_frame, bg=SynthwaveColors.SECONDARY)
@@ -2002,7 +3094,7 @@ class SynthwaveGUI:
         right_container = tk.Frame(parent, bg=SynthwaveColors.BACKGROUND)
         right_container.pack(side='right', fill='both', expand=True, padx=(10, 0))
 
-        header_font = font.Font(family="Courier New", size=14, weight="bold")
+        header_font = self.fonts['header']
         section_label = tk.Label(
             right_container,
             text="┌─ MODEL SELECTION ─┐",
@@ -2018,8 +3110,8 @@ class SynthwaveGUI:
         model_frame = tk.Frame(model_container, bg=SynthwaveColors.SECONDARY)
         model_frame.pack(fill='x', padx=15, pady=15)
 
-        label_font = font.Font(family="Courier New", size=10)
-        button_font = font.Font(family="Courier New", size=10, weight="bold")
+        label_font = self.fonts['label']
+        button_font = self.fonts['button']
 
         # Current model display
         current_model_frame = tk.Frame(model_frame, bg=SynthwaveColors.SECONDARY)
@@ -2039,7 +3131,7 @@ class SynthwaveGUI:
         self.current_model_display = tk.Label(
             current_model_frame,
             textvariable=self.current_model_var,
-            font=font.Font(family="Courier New", size=10, weight="bold"),
+            font=self.fonts['button'],
             fg=SynthwaveColors.WARNING,
             bg=SynthwaveColors.SECONDARY
         )
@@ -2103,13 +3195,29 @@ class SynthwaveGUI:
             pady=6,
             command=self.refresh_available_models
         )
-        refresh_models_btn.pack(side='left')
+        refresh_models_btn.pack(side='left', padx=(0, 10))
+
+        # Unload Model button
+        unload_model_btn = tk.Button(
+            select_model_frame,
+            text="Unload",
+            font=button_font,
+            bg=SynthwaveColors.QUATERNARY_ACCENT,
+            fg=SynthwaveColors.TEXT,
+            activebackground=SynthwaveColors.NEON_PINK,
+            activeforeground=SynthwaveColors.BACKGROUND,
+            relief='flat',
+            padx=15,
+            pady=6,
+            command=self.unload_current_model
+        )
+        unload_model_btn.pack(side='left')
 
         # Status display
         self.model_status_label = tk.Label(
             model_frame,
             text="Status: Ready to load models",
-            font=font.Font(family="Courier New", size=9),
+            font=self.fonts['mono9'],
             fg=SynthwaveColors.SECONDARY_ACCENT,
             bg=SynthwaveColors.SECONDARY
         )
@@ -2120,7 +3228,7 @@ class SynthwaveGUI:
 
     def create_script_import_section(self, parent):
         """Create script import section"""
-        header_font = font.Font(family="Courier New", size=14, weight="bold")
+        header_font = self.fonts['header']
         section_label = tk.Label(
             parent,
             text="┌─ IMPORT NEW SCRIPT ─┐",
@@ -2136,8 +3244,8 @@ class SynthwaveGUI:
         import_frame = tk.Frame(import_container, bg=SynthwaveColors.SECONDARY)
         import_frame.pack(fill='x', padx=15, pady=15)
 
-        label_font = font.Font(family="Courier New", size=10)
-        button_font = font.Font(family="Courier New", size=10, weight="bold")
+        label_font = self.fonts['label']
+        button_font = self.fonts['button']
 
         # Instructions
         instructions = tk.Label(
@@ -2194,7 +3302,7 @@ class SynthwaveGUI:
 
     def create_prompt_config_section(self, parent):
         """Create prompt argument configuration section"""
-        header_font = font.Font(family="Courier New", size=14, weight="bold")
+        header_font = self.fonts['header']
         section_label = tk.Label(
             parent,
             text="┌─ PROMPT ARGUMENT MAPPING ─┐",
@@ -2210,8 +3318,8 @@ class SynthwaveGUI:
         config_frame = tk.Frame(config_container, bg=SynthwaveColors.SECONDARY)
         config_frame.pack(fill='x', padx=15, pady=15)
 
-        label_font = font.Font(family="Courier New", size=10)
-        button_font = font.Font(family="Courier New", size=10, weight="bold")
+        label_font = self.fonts['label']
+        button_font = self.fonts['button']
 
         # Instructions
         instructions = tk.Label(
@@ -2310,15 +3418,9 @@ class SynthwaveGUI:
         )
         save_btn.pack(side='left')
 
-        # Initialize script analyzer
-        if ComfyUIScriptAnalyzer:
-            self.script_analyzer = ComfyUIScriptAnalyzer()
-        else:
-            self.script_analyzer = None
-
     def create_script_preview_section(self, parent):
         """Create script preview section"""
-        header_font = font.Font(family="Courier New", size=14, weight="bold")
+        header_font = self.fonts['header']
         section_label = tk.Label(
             parent,
             text="┌─ SCRIPT PREVIEW ─┐",
@@ -2337,7 +3439,7 @@ class SynthwaveGUI:
 
         self.script_preview = tk.Text(
             preview_frame,
-            font=font.Font(family="Courier New", size=9),
+            font=self.fonts['mono9'],
             bg=SynthwaveColors.BACKGROUND,
             fg=SynthwaveColors.TEXT,
             insertbackground=SynthwaveColors.PRIMARY_ACCENT,
@@ -2355,20 +3457,29 @@ class SynthwaveGUI:
         preview_scroll_x.pack(side="bottom", fill="x")
 
     def refresh_scripts_list(self):
-        """Refresh the list of available ComfyUI scripts"""
-        self.scripts_listbox.delete(0, tk.END)
+        """Refresh the list of available ComfyUI scripts
+
+        A no-op while the directory's mtime matches the last scan: nothing was
+        added, removed or renamed, so the listbox already shows the list.
+        """
+        if self._scripts_cache is not None and os.stat('.').st_mtime_ns == self._scripts_cache_mtime:
+            return
         self.scan_comfyui_scripts()
+        self.populate_scripts_list()
+
+    def populate_scripts_list(self):
+        """Show available_scripts in the scripts listbox"""
+        self.scripts_listbox.delete(0, tk.END)
 
-        for script in self.available_scripts:
-            self.scripts_listbox.insert(tk.END, script)
+        # Single variadic insert: one Tcl command instead of one per script
+        if self.available_scripts:
+            self.scripts_listbox.insert(tk.END, *self.available_scripts)
 
         # Auto-select current script
-        try:
-            current_index = self.available_scripts.index(self.selected_comfyui_script)
+        current_index = self._script_index.get(self.selected_comfyui_script)
+        if current_index is not None:
             self.scripts_listbox.selection_set(current_index)
             self.scripts_listbox.see(current_index)
-        except ValueError:
-            pass
 
     def auto_detect_arguments_for_script(self, script_name):
         """Auto-detect prompt arguments for a specific script and return result"""
@@ -2376,12 +3487,17 @@ class SynthwaveGUI:
             return None
 
         try:
-            # Analyze the specified script
-            arguments, mapping = self.script_analyzer.analyze_script(script_name)
-
-            # Extract text arguments for the combo boxes
-            text_args = [arg.dest for arg in arguments if 'text' in arg.dest.lower()]
-            text_args.sort()
+            # Reuse the previous analysis while the script file is unchanged
+            cache_key = (script_name, os.stat(script_name).st_mtime_ns)
+            cached = self._script_analysis_cache.get(cache_key)
+            if cached is None:
+                arguments, mapping = self.script_analyzer.analyze_script(script_name)
+
+                # Extract deduplicated, sorted text arguments for the combo boxes
+                text_args = sorted({arg.dest for arg in arguments if 'text' in arg.dest.lower()})
+                cached = (len(arguments), text_args, mapping)
+                self._script_analysis_cache[cache_key] = cached
+            arg_count, text_args, mapping = cached
 
             # Update combo box options
             self.main_prompt_combo['values'] = text_args
@@ -2394,32 +3510,41 @@ class SynthwaveGUI:
                 self.neg_prompt_var.set(mapping.negative_prompt)
 
             # Update status
-            status = f"Found {len(arguments)} args, {len(text_args)} text args"
+            status = f"Found {arg_count} args, {len(text_args)} text args"
             if mapping.main_prompt:
                 status += f" | Main: {mapping.main_prompt}"
             if mapping.negative_prompt:
                 status += f" | Neg: {mapping.negative_prompt}"
 
-            self.detection_status_label.config(
-                text=status,
-                fg=SynthwaveColors.SUCCESS
-            )
+            self._set_detection_status(status, SynthwaveColors.SUCCESS)
 
             # Auto-save the mapping
-            script_base = script_name.replace('.py', '')
+            script_base = _strip_py(script_name)
             self.script_analyzer.save_mapping(script_base, mapping)
+            self._mapping_cache[script_base] = mapping
 
             # Return result for display in import message
             result = f"Main: {mapping.main_prompt or 'None'}, Neg: {mapping.negative_prompt or 'None'}"
             return result
 
         except Exception as e:
-            self.detection_status_label.config(
-                text=f"Error: {str(e)}",
-                fg=SynthwaveColors.WARNING
-            )
+            self._set_detection_status(f"Error: {str(e)}", SynthwaveColors.WARNING)
             return None
 
+    def _set_detection_status(self, text, fg):
+        """Debounce detection status writes so bursts collapse into one label update"""
+        self._pending_detection_status = (text, fg)
+        if self._detection_status_after_id is not None:
+            self.root.after_cancel(self._detection_status_after_id)
+        self._detection_status_after_id = self.root.after(50, self._apply_detection_status)
+
+    def _apply_detection_status(self):
+        """Apply the most recent pending detection status to the label"""
+        self._detection_status_after_id = None
+        if self._pending_detection_status is not None:
+            text, fg = self._pending_detection_status
+            self._pending_detection_status = None
+            self.detection_status_label.config(text=text, fg=fg)
 
     def save_prompt_mapping(self):
         """Save the current prompt argument mapping"""
@@ -2433,15 +3558,15 @@ class SynthwaveGUI:
 
         try:
             # Create mapping from current UI values
-            from script_analyzer import PromptMapping
             mapping = PromptMapping(
                 main_prompt=self.main_prompt_var.get() or None,
                 negative_prompt=self.neg_prompt_var.get() or None
             )
 
             # Save the mapping
-            script_name = self.selected_comfyui_script.replace('.py', '')
+            script_name = _strip_py(self.selected_comfyui_script)
             self.script_analyzer.save_mapping(script_name, mapping)
+            self._mapping_cache[script_name] = mapping
 
             messagebox.showinfo("Success", f"Prompt mapping saved for {script_name}")
 
@@ -2454,7 +3579,12 @@ class SynthwaveGUI:
             return
 
         try:
-            mapping = self.script_analyzer.load_mapping(script_name)
+            # Serve repeat selections from memory; saves keep the cache current
+            if script_name in self._mapping_cache:
+                mapping = self._mapping_cache[script_name]
+            else:
+                mapping = self.script_analyzer.load_mapping(script_name)
+                self._mapping_cache[script_name] = mapping
             if mapping:
                 self.main_prompt_var.set(mapping.main_prompt or "")
                 self.neg_prompt_var.set(mapping.negative_prompt or "")
@@ -2465,18 +3595,12 @@ class SynthwaveGUI:
                 if mapping.negative_prompt:
                     status += f" | Neg: {mapping.negative_prompt}"
 
-                self.detection_status_label.config(
-                    text=status,
-                    fg=SynthwaveColors.SUCCESS
-                )
+                self._set_detection_status(status, SynthwaveColors.SUCCESS)
             else:
                 # Clear UI if no mapping found
                 self.main_prompt_var.set("")
                 self.neg_prompt_var.set("")
-                self.detection_status_label.config(
-                    text="No saved mapping found",
-                    fg=SynthwaveColors.TEXT
-                )
+                self._set_detection_status("No saved mapping found", SynthwaveColors.TEXT)
         except Exception as e:
             print(f"Error loading mapping: {e}")
 
@@ -2493,7 +3617,7 @@ class SynthwaveGUI:
             self.load_script_preview(selected_script)
 
             # Load prompt mapping for this script
-            script_name = selected_script.replace('.py', '')
+            script_name = _strip_py(selected_script)
             self.load_prompt_mapping(script_name)
 
             messagebox.showinfo("Success", f"Selected script: {selected_script}")
@@ -2520,7 +3644,6 @@ class SynthwaveGUI:
             return
 
         try:
-            import shutil
             source_path = Path(file_path)
             if not source_path.exists():
                 messagebox.showerror("Error", "Selected file does not exist")
@@ -2550,85 +3673,55 @@ class SynthwaveGUI:
             print(f"📥 Imported script: {imported_script_name}")
             print(f"📂 File exists at destination: {destination.exists()}")
 
-            # Validate the copied script for final confirmation
-            is_valid_copy, copy_validation_message = self.validate_comfyui_script(destination)
+            # copy2 is byte-for-byte, so the source validation result applies to the copy
+            is_valid_copy, copy_validation_message = is_valid, validation_message
             if is_valid_copy:
                 print(f"✅ Script validation passed: {copy_validation_message}")
             else:
                 print(f"⚠️ Script validation warning: {copy_validation_message}")
 
-            # Refresh scripts list
-            self.refresh_scripts_list()
+            # Append the new script in place instead of rescanning the directory
+            if imported_script_name not in self._available_scripts_set:
+                bisect.insort(self.available_scripts, imported_script_name)
+                self._reindex_scripts()
+                self.scripts_listbox.insert(
+                    self._script_index[imported_script_name],
+                    imported_script_name
+                )
 
-            print(f"📋 Available scripts after refresh: {self.available_scripts}")
+            print(f"📋 Available scripts after import: {self.available_scripts}")
 
             # Auto-select the newly imported script
-            if imported_script_name in self.available_scripts:
-                try:
-                    script_index = self.available_scripts.index(imported_script_name)
-                    self.scripts_listbox.selection_set(script_index)
-                    self.scripts_listbox.see(script_index)
-
-                    # Set as current script
-                    self.selected_comfyui_script = imported_script_name
-                    self.current_script_display.config(text=imported_script_name)
-                    self.current_script_label.config(text=f"Script: {imported_script_name}")
-
-                    # Load script preview
-                    self.load_script_preview(imported_script_name)
-
-                    # Auto-detect arguments for the imported script
-                    detection_result = self.auto_detect_arguments_for_script(imported_script_name)
-
-                    success_msg = f"✅ Imported and selected script: {imported_script_name}"
-                    if is_valid_copy:
-                        success_msg += f"\n✅ Validation: {copy_validation_message}"
-                    else:
-                        success_msg += f"\n⚠️ Validation: {copy_validation_message}"
-                    if detection_result:
-                        success_msg += f"\n🔍 Detected arguments: {detection_result}"
-
-                    messagebox.showinfo("Success", success_msg)
-                    print(f"✅ Successfully auto-selected: {imported_script_name}")
-                except Exception as e:
-                    print(f"❌ Error during auto-selection: {e}")
-                    messagebox.showinfo("Success", f"✅ Imported script: {imported_script_name}\n⚠️ Auto-selection failed: {e}")
-            else:
-                # Script not detected by our filters - force add it
-                print(f"⚠️ Script not detected by filters, force-adding: {imported_script_name}")
-                self.available_scripts.append(imported_script_name)
-                self.scripts_listbox.insert(tk.END, imported_script_name)
-
-                # Now select it
-                try:
-                    script_index = len(self.available_scripts) - 1
-                    self.scripts_listbox.selection_set(script_index)
-                    self.scripts_listbox.see(script_index)
+            try:
+                script_index = self._script_index[imported_script_name]
+                self.scripts_listbox.selection_clear(0, tk.END)
+                self.scripts_listbox.selection_set(script_index)
+                self.scripts_listbox.see(script_index)
 
-                    # Set as current script
-                    self.selected_comfyui_script = imported_script_name
-                    self.current_script_display.config(text=imported_script_name)
-                    self.current_script_label.config(text=f"Script: {imported_script_name}")
+                # Set as current script
+                self.selected_comfyui_script = imported_script_name
+                self.current_script_display.config(text=imported_script_name)
+                self.current_script_label.config(text=f"Script: {imported_script_name}")
 
-                    # Load script preview
-                    self.load_script_preview(imported_script_name)
+                # Load script preview
+                self.load_script_preview(imported_script_name)
 
-                    # Auto-detect arguments for the imported script
-                    detection_result = self.auto_detect_arguments_for_script(imported_script_name)
+                # Auto-detect arguments for the imported script
+                detection_result = self.auto_detect_arguments_for_script(imported_script_name)
 
-                    success_msg = f"✅ Imported and selected script: {imported_script_name}\n(Force-added to list)"
-                    if is_valid_copy:
-                        success_msg += f"\n✅ Validation: {copy_validation_message}"
-                    else:
-                        success_msg += f"\n⚠️ Validation: {copy_validation_message}"
-                    if detection_result:
-                        success_msg += f"\n🔍 Detected arguments: {detection_result}"
+                success_msg = f"✅ Imported and selected script: {imported_script_name}"
+                if is_valid_copy:
+                    success_msg += f"\n✅ Validation: {copy_validation_message}"
+                else:
+                    success_msg += f"\n⚠️ Validation: {copy_validation_message}"
+                if detection_result:
+                    success_msg += f"\n🔍 Detected arguments: {detection_result}"
 
-                    messagebox.showinfo("Success", success_msg)
-                    print(f"✅ Force-added and selected: {imported_script_name}")
-                except Exception as e:
-                    print(f"❌ Error during force-selection: {e}")
-                    messagebox.showwarning("Partial Success", f"✅ Imported script: {imported_script_name}\n❌ Could not auto-select: {e}")
+                messagebox.showinfo("Success", success_msg)
+                print(f"✅ Successfully auto-selected: {imported_script_name}")
+            except Exception as e:
+                print(f"❌ Error during auto-selection: {e}")
+                messagebox.showinfo("Success", f"✅ Imported script: {imported_script_name}\n⚠️ Auto-selection failed: {e}")
 
             self.import_file_var.set("")
 
@@ -2668,37 +3761,44 @@ class SynthwaveGUI:
             self.script_preview.config(state='disabled')
 
 
+    def schedule_queue_drain(self):
+        """Ask the Tk main loop to drain the queue once it is idle (called from any thread)"""
+        with self._queue_drain_lock:
+            if self._queue_drain_scheduled:
+                return
+            self._queue_drain_scheduled = True
+        try:
+            self.root.after_idle(self.process_queue)
+        except (RuntimeError, tk.TclError):
+            # Main loop already gone (application closing)
+            self._queue_drain_scheduled = False
+
     def process_queue(self):
-        """Process messages from background threads"""
+        """Process all pending messages from background threads"""
+        with self._queue_drain_lock:
+            self._queue_drain_scheduled = False
         try:
             while True:
                 message = self.queue.get_nowait()
                 self.handle_queue_message(message)
         except queue.Empty:
             pass
-        finally:
-            self.root.after(100, self.process_queue)
 
     def handle_queue_message(self, message):
         """Handle messages from background threads"""
         msg_type = message.get('type')
 
-        if msg_type == 'scan_progress':
-            self.update_scan_progress(message)
-        elif msg_type == 'scan_complete':
-            self.handle_scan_complete(message)
-        elif msg_type == 'transform_progress':
-            self.update_transform_progress(message)
-        elif msg_type == 'transform_complete':
-            self.handle_transform_complete(message)
-        elif msg_type == 'comfyui_progress':
-            self.update_comfyui_progress(message)
-        elif msg_type == 'comfyui_complete':
-            self.handle_comfyui_complete(message)
-        elif msg_type == 'error':
-            self.handle_error(message)
-        elif msg_type == 'log_message':
-            self.handle_log_message(message)
+        if msg_type == 'call':
+            message['fn'](*message['args'])
+            return
+
+        handler = self._message_handlers.get(msg_type)
+        if handler is not None:
+            handler(message)
+
+    def call_soon(self, fn, *args):
+        """Run fn(*args) on the Tk thread as soon as the main loop is free (callable from any thread)"""
+        self.queue.put({'type': 'call', 'fn': fn, 'args': args})
 
     def handle_log_message(self, message):
         """Handle log messages by writing them to scan results"""
@@ -2711,16 +3811,53 @@ class SynthwaveGUI:
         total = message.get('total', 1)
         post_title = message.get('post_title', 'Scanning...')
 
-        # Update progress bar
-        self.scan_progress.config(value=current, maximum=total)
-
-        # Update status (with safety check)
-        if hasattr(self, 'current_operation_label'):
-            self.current_operation_label.config(text=f"Scanning: {post_title[:50]}...")
+        # Update progress bar and status; real progress replaces the pulse
+        self._stop_scan_pulse()
+        self._set_progress(current, total, f"Scanning: {post_title[:50]}...")
 
         # Log message to console
         print(f"[INFO] Scanning post {current}/{total}: {post_title}")
 
+    def schedule_ui(self, key, fn):
+        """Run fn in the next UI batch, replacing any update already queued under key (GUI thread)
+
+        Batches go out every 30 ms at most, so a burst of progress messages
+        costs one redraw instead of one per message.
+        """
+        self._pending_updates[key] = fn
+        if self._render_after_id is None:
+            self._render_after_id = self.root.after(30, self._flush_ui)
+
+    def cancel_ui(self, key):
+        """Drop a queued update, e.g. before setting the widget directly"""
+        self._pending_updates.pop(key, None)
+
+    def _flush_ui(self):
+        """Apply the latest queued update for every key"""
+        self._render_after_id = None
+        pending, self._pending_updates = self._pending_updates, {}
+        for fn in pending.values():
+            fn()
+
+    def _set_progress(self, current=None, total=None, text=None):
+        """Queue a progress bar / operation label update; only the latest one per batch is drawn"""
+        if current is not None:
+            self.schedule_ui('progress', lambda: self._apply_progress(current, total))
+        if text is not None:
+            self.schedule_ui('operation', lambda: self._apply_operation_text(text))
+
+    def _apply_progress(self, current, total):
+        """Write the progress bar, skipping the Tcl call for unchanged values"""
+        if (current, total) != self._last_progress:
+            self._last_progress = (current, total)
+            self.scan_progress.config(value=current, maximum=total)
+
+    def _apply_operation_text(self, text):
+        """Write the operation label (with safety check), skipping unchanged text"""
+        if text != self._last_operation_text and hasattr(self, 'current_operation_label'):
+            self._last_operation_text = text
+            self.current_operation_label.config(text=text)
+
     def handle_scan_complete(self, message):
         """Handle scan completion"""
         results = message.get('results', [])
@@ -2728,8 +3865,10 @@ class SynthwaveGUI:
 
         # Update UI
         self.start_scan_btn.config(state='normal', text="▶ START SCAN")
-        self.scan_progress.stop()
-        self.scan_progress.config(mode='determinate', value=100, maximum=100)
+        self.cancel_ui('progress')
+        self._stop_scan_pulse()
+        self.scan_progress.config(value=100, maximum=100)
+        self._last_progress = (100, 100)
 
         # Update scan results display
         self.current_scan_results = results
@@ -2780,6 +3919,7 @@ class SynthwaveGUI:
 
             total_posts = len(self.current_scan_results)
             successful_transforms = 0
+            new_prompts = []  # Handed to the GUI thread in one transform_complete message
 
             for i, post in enumerate(self.current_scan_results):
                 self.queue.put({
@@ -2818,7 +3958,7 @@ class SynthwaveGUI:
                                 'score': str(post['score']),
                                 'status': "⏳ Pending"
                             }
-                            self.current_session_prompts.append(prompt_data)
+                            new_prompts.append(prompt_data)
                             successful_transforms += 1
                         else:
                             error_msg = prompt_result.get('error', 'Unknown error')
@@ -2835,8 +3975,10 @@ class SynthwaveGUI:
                         })
                 else:
                     # Create mock prompt for demo
-                    self.create_mock_prompt(post)
-                    successful_transforms += 1
+                    prompt_data = self.create_mock_prompt(post)
+                    if prompt_data:
+                        new_prompts.append(prompt_data)
+                        successful_transforms += 1
 
                 # Simulate processing time
                 time.sleep(1)
@@ -2846,7 +3988,8 @@ class SynthwaveGUI:
 
             self.queue.put({
                 'type': 'transform_complete',
-                'total_processed': successful_transforms
+                'total_processed': successful_transforms,
+                'new_prompts': new_prompts
             })
 
         except Exception as e:
@@ -2859,70 +4002,46 @@ class SynthwaveGUI:
             })
 
     def create_mock_prompt(self, post):
-        """Create a mock prompt file for demo purposes"""
+        """Create a mock prompt file for demo purposes
+
+        Returns:
+            dict: Prompt data for the session list, or None on failure
+        """
         try:
             # Create prompts directory if it doesn't exist
             prompts_dir = Path("poc_output/prompts")
             prompts_dir.mkdir(parents=True, exist_ok=True)
 
             # Generate mock prompt content
-            import datetime
             prompt_id = f"demo_prompt_{post['id']}"
             prompt_file = prompts_dir / f"{prompt_id}.md"
 
-            mock_prompt = f"""Vector illustration of {post.get('text_content', 'trending meme concept')},
-bold graphic design style, high contrast colors, minimalist composition,
-suitable for t-shirt printing, 768x1024 pixels, 300 DPI, RGB, transparent background"""
-
-            prompt_content = f"""# T-Shirt Design Prompt (Demo Mode)
-
-## Source Information
-- **Reddit ID**: {post['id']}
-- **Original Title**: {post['title']}
-- **Text Content**: {post.get('text_content', 'N/A')}
-- **Popularity Score**: {post['score']}
-- **Generated**: {datetime.datetime.now().isoformat()}
-- **Generation Type**: Demo Mode
-
-## ComfyUI Prompt
-
-```
-{mock_prompt}
-```
-
-## Technical Specifications
-- **Dimensions**: 768x1024 pixels
-- **Resolution**: 300 DPI
-- **Color Mode**: RGB
-- **Background**: Transparent
-- **Format**: PNG
-- **Design Type**: Demo visual graphic design
+            prompt_content = _MOCK_PROMPT_TEMPLATE.format_map({
+                'reddit_id': post['id'],
+                'title': post['title'],
+                'text_content': post.get('text_content', 'N/A'),
+                'prompt_concept': post.get('text_content', 'trending meme concept'),
+                'score': post['score'],
+                'generated': datetime.now().isoformat(),
+            })
 
-## Notes
-- Demo mode prompt - LLM not available
-- Generated for GUI demonstration purposes
-"""
+            # Save the mock prompt file in a single write
+            prompt_file.write_text(prompt_content, encoding='utf-8')
 
-            # Save the mock prompt file
-            with open(prompt_file, 'w', encoding='utf-8') as f:
-                f.write(prompt_content)
+            print(f"✅ Created demo prompt: {prompt_id}")
 
-            # Add to current session prompts (for Results display)
-            prompt_data = {
+            # Session entry; the caller adds it to current_session_prompts
+            return {
                 'file': prompt_file,
                 'reddit_id': post['id'],
                 'title': post['title'],
                 'score': str(post['score']),
                 'status': "⏳ Pending"
             }
-            self.current_session_prompts.append(prompt_data)
-
-            print(f"✅ Created demo prompt: {prompt_id}")
-            return True
 
         except Exception as e:
             print(f"❌ Failed to create mock prompt: {e}")
-            return False
+            return None
 
     def update_transform_progress(self, message):
         """Update transformation progress"""
@@ -2931,13 +4050,9 @@ suitable for t-shirt printing, 768x1024 pixels, 300 DPI, RGB, transparent backgr
         post_title = message.get('post_title', 'Processing...')
 
         # Update progress (using scan_progress since operation_progress removed with Results tab)
-        self.scan_progress.config(value=current, maximum=total)
+        self._set_progress(current, total, f"AI Processing: {post_title[:50]}...")
         self.write_to_scan_results(f"🔄 Transforming: {current}/{total} - {post_title[:50]}...")
 
-        # Update status (with safety check)
-        if hasattr(self, 'current_operation_label'):
-            self.current_operation_label.config(text=f"AI Processing: {post_title[:50]}...")
-
         # Log progress to console
         print(f"[INFO] Transforming {current}/{total}: {post_title}")
 
@@ -2945,6 +4060,9 @@ suitable for t-shirt printing, 768x1024 pixels, 300 DPI, RGB, transparent backgr
         """Handle transformation completion (Results tab removed - using consolidated interface)"""
         total_processed = message.get('total_processed', 0)
 
+        # Add the whole batch of new prompts at once on the GUI thread
+        self.current_session_prompts.extend(message.get('new_prompts', []))
+
         # Log completion to scan results
         self.write_to_scan_results(f"🎉 AI transformation complete: {total_processed} prompts generated")
 
@@ -2959,18 +4077,18 @@ suitable for t-shirt printing, 768x1024 pixels, 300 DPI, RGB, transparent backgr
 
     def update_comfyui_progress(self, message):
         """Update ComfyUI progress"""
-        current = message.get('current', 0)
-        total = message.get('total', 1)
-        prompt_title = message.get('prompt_title', 'Processing...')
+        self._on_comfyui_progress(
+            message.get('current', 0),
+            message.get('total', 1),
+            message.get('prompt_title', 'Processing...')
+        )
 
+    def _on_comfyui_progress(self, current, total, prompt_title):
+        """Show execution progress (GUI thread; run_comfyui_execution reaches it via call_soon)"""
         # Update progress bars (using scan_progress since operation_progress removed with Results tab)
-        self.scan_progress.config(value=current, maximum=total)
+        self._set_progress(current, total, f"Generating: {prompt_title[:50]}...")
         self.write_to_scan_results(f"🎨 ComfyUI: {current}/{total} - {prompt_title[:50]}...")
 
-        # Update status (with safety check)
-        if hasattr(self, 'current_operation_label'):
-            self.current_operation_label.config(text=f"Generating: {prompt_title[:50]}...")
-
         # Log progress to console
         print(f"[INFO] Generating design {current}/{total}: {prompt_title}")
 
@@ -2978,20 +4096,15 @@ suitable for t-shirt printing, 768x1024 pixels, 300 DPI, RGB, transparent backgr
         """Handle ComfyUI execution completion"""
         total_processed = message.get('total_processed', 0)
 
-        # Reset UI state
-        self.start_execution_btn.config(state='normal', text="▶ START COMFYUI")
-        self.stop_execution_btn.config(state='disabled')
+        # Reset UI state (already done if STOP was pressed)
+        self._set_execution_buttons(running=False)
 
         # Update progress (using scan_progress since operation_progress removed with Results tab)
-        self.scan_progress.config(value=100, maximum=100)
+        self._set_progress(100, 100, "Status: All designs generated successfully")
         self.write_to_scan_results(f"🎉 Complete: {total_processed}/{total_processed} operations finished")
 
         # Statistics would be updated in Monitor tab (removed)
 
-        # Update status (with safety check)
-        if hasattr(self, 'current_operation_label'):
-            self.current_operation_label.config(text="Status: All designs generated successfully")
-
         # Log completion to console
         print(f"[SUCCESS] ComfyUI execution complete: {total_processed} designs generated")
 
@@ -3022,7 +4135,15 @@ suitable for t-shirt printing, 768x1024 pixels, 300 DPI, RGB, transparent backgr
         self.create_image_viewer_panel(paned_window)
 
         # Set initial pane sizes (30% for file list, 70% for image viewer)
-        self.root.after(100, lambda: paned_window.sash_place(0, 300, 0))
+        paned_window.update_idletasks()
+        if paned_window.winfo_width() > 1:
+            paned_window.sash_place(0, 300, 0)
+        else:
+            # Not laid out yet (e.g. tab not shown): place the sash once, when it first maps
+            def place_sash_on_map(event):
+                paned_window.unbind('<Map>', map_binding)
+                paned_window.sash_place(0, 300, 0)
+            map_binding = paned_window.bind('<Map>', place_sash_on_map, add='+')
 
         # Initialize gallery data
         self.output_folders = [
@@ -3031,12 +4152,25 @@ suitable for t-shirt printing, 768x1024 pixels, 300 DPI, RGB, transparent backgr
         ]
         self.current_image_path = None
         self.gallery_images = []
+        self._gallery_digest = None  # blake2b of the displayed (path, mtime) list
+        self._folder_mtime_cache = {}  # folder path -> st_mtime_ns at last scan
+        self._folder_entries_cache = {}  # folder path -> {file path: image entry}
+        self._gallery_observer = None
+        self._refresh_pending = False
+        self._photo_cache = OrderedDict()  # (file path, mtime, quality) -> (PhotoImage, original size)
+        self.gallery_high_quality = False  # LANCZOS instead of BILINEAR preview scaling (gallery_hq_var)
+        self._thumb_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        self._thumbs_requested = set()  # (file path, mtime) already queued for thumbnailing
+        self._stale_thumbs_checked = False
+        self._gallery_scan = None  # Generator of the scan in progress, if any
+        self._gallery_rescan = None  # preserve_selection for a refresh requested mid-scan
 
         # Initial load of files
         self.refresh_gallery()
 
-        # Set up auto-refresh (check for new files every 2 seconds)
-        self.schedule_gallery_refresh()
+        # Watch output folders for new images; poll only when a watcher can't be started
+        if not self.start_gallery_watcher():
+            self.schedule_gallery_refresh()
 
     def create_file_list_panel(self, parent):
         """Create the left panel with file list"""
@@ -3045,7 +4179,7 @@ suitable for t-shirt printing, 768x1024 pixels, 300 DPI, RGB, transparent backgr
         parent.add(list_container, minsize=250)
 
         # Header
-        header_font = font.Font(family="Courier New", size=12, weight="bold")
+        header_font = self.fonts['subheader']
         header_label = tk.Label(
             list_container,
             text="📁 GENERATED IMAGES",
@@ -3056,7 +4190,7 @@ suitable for t-shirt printing, 768x1024 pixels, 300 DPI, RGB, transparent backgr
         header_label.pack(pady=(10, 5))
 
         # Refresh button with glow effect
-        button_font = font.Font(family="Courier New", size=9, weight="bold")
+        button_font = self.fonts['button_sm']
         refresh_btn = tk.Button(
             list_container,
             text="🔄 REFRESH",
@@ -3078,17 +4212,18 @@ suitable for t-shirt printing, 768x1024 pixels, 300 DPI, RGB, transparent backgr
         list_frame = tk.Frame(list_container, bg=SynthwaveColors.SECONDARY)
         list_frame.pack(fill='both', expand=True, padx=10, pady=(0, 10))
 
-        # Create listbox
-        self.file_listbox = tk.Listbox(
+        # Create virtualized listbox (only visible rows are drawn)
+        self.file_listbox = VirtualListbox(
             list_frame,
-            font=font.Font(family="Courier New", size=9),
+            font=self.fonts['mono9'],
             bg=SynthwaveColors.BACKGROUND,
             fg=SynthwaveColors.TEXT,
             selectbackground=SynthwaveColors.PRIMARY_ACCENT,
             selectforeground=SynthwaveColors.BACKGROUND,
             relief='flat',
             bd=0,
-            highlightthickness=0
+            highlightthickness=0,
+            width=250
         )
 
         # Scrollbar for listbox
@@ -3114,7 +4249,7 @@ suitable for t-shirt printing, 768x1024 pixels, 300 DPI, RGB, transparent backgr
         parent.add(viewer_container, minsize=400)
 
         # Header
-        header_font = font.Font(family="Courier New", size=12, weight="bold")
+        header_font = self.fonts['subheader']
         self.image_header_label = tk.Label(
             viewer_container,
             text="🖼️ IMAGE VIEWER",
@@ -3125,7 +4260,7 @@ suitable for t-shirt printing, 768x1024 pixels, 300 DPI, RGB, transparent backgr
         self.image_header_label.pack(pady=(10, 5))
 
         # Image info label
-        info_font = font.Font(family="Courier New", size=9)
+        info_font = self.fonts['mono9']
         self.image_info_label = tk.Label(
             viewer_container,
             text="Select an image from the list to view",
@@ -3135,6 +4270,21 @@ suitable for t-shirt printing, 768x1024 pixels, 300 DPI, RGB, transparent backgr
         )
         self.image_info_label.pack(pady=(0, 10))
 
+        # Preview scaling: BILINEAR from the cached thumbnail, or LANCZOS from the original
+        self.gallery_hq_var = tk.BooleanVar(value=False)
+        hq_check = tk.Checkbutton(
+            viewer_container,
+            text="High-quality preview",
+            variable=self.gallery_hq_var,
+            command=self.toggle_gallery_quality,
+            font=self.fonts['label'],
+            fg=SynthwaveColors.TEXT,
+            bg=SynthwaveColors.SECONDARY,
+            activebackground=SynthwaveColors.SECONDARY,
+            selectcolor=SynthwaveColors.PRIMARY_ACCENT
+        )
+        hq_check.pack(pady=(0, 5))
+
         # Scrollable image canvas
         canvas_frame = tk.Frame(viewer_container, bg=SynthwaveColors.BACKGROUND)
         canvas_frame.pack(fill='both', expand=True, padx=10, pady=(0, 10))
@@ -3153,6 +4303,9 @@ suitable for t-shirt printing, 768x1024 pixels, 300 DPI, RGB, transparent backgr
 
         self.image_canvas.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
 
+        # Single image item reused for every preview (see show_photo)
+        self._canvas_img_id = self.image_canvas.create_image(400, 300, anchor='center', tags='img')
+
         # Pack canvas and scrollbars
         self.image_canvas.pack(side="left", fill="both", expand=True)
         v_scrollbar.pack(side="right", fill="y")
@@ -3164,63 +4317,97 @@ suitable for t-shirt printing, 768x1024 pixels, 300 DPI, RGB, transparent backgr
         self.image_canvas.bind('<Button-5>', self.on_mousewheel)
 
     def refresh_gallery(self, preserve_selection=False):
-        """Refresh the file list with current images"""
+        """Refresh the file list with current images
+
+        Folders are scanned in batches on the Tk event loop so a large
+        directory doesn't freeze the GUI; apply_gallery_scan updates the
+        list once every folder is done.
+        """
+        if self._gallery_scan is not None:
+            # A scan is already running; queue one more (non-preserving wins)
+            if self._gallery_rescan is None:
+                self._gallery_rescan = preserve_selection
+            else:
+                self._gallery_rescan = self._gallery_rescan and preserve_selection
+            return
+
+        self._gallery_scan = self.gallery_scan_steps()
+        self._continue_gallery_scan(preserve_selection)
+
+    def _continue_gallery_scan(self, preserve_selection):
+        """Advance the running gallery scan by one batch, then yield back to Tk"""
         try:
-            # Store current selection if preserving
-            selected_file_path = None
-            selected_index = None
-            if preserve_selection:
-                selection = self.file_listbox.curselection()
-                if selection and selection[0] < len(self.gallery_images):
-                    selected_index = selection[0]
-                    selected_file_path = self.gallery_images[selected_index]['file_path']
+            next(self._gallery_scan)
+        except StopIteration as done:
+            self._gallery_scan = None
+            self.apply_gallery_scan(done.value, preserve_selection)
+
+            if self._gallery_rescan is not None:
+                rescan_preserve, self._gallery_rescan = self._gallery_rescan, None
+                self.refresh_gallery(rescan_preserve)
+            return
+        except Exception as e:
+            self._gallery_scan = None
+            logger.error("Gallery refresh failed: %s", e)
+            return
 
-            # Scan all output folders for images
-            import os
-            from pathlib import Path
+        self.root.after(0, self._continue_gallery_scan, preserve_selection)
 
-            new_gallery_images = []
+    def gallery_scan_steps(self):
+        """Generator that scans every output folder, yielding between batches
 
-            for folder_path in self.output_folders:
-                folder = Path(folder_path)
-                if folder.exists():
-                    # Find image files
-                    image_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.webp'}
-                    for image_file in folder.iterdir():
-                        if image_file.is_file() and image_file.suffix.lower() in image_extensions:
-                            # Add to list - showing just filename for better visibility
-                            folder_name = folder.name
-                            display_name = image_file.name
-
-                            new_gallery_images.append({
-                                'display_name': display_name,
-                                'file_path': str(image_file),
-                                'file_name': image_file.name,
-                                'folder': folder_name,
-                                'size': image_file.stat().st_size,
-                                'modified': image_file.stat().st_mtime
-                            })
+        Returns:
+            Image entries from all folders, newest first
+        """
+        folder_lists = []
+        for folder_path in self.output_folders:
+            folder_lists.append((yield from self.scan_gallery_folder(folder_path)))
+
+        # Each folder list is already newest-first, so a k-way merge replaces a full sort
+        return list(heapq.merge(*folder_lists, key=lambda x: x['modified'], reverse=True))
+
+    def apply_gallery_scan(self, new_gallery_images, preserve_selection):
+        """Show the result of a finished gallery scan"""
+        try:
+            if not self._stale_thumbs_checked:
+                # Drop thumbnails for files that were regenerated or deleted since last run
+                self._stale_thumbs_checked = True
+                valid_thumbs = {_thumb_stem(img['file_path'], img['modified']) for img in new_gallery_images}
+                self._thumb_pool.submit(self.evict_stale_thumbnails, valid_thumbs)
 
-            # Sort by modification time (newest first)
-            new_gallery_images.sort(key=lambda x: x['modified'], reverse=True)
+            # Store current selection if preserving
+            selected_file_path = None
+            if preserve_selection and self._active_index is not None and self._active_index < len(self.gallery_images):
+                selected_file_path = self.gallery_images[self._active_index]['file_path']
+
+            # Fingerprint the sorted (path, mtime) stream; also catches files rewritten in place
+            digest = hashlib.blake2b(digest_size=8)
+            for img_info in new_gallery_images:
+                digest.update(img_info['file_path'].encode())
+                digest.update(struct.pack('<d', img_info['modified']))
+            new_digest = digest.digest()
 
             # Check if anything actually changed (avoid unnecessary refresh)
-            if preserve_selection and len(new_gallery_images) == len(self.gallery_images):
-                # Quick check: same number of files with same paths
-                old_paths = [img['file_path'] for img in self.gallery_images]
-                new_paths = [img['file_path'] for img in new_gallery_images]
-                if old_paths == new_paths:
-                    # No changes, skip refresh to avoid disrupting user
-                    return
+            if preserve_selection and new_digest == self._gallery_digest:
+                # No changes, skip refresh to avoid disrupting user
+                return
 
             # Update gallery_images
             self.gallery_images = new_gallery_images
-            print(f"[DEBUG] Gallery refresh found {len(self.gallery_images)} images")
+            self._gallery_digest = new_digest
+            logger.debug("Gallery refresh found %d images", len(self.gallery_images))
 
-            # Refresh listbox with new items
-            self.file_listbox.delete(0, tk.END)
+            # Build thumbnails for new images in the background
             for img_info in self.gallery_images:
-                self.file_listbox.insert(tk.END, img_info['display_name'])
+                thumb_key = (img_info['file_path'], img_info['modified'])
+                if thumb_key not in self._thumbs_requested:
+                    self._thumbs_requested.add(thumb_key)
+                    self._thumb_pool.submit(self.generate_thumbnail, *thumb_key)
+
+            # Refresh listbox with new items in a single Tcl insert command
+            self.file_listbox.delete(0, tk.END)
+            self.file_listbox.insert(tk.END, *[img_info['display_name'] for img_info in self.gallery_images])
+            self._active_index = None
 
             # Restore selection if preserving
             if preserve_selection and selected_file_path:
@@ -3228,6 +4415,7 @@ suitable for t-shirt printing, 768x1024 pixels, 300 DPI, RGB, transparent backgr
                 for i, img_info in enumerate(self.gallery_images):
                     if img_info['file_path'] == selected_file_path:
                         self.file_listbox.select_set(i)
+                        self._active_index = i
                         self.file_listbox.see(i)  # Ensure it's visible
                         break
 
@@ -3236,7 +4424,130 @@ suitable for t-shirt printing, 768x1024 pixels, 300 DPI, RGB, transparent backgr
             self.image_header_label.config(text=f"🖼️ IMAGE VIEWER ({count} images)")
 
         except Exception as e:
-            print(f"[ERROR] Gallery refresh failed: {e}")
+            logger.error("Gallery refresh failed: %s", e)
+
+    def scan_gallery_folder(self, folder_path):
+        """Generator returning a folder's image entries (newest first), rescanning only when its mtime changed
+
+        Unchanged folders cost a single stat(). Within a changed folder, files
+        seen on the previous scan reuse their existing entry dict (and stat data),
+        and control is yielded back every _GALLERY_SCAN_BATCH directory entries.
+        """
+        try:
+            folder_mtime = os.stat(folder_path).st_mtime_ns
+        except OSError:
+            self._folder_mtime_cache.pop(folder_path, None)
+            self._folder_entries_cache.pop(folder_path, None)
+            return []
+
+        previous_entries = self._folder_entries_cache.get(folder_path, {})
+        if self._folder_mtime_cache.get(folder_path) == folder_mtime:
+            return list(previous_entries.values())
+
+        folder_name = os.path.basename(os.path.normpath(folder_path))
+        entries = {}
+        with os.scandir(folder_path) as it:
+            for count, entry in enumerate(it, 1):
+                if count % _GALLERY_SCAN_BATCH == 0:
+                    yield
+
+                name = entry.name
+                dot = name.rfind('.')
+                if dot < 0 or name[dot:].lower() not in _IMAGE_EXTS or not entry.is_file():
+                    continue
+
+                img_info = previous_entries.get(entry.path)
+                if img_info is None:
+                    stat_result = entry.stat()
+                    # Showing just the filename for better visibility
+                    img_info = {
+                        'display_name': entry.name,
+                        'file_path': entry.path,
+                        'file_name': entry.name,
+                        'folder': folder_name,
+                        'size': stat_result.st_size,
+                        'modified': stat_result.st_mtime
+                    }
+                entries[entry.path] = img_info
+
+        # Keep the cached dict in newest-first order so unchanged folders need no re-sort
+        entries = dict(sorted(entries.items(), key=lambda item: item[1]['modified'], reverse=True))
+        self._folder_mtime_cache[folder_path] = folder_mtime
+        self._folder_entries_cache[folder_path] = entries
+        return list(entries.values())
+
+    def start_gallery_watcher(self):
+        """Start a watchdog observer on the output folders
+
+        Returns:
+            True if every output folder is being watched, False to fall back to polling
+        """
+        if not WATCHDOG_AVAILABLE:
+            return False
+
+        if not all(os.path.isdir(folder_path) for folder_path in self.output_folders):
+            logger.info("Output folder missing, using polling refresh")
+            return False
+
+        try:
+            handler = GalleryEventHandler(self.on_gallery_folder_event)
+            observer = Observer()
+            observer.daemon = True
+            for folder_path in self.output_folders:
+                observer.schedule(handler, folder_path, recursive=False)
+            observer.start()
+        except Exception as e:
+            logger.warning("Could not start folder watcher, using polling refresh: %s", e)
+            return False
+
+        self._gallery_observer = observer
+        logger.info("Watching output folders for new images")
+        return True
+
+    def stop_gallery_watcher(self):
+        """Stop the output folder observer if it is running"""
+        observer = getattr(self, '_gallery_observer', None)
+        if observer is not None:
+            observer.stop()
+            observer.join(timeout=1.0)
+            self._gallery_observer = None
+
+    def on_gallery_folder_event(self):
+        """Called from the watchdog thread; hand the event to the GUI thread"""
+        self._designs_index_stale = True
+        self.queue.put({'type': 'gallery_changed'})
+
+    def handle_gallery_changed(self):
+        """Coalesce bursts of folder events into a single refresh 500ms later"""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.root.after(500, self._do_refresh)
+
+    def _do_refresh(self):
+        """Run a coalesced gallery refresh"""
+        self._refresh_pending = False
+        self.refresh_gallery(preserve_selection=True)
+
+    def generate_thumbnail(self, file_path, mtime):
+        """Worker-thread wrapper around _ensure_thumbnail that logs failures"""
+        try:
+            _ensure_thumbnail(file_path, mtime)
+        except Exception as e:
+            logger.warning("Thumbnail generation failed for %s: %s", file_path, e)
+
+    def evict_stale_thumbnails(self, valid_thumbs):
+        """Delete thumbnail files whose stem isn't in valid_thumbs"""
+        try:
+            with os.scandir(_THUMB_DIR) as it:
+                for entry in it:
+                    stem, suffix = os.path.splitext(entry.name)
+                    if suffix in _THUMB_SUFFIXES and stem not in valid_thumbs:
+                        os.remove(entry.path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("Thumbnail cleanup failed: %s", e)
 
     def schedule_gallery_refresh(self):
         """Schedule automatic gallery refresh"""
@@ -3251,107 +4562,152 @@ suitable for t-shirt printing, 768x1024 pixels, 300 DPI, RGB, transparent backgr
     def on_file_select(self, event):
         """Handle file selection from listbox"""
         try:
-            selection = self.file_listbox.curselection()
-            print(f"[DEBUG] File selection event triggered, selection: {selection}")
+            selection = event.widget.curselection()
+            self._active_index = selection[0] if selection else None
+            logger.debug("File selection event triggered, selection: %s", selection)
 
-            if selection:
-                index = selection[0]
-                print(f"[DEBUG] Selected index: {index}, total images: {len(self.gallery_images)}")
+            if self._active_index is not None:
+                index = self._active_index
+                logger.debug("Selected index: %d, total images: %d", index, len(self.gallery_images))
 
                 if index < len(self.gallery_images):
                     img_info = self.gallery_images[index]
-                    print(f"[DEBUG] Attempting to display: {img_info['display_name']}")
+                    logger.debug("Attempting to display: %s", img_info['display_name'])
                     self.display_image(img_info)
                 else:
-                    print(f"[WARNING] Index {index} out of range for {len(self.gallery_images)} images")
+                    logger.warning("Index %d out of range for %d images", index, len(self.gallery_images))
             else:
-                print(f"[DEBUG] No file selected")
+                logger.debug("No file selected")
 
-        except Exception as e:
-            print(f"[ERROR] File selection failed: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("File selection failed")
+
+    def toggle_gallery_quality(self):
+        """Switch preview scaling and redraw the selected image at the new quality"""
+        self.gallery_high_quality = self.gallery_hq_var.get()
+        if self._active_index is not None and self._active_index < len(self.gallery_images):
+            self.display_image(self.gallery_images[self._active_index])
 
     def display_image(self, img_info):
-        """Display the selected image in the viewer"""
-        try:
-            from PIL import Image, ImageTk
-            import os
+        """Display the selected image in the viewer
 
+        Cached previews are shown immediately; anything else is decoded on
+        the decode worker and shown by handle_image_decoded.
+        """
+        try:
             file_path = img_info['file_path']
-            print(f"[DEBUG] Attempting to display image: {file_path}")
+            logger.debug("Attempting to display image: %s", file_path)
 
             if not os.path.exists(file_path):
                 error_msg = f"❌ Image file not found: {file_path}"
-                print(f"[ERROR] {error_msg}")
+                logger.debug("File vanished: %s", file_path)
                 self.image_info_label.config(text=error_msg)
                 return
 
-            # Load and display image
-            pil_image = Image.open(file_path)
-            original_width, original_height = pil_image.size
-            print(f"[DEBUG] Original image size: {original_width}x{original_height}")
-
-            # Calculate display size (max 750x550 to fit in 800x600 canvas with padding)
-            max_width, max_height = 750, 550
-
-            ratio = min(max_width/original_width, max_height/original_height)
-            if ratio < 1:
-                new_width = int(original_width * ratio)
-                new_height = int(original_height * ratio)
-                display_image = pil_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                print(f"[DEBUG] Resized image to: {new_width}x{new_height}")
-            else:
-                display_image = pil_image
-                new_width, new_height = original_width, original_height
-                print(f"[DEBUG] Using original size: {new_width}x{new_height}")
+            if Image is None:
+                self.image_info_label.config(text="❌ Pillow not installed (pip install Pillow)")
+                return
 
-            # Convert to PhotoImage and maintain reference
-            self.current_photo = ImageTk.PhotoImage(display_image)
-            print(f"[DEBUG] PhotoImage created successfully")
+            # Supersede any decode still in flight for a previous selection
+            if self._pending_decode is not None:
+                self._pending_decode.cancel()
+                self._pending_decode = None
+
+            # Reuse a cached PhotoImage when this exact file version was shown recently
+            cache_key = (file_path, img_info['modified'], self.gallery_high_quality)
+            cached = self._photo_cache.get(cache_key)
+            if cached is not None:
+                self._photo_cache.move_to_end(cache_key)
+                logger.debug("Using cached PhotoImage")
+                self.show_photo(img_info, *cached)
+                return
 
-            # Clear canvas
-            self.image_canvas.delete("all")
+            self.image_info_label.config(text=f"⏳ Loading {img_info['display_name']}...")
+            future = self._decode_pool.submit(self._decode_for_display, img_info, self.gallery_high_quality)
+            self._pending_decode = future
+            future.add_done_callback(
+                lambda f: self.queue.put({'type': 'image_decoded', 'future': f, 'img_info': img_info}))
 
-            # Center the image in the canvas
-            canvas_width = self.image_canvas.winfo_width()
-            canvas_height = self.image_canvas.winfo_height()
+        except Exception as e:
+            error_msg = f"❌ Failed to load image: {str(e)}"
+            logger.exception("Image display failed")
+            self.image_info_label.config(text=error_msg)
 
-            # If canvas hasn't been drawn yet, use the configured size
-            if canvas_width <= 1:
-                canvas_width = 800
-            if canvas_height <= 1:
-                canvas_height = 600
+    def _decode_for_display(self, img_info, high_quality):
+        """Decode worker: scale to fit (max 750x550 to fit in 800x600 canvas with padding)"""
+        return _decode_thumb(img_info['file_path'], img_info['modified'], 750, 550, high_quality)
 
-            x_center = canvas_width // 2
-            y_center = canvas_height // 2
+    def handle_image_decoded(self, message):
+        """Turn a finished decode into a PhotoImage on the GUI thread"""
+        future = message['future']
+        if future is not self._pending_decode or future.cancelled():
+            return  # The user has already moved on to another image
+        self._pending_decode = None
 
-            # Place image at center
-            self.image_canvas.create_image(x_center, y_center, anchor="center", image=self.current_photo)
-            print(f"[DEBUG] Image placed at canvas center: ({x_center}, {y_center})")
+        img_info = message['img_info']
+        try:
+            display_image, original_size = future.result()
+            logger.debug("Original image size: %dx%d", *original_size)
 
-            # Update canvas scroll region to accommodate the image
-            bbox = self.image_canvas.bbox("all")
-            if bbox:
-                self.image_canvas.configure(scrollregion=bbox)
-                print(f"[DEBUG] Canvas scroll region set to: {bbox}")
+            # Convert to PhotoImage and keep a reference so Tk doesn't lose it
+            photo = ImageTk.PhotoImage(display_image)
+            cache_key = (img_info['file_path'], img_info['modified'], self.gallery_high_quality)
+            self._photo_cache[cache_key] = (photo, original_size)
+            if len(self._photo_cache) > 16:
+                self._photo_cache.popitem(last=False)
+            logger.debug("PhotoImage created successfully")
 
-            # Update info label
-            size_mb = img_info['size'] / (1024 * 1024)
-            info_text = f"📏 {original_width}x{original_height} | 💾 {size_mb:.1f}MB | 📁 {img_info['folder']}"
-            self.image_info_label.config(text=info_text)
-            print(f"[DEBUG] Info updated: {info_text}")
+            self.show_photo(img_info, photo, original_size)
 
-            self.current_image_path = file_path
-            print(f"[SUCCESS] Image displayed successfully: {os.path.basename(file_path)}")
+        except FileNotFoundError:
+            # Deleted between the gallery scan and the decode; the next refresh drops it
+            logger.debug("File vanished: %s", img_info['file_path'])
+            self.image_info_label.config(text=f"❌ Image file not found: {img_info['file_path']}")
 
         except Exception as e:
             error_msg = f"❌ Failed to load image: {str(e)}"
-            print(f"[ERROR] Image display failed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Image display failed")
             self.image_info_label.config(text=error_msg)
 
+    def show_photo(self, img_info, photo, original_size):
+        """Place a ready PhotoImage on the canvas and update the info label"""
+        self.current_photo = photo
+        original_width, original_height = original_size
+
+        # Center the image in the canvas
+        canvas_width = self.image_canvas.winfo_width()
+        canvas_height = self.image_canvas.winfo_height()
+
+        # If canvas hasn't been drawn yet, use the configured size
+        if canvas_width <= 1:
+            canvas_width = 800
+        if canvas_height <= 1:
+            canvas_height = 600
+
+        x_center = canvas_width // 2
+        y_center = canvas_height // 2
+
+        # Swap the image into the persistent canvas item and center it
+        self.image_canvas.itemconfigure(self._canvas_img_id, image=self.current_photo)
+        self.image_canvas.coords(self._canvas_img_id, x_center, y_center)
+        logger.debug("Image placed at canvas center: (%d, %d)", x_center, y_center)
+
+        # Update canvas scroll region to the image's extent, computed from its known size
+        new_width, new_height = photo.width(), photo.height()
+        scroll_region = (x_center - new_width // 2, y_center - new_height // 2,
+                         x_center + new_width // 2, y_center + new_height // 2)
+        self.image_canvas.configure(scrollregion=scroll_region)
+        logger.debug("Canvas scroll region set to: %s", scroll_region)
+
+        # Update info label
+        size_mb = img_info['size'] / (1024 * 1024)
+        info_text = f"📏 {original_width}x{original_height} | 💾 {size_mb:.1f}MB | 📁 {img_info['folder']}"
+        self.image_info_label.config(text=info_text)
+        logger.debug("Info updated: %s", info_text)
+
+        self.current_image_path = img_info['file_path']
+        logger.info("Image displayed successfully: %s", img_info['file_name'])
+
     def on_mousewheel(self, event):
         """Handle mouse wheel scrolling on image canvas"""
         if event.delta:
@@ -3381,6 +4737,7 @@ suitable for t-shirt printing, 768x1024 pixels, 300 DPI, RGB, transparent backgr
             if index >= 0 and index < len(self.gallery_images):
                 self.file_listbox.select_clear(0, tk.END)
                 self.file_listbox.select_set(index)
+                self._active_index = index
 
                 img_info = self.gallery_images[index]
 
@@ -3419,10 +4776,6 @@ suitable for t-shirt printing, 768x1024 pixels, 300 DPI, RGB, transparent backgr
     def open_with_dialog(self, file_path):
         """Open 'Open With' dialog for the selected file"""
         try:
-            import subprocess
-            import sys
-            import os
-
             if sys.platform.startswith('darwin'):  # macOS
                 subprocess.run(['open', '-a', 'Preview', file_path])
             elif sys.platform.startswith('win'):   # Windows
@@ -3437,11 +4790,6 @@ suitable for t-shirt printing, 768x1024 pixels, 300 DPI, RGB, transparent backgr
     def open_with_gimp(self, file_path):
         """Launch GIMP with the selected image file"""
         try:
-            import subprocess
-            import sys
-            import os
-            from pathlib import Path
-
             # Check if file exists before trying to launch GIMP
             file_path_obj = Path(file_path)
             if not file_path_obj.exists():
@@ -3451,56 +4799,19 @@ suitable for t-shirt printing, 768x1024 pixels, 300 DPI, RGB, transparent backgr
                 return
 
             print(f"[DEBUG] Opening with GIMP: {file_path}")
-            print(f"[DEBUG] File exists: {file_path_obj.exists()}")
             print(f"[DEBUG] Current working directory: {os.getcwd()}")
 
-            # Common GIMP executable names and paths by platform
-            gimp_paths = []
-
-            if sys.platform.startswith('darwin'):  # macOS
-                gimp_paths = [
-                    '/Volumes/Tikbalang2TB/Apps2/GIMP.app/Contents/MacOS/GIMP',
-                    '/Volumes/Tikbalang2TB/Apps2/GIMP-2.10.app/Contents/MacOS/GIMP',
-                    '/Applications/GIMP.app/Contents/MacOS/GIMP',
-                    '/Applications/GIMP-2.10.app/Contents/MacOS/GIMP',
-                    '/usr/local/bin/gimp',
-                    'gimp'
-                ]
-            elif sys.platform.startswith('win'):   # Windows
-                gimp_paths = [
-                    'C:\\Program Files\\GIMP 2\\bin\\gimp-2.10.exe',
-                    'C:\\Program Files (x86)\\GIMP 2\\bin\\gimp-2.10.exe',
-                    'C:\\Program Files\\GIMP\\bin\\gimp.exe',
-                    'C:\\Program Files (x86)\\GIMP\\bin\\gimp.exe',
-                    'gimp'
-                ]
-            else:  # Linux
-                gimp_paths = [
-                    '/usr/bin/gimp',
-                    '/usr/local/bin/gimp',
-                    '/snap/bin/gimp',
-                    '/usr/bin/gimp-2.10',
-                    'gimp'
-                ]
-
-            # Try to find and launch GIMP (non-blocking)
+            # Locate GIMP once per session and launch it in the background
+            gimp_path = _find_gimp()
             gimp_found = False
-            for gimp_path in gimp_paths:
+            if gimp_path:
                 try:
-                    if gimp_path == 'gimp':
-                        # Try system PATH - launch in background
-                        subprocess.Popen([gimp_path, file_path])
-                        gimp_found = True
-                        print(f"[INFO] Launched GIMP from PATH: {file_path}")
-                        break
-                    elif Path(gimp_path).exists():
-                        # Try specific path - launch in background
-                        subprocess.Popen([gimp_path, file_path])
-                        gimp_found = True
-                        print(f"[INFO] Launched GIMP from {gimp_path}: {file_path}")
-                        break
-                except (subprocess.SubprocessError, FileNotFoundError, OSError):
-                    continue
+                    subprocess.Popen([gimp_path, file_path])
+                    gimp_found = True
+                    print(f"[INFO] Launched GIMP from {gimp_path}: {file_path}")
+                except (subprocess.SubprocessError, OSError):
+                    # Stale cached location (e.g. GIMP was uninstalled); probe again next time
+                    _forget_gimp_path()
 
             if not gimp_found:
                 # If GIMP not found, show helpful error message
@@ -3516,7 +4827,7 @@ Common installation locations:
 Or ensure GIMP is in your system PATH."""
 
                 messagebox.showwarning("GIMP Not Found", error_msg)
-                print(f"[WARNING] GIMP not found. Checked paths: {gimp_paths}")
+                print(f"[WARNING] GIMP not found. Checked paths: {list(_gimp_candidates())} and PATH")
 
         except Exception as e:
             print(f"[ERROR] GIMP launch failed: {e}")
@@ -3525,10 +4836,6 @@ Or ensure GIMP is in your system PATH."""
     def show_in_finder(self, file_path):
         """Show file in Finder/Explorer"""
         try:
-            import subprocess
-            import sys
-            import os
-
             if sys.platform.startswith('darwin'):  # macOS
                 subprocess.run(['open', '-R', file_path])
             elif sys.platform.startswith('win'):   # Windows
@@ -3551,8 +4858,6 @@ Or ensure GIMP is in your system PATH."""
     def show_file_properties(self, img_info):
         """Show file properties dialog"""
         try:
-            import datetime
-
             # Format file size
             size_bytes = img_info['size']
             if size_bytes < 1024:
@@ -3563,7 +4868,7 @@ Or ensure GIMP is in your system PATH."""
                 size_str = f"{size_bytes/(1024*1024):.1f} MB"
 
             # Format modification time
-            mod_time = datetime.datetime.fromtimestamp(img_info['modified'])
+            mod_time = datetime.fromtimestamp(img_info['modified'])
             mod_str = mod_time.strftime("%Y-%m-%d %H:%M:%S")
 
             # Show properties
@@ -3580,50 +4885,52 @@ Modified: {mod_str}"""
         except Exception as e:
             print(f"[ERROR] Properties dialog failed: {e}")
 
-    def refresh_available_models(self):
-        """Refresh the list of available models from LMStudio API"""
-        try:
-            self.model_status_label.config(text="Status: Loading models...", fg=SynthwaveColors.WARNING)
-            self.root.update_idletasks()
+    def refresh_available_models(self, on_complete=None):
+        """Refresh the list of available models from LMStudio API
 
-            # Import lmstudio to get available models
-            import lmstudio as lms
+        The LMStudio call runs on a worker thread; the combobox is filled by
+        populate_models on the GUI thread, which then calls on_complete.
+        """
+        if lms is None:
+            self.model_status_label.config(
+                text="Status: LMStudio not available (lmstudio package not found)",
+                fg=SynthwaveColors.ERROR
+            )
+            logger.error("lmstudio package not found. Please install: pip install lmstudio")
+            return
+
+        self.model_status_label.config(text="Status: Loading models...", fg=SynthwaveColors.WARNING)
 
-            # Get list of downloaded models
-            downloaded_models = lms.list_downloaded_models()
+        # Get list of downloaded models without blocking the GUI
+        future = self._lmstudio_pool.submit(lms.list_downloaded_models)
+        future.add_done_callback(
+            lambda f: self.queue.put({'type': 'models_listed', 'future': f, 'on_complete': on_complete}))
+
+    def populate_models(self, message):
+        """Fill the model combobox from a finished list_downloaded_models call"""
+        try:
+            downloaded_models = message['future'].result()
 
             if downloaded_models:
                 # Extract model keys/names
-                model_names = []
-                for model in downloaded_models:
-                    # Handle different possible formats from the API
-                    if isinstance(model, dict):
-                        model_key = model.get('key', model.get('name', str(model)))
-                    else:
-                        # Try to extract model_key attribute if it exists (for DownloadedLlm objects)
-                        if hasattr(model, 'model_key'):
-                            model_key = model.model_key
-                        else:
-                            model_key = str(model)
-                    model_names.append(model_key)
-
-                # Update available models
-                self.available_models = model_names
-                self.model_combobox['values'] = self.available_models
+                self.available_models = list(map(_model_key, downloaded_models))
+                self.update_model_health_labels()
 
                 # Set current selection to fallback model if it exists in the list
                 fallback_model = self.current_model_var.get()
                 if fallback_model in self.available_models:
                     self.model_combobox.set(fallback_model)
                 elif self.available_models:
-                    # If fallback not available, use first available model
-                    self.model_combobox.set(self.available_models[0])
+                    # If fallback not available, prefer the first model that hasn't been failing
+                    healthy = [name for name in self.available_models
+                               if self.failure_rate_60s(name) <= _HEALTH_MAX_FAIL_RATE]
+                    self.model_combobox.set((healthy or self.available_models)[0])
 
                 self.model_status_label.config(
                     text=f"Status: Found {len(self.available_models)} available models",
                     fg=SynthwaveColors.SUCCESS
                 )
-                print(f"[INFO] Loaded {len(self.available_models)} available models")
+                logger.info("Loaded %d available models", len(self.available_models))
 
             else:
                 self.available_models = []
@@ -3632,43 +4939,69 @@ Modified: {mod_str}"""
                     text="Status: No models found in LMStudio",
                     fg=SynthwaveColors.ERROR
                 )
-                print("[WARNING] No models found in LMStudio")
-
-        except ImportError:
-            self.model_status_label.config(
-                text="Status: LMStudio not available (lmstudio package not found)",
-                fg=SynthwaveColors.ERROR
-            )
-            print("[ERROR] lmstudio package not found. Please install: pip install lmstudio")
+                logger.warning("No models found in LMStudio")
 
         except Exception as e:
             self.model_status_label.config(
                 text=f"Status: Error loading models - {str(e)}",
                 fg=SynthwaveColors.ERROR
             )
-            print(f"[ERROR] Failed to refresh models: {e}")
+            logger.exception("Failed to refresh models")
+
+        if message.get('on_complete'):
+            message['on_complete']()
 
     def load_selected_model(self):
-        """Load the selected model in LMStudio"""
-        try:
-            selected_model = self.model_combobox.get()
-            if not selected_model:
-                self.model_status_label.config(
-                    text="Status: No model selected",
-                    fg=SynthwaveColors.WARNING
-                )
-                return
+        """Load the selected model in LMStudio
+
+        The blocking lms.llm() call runs on the model load worker; the result
+        is applied on the GUI thread by _on_model_loaded.
+        """
+        selected_model = _strip_health_label(self.model_combobox.get())
+        if not selected_model:
+            self.model_status_label.config(
+                text="Status: No model selected",
+                fg=SynthwaveColors.WARNING
+            )
+            return
+
+        if lms is None:
+            self.set_model_state(ModelState.FAILED, "LMStudio not available")
+            logger.error("lmstudio package not found")
 
-            # Set loading state
-            self.set_model_state(ModelState.LOADING, f"Loading {selected_model}...")
-            self.root.update_idletasks()
+            self.show_user_notification(
+                "LMStudio Not Available",
+                "LMStudio package not found. Please install it with:\npip install lmstudio",
+                "error"
+            )
+            return
 
-            # Import lmstudio to load the model
-            import lmstudio as lms
+        if selected_model in self._queued_loads:
+            logger.info("Already loading %s, ignoring repeated request", selected_model)
+            return
 
-            # Load the new model instance
-            print(f"[INFO] Loading model: {selected_model}")
-            model_instance = lms.llm(selected_model)
+        # Set loading state
+        self.set_model_state(ModelState.LOADING, f"Loading {selected_model}...")
+
+        # Load the new model instance in the background
+        logger.info("Loading model: %s", selected_model)
+        self._queued_loads.add(selected_model)
+        self.submit_model_load(self._load_model, selected_model,
+                               callback=lambda future: self._on_model_loaded(future, selected_model))
+
+    def submit_model_load(self, fn, *args, callback, **kwargs):
+        """Run a blocking model load on the worker and hand the future to callback on the GUI thread"""
+        future = _MODEL_LOAD_POOL.submit(fn, *args, **kwargs)
+        future.add_done_callback(
+            lambda f: self.call_soon(callback, f))
+        return future
+
+    def _on_model_loaded(self, future, selected_model):
+        """Install a model loaded by load_selected_model (GUI thread)"""
+        self._queued_loads.discard(selected_model)
+        self.update_model_health_labels()
+        try:
+            model_instance = future.result()
 
             # Store the model instance
             self.current_model_instance = model_instance
@@ -3676,14 +5009,8 @@ Modified: {mod_str}"""
             # Update the current model display
             self.current_model_var.set(selected_model)
 
-            # Update the transformer to use the new model instance
-            if self.llm_transformer:
-                self.llm_transformer.update_model(model_instance, selected_model)
-                print(f"[INFO] Updated transformer with new model: {selected_model}")
-            else:
-                # Create new transformer with the model instance
-                self.llm_transformer = TShirtPromptTransformer(model_instance=model_instance)
-                print(f"[INFO] Created new transformer with model: {selected_model}")
+            # Point the transformer at the new model instance
+            self._bind_transformer(model_instance, selected_model)
 
             # Set loaded state
             self.set_model_state(ModelState.LOADED, f"Successfully loaded {selected_model}")
@@ -3691,29 +5018,21 @@ Modified: {mod_str}"""
             # Save model preferences after successful load
             self.save_model_preferences()
 
-            print(f"[SUCCESS] Model loaded and transformer updated: {selected_model}")
-
-        except ImportError:
-            self.set_model_state(ModelState.FAILED, "LMStudio not available")
-            print("[ERROR] lmstudio package not found")
-
-            self.show_user_notification(
-                "LMStudio Not Available",
-                "LMStudio package not found. Please install it with:\npip install lmstudio",
-                "error"
-            )
+            logger.info("Model loaded and transformer updated: %s", selected_model)
 
         except Exception as e:
             error_msg = str(e)
-            print(f"[ERROR] Failed to load model {selected_model}: {e}")
+            logger.error("Failed to load model %s: %s", selected_model, e)
 
-            # Check if this is a recoverable error and attempt fallback
-            if any(keyword in error_msg.lower() for keyword in ['model not found', 'connection', 'timeout', 'network']):
-                print(f"[ERROR RECOVERY] Detected recoverable error, attempting fallback...")
+            # A failed reload of the installed model means its old handle is dead too;
+            # a different model failing leaves the working one alone
+            if selected_model == self._current_model_name():
+                self._release_model(self.current_model_instance)
 
-                if not self.attempt_fallback_model():
-                    # Fallback also failed
-                    self.set_model_state(ModelState.FAILED, f"Failed to load {selected_model} and fallback failed")
+            # Check if this is a recoverable error and attempt fallback
+            if _RECOVERABLE_ERROR_RE.search(error_msg):
+                logger.info("Detected recoverable error, attempting fallback...")
+                self.start_fallback_model_load(selected_model)
             else:
                 # Non-recoverable error
                 self.set_model_state(ModelState.FAILED, f"Failed to load {selected_model} - {error_msg}")
@@ -3726,34 +5045,75 @@ Modified: {mod_str}"""
     def set_model_state(self, state, message=None):
         """Update model state and display status
 
+        Safe to call from worker threads: only the GUI thread touches the label.
+
         Args:
             state: ModelState constant
             message: Optional custom message for status display
         """
-        self.current_model_state = state
+        with self._state_lock:
+            if state == self.current_model_state and message == self._last_state_message:
+                return
+            self.current_model_state = state
+            self._last_state_message = message
+            self._pending_state = (f"Status: {message or state.title()}",
+                                   _STATE_COLORS.get(state, SynthwaveColors.TEXT))
+        logger.debug("Model state %s: %s", state, message or 'State changed')
 
-        # Update status display based on state
-        if hasattr(self, 'model_status_label'):
-            if message:
-                status_text = f"Status: {message}"
-            else:
-                status_text = f"Status: {state.title()}"
-
-            # Set color based on state
-            if state == ModelState.LOADED:
-                color = SynthwaveColors.SUCCESS
-            elif state in [ModelState.LOADING, ModelState.RECONNECTING]:
-                color = SynthwaveColors.WARNING
-            elif state == ModelState.FAILED:
-                color = SynthwaveColors.ERROR
-            elif state == ModelState.ACTIVE:
-                color = SynthwaveColors.NEON_CYAN
-            else:
-                color = SynthwaveColors.TEXT
+        if self.root is None:
+            return
+        if threading.current_thread() is threading.main_thread():
+            self.schedule_state_flush()
+        else:
+            self.call_soon(self.schedule_state_flush)
 
-            self.model_status_label.config(text=status_text, fg=color)
+    def _release_model(self, model_instance):
+        """Drop our references to model_instance so its client handles can be reclaimed (GUI thread)
 
-        print(f"[MODEL STATE] {state}: {message or 'State changed'}")
+        Only the given instance is released, and only while it is still the
+        current one; a model that is working is never dropped because some
+        other load failed. The transformer itself is kept (without a model)
+        so the next load can reuse it.
+        """
+        if model_instance is None or model_instance is not self.current_model_instance:
+            return
+        self.current_model_instance = None
+        self.served_fallback_model = None
+        if self.llm_transformer is not None and self.llm_transformer.model is model_instance:
+            self.llm_transformer.model = None
+        gc.collect()
+
+    def _current_model_name(self):
+        """Name of the installed model, without the "(fallback ...)" suffix"""
+        return self.current_model_var.get().split(" (fallback")[0]
+
+    def unload_current_model(self):
+        """Unload the current model from LMStudio and release it (GUI thread)"""
+        model_instance = self.current_model_instance
+        if model_instance is None:
+            self.set_model_state(ModelState.UNLOADED, "No model loaded")
+            return
+
+        model_name = self._current_model_name()
+        logger.info("Unloading model: %s", model_name)
+        self.set_model_state(ModelState.UNLOADED, f"Unloaded {model_name}")
+        self._release_model(model_instance)
+        self._lmstudio_pool.submit(_unload_model, model_instance)
+
+    def schedule_state_flush(self):
+        """Repaint the status label once per idle pass, however many transitions happen before it (GUI thread)"""
+        if not self._state_flush_queued:
+            self._state_flush_queued = True
+            self.root.after_idle(self._flush_state)
+
+    def _flush_state(self):
+        """Apply the most recent pending model state to the status label"""
+        self._state_flush_queued = False
+        with self._state_lock:
+            pending, self._pending_state = self._pending_state, None
+        if pending is not None and hasattr(self, 'model_status_label'):
+            status_text, color = pending
+            self.model_status_label.config(text=status_text, fg=color)
 
     def validate_model_health(self):
         """Perform health check on current model
@@ -3762,28 +5122,28 @@ Modified: {mod_str}"""
             bool: True if model is healthy, False otherwise
         """
         if self.current_model_state == ModelState.UNLOADED:
-            print("[MODEL HEALTH] No model loaded")
+            logger.debug("Health check: no model loaded")
             return False
 
         if not self.current_model_instance:
-            print("[MODEL HEALTH] No model instance available")
+            logger.warning("Health check: no model instance available")
             self.set_model_state(ModelState.FAILED, "Model instance lost")
             return False
 
         try:
-            if self.llm_transformer and hasattr(self.llm_transformer, 'validate_model'):
+            if self.llm_transformer and self._transformer_caps.get('validate_model'):
                 is_valid = self.llm_transformer.validate_model()
                 if not is_valid:
                     self.set_model_state(ModelState.FAILED, "Model validation failed")
                     return False
                 else:
-                    print("[MODEL HEALTH] Model validation passed")
+                    logger.debug("Model validation passed")
                     return True
             else:
-                print("[MODEL HEALTH] No transformer available for validation")
+                logger.debug("Health check: no transformer available for validation")
                 return False
         except Exception as e:
-            print(f"[MODEL HEALTH] Health check failed: {e}")
+            logger.exception("Model health check failed")
             self.set_model_state(ModelState.FAILED, f"Health check failed: {str(e)}")
             return False
 
@@ -3793,26 +5153,44 @@ Modified: {mod_str}"""
             if self.current_model_state == ModelState.ACTIVE:
                 # Set back to loaded state after use
                 self.set_model_state(ModelState.LOADED, "Model ready for next use")
-                print("[MODEL LIFECYCLE] Model returned to ready state")
+                logger.debug("Model returned to ready state")
 
-            # Note: We don't actually delete the model instance as it may be reused
-            # Just mark it as no longer active
+            # Note: We don't delete a working model instance as it may be reused;
+            # it is released on unload or when reloading that same model fails
         except Exception as e:
-            print(f"[MODEL LIFECYCLE] Cleanup warning: {e}")
+            logger.warning("Model cleanup warning: %s", e)
 
     def refresh_model_connection(self):
         """Attempt to refresh/reconnect model if needed
 
+        While the LMStudio breaker is open this gives up immediately unless
+        the last probe was a reset_timeout ago.
+
         Returns:
             bool: True if model is ready, False if failed
         """
+        if self._lms_breaker.state == CircuitBreaker.OPEN:
+            now = time.monotonic()
+            if now - self._last_probe_ts < self._lms_breaker.reset_timeout:
+                return False
+            self._last_probe_ts = now
+
         try:
-            # Check if we have a valid model
+            if self.llm_transformer and self._transformer_caps.get('check_and_reconnect'):
+                # One call validates and, only if needed, reconnects
+                state, status, ready = _RECONNECT_OUTCOMES[self.llm_transformer.check_and_reconnect()]
+                if state == ModelState.LOADED:
+                    self.current_model_instance = self.llm_transformer.model
+                if state is not None:
+                    self.set_model_state(state, status)
+                return ready
+
+            # Transformers without check_and_reconnect: validate, then reconnect
             if self.validate_model_health():
                 return True
 
             # If validation failed, try to reconnect
-            if self.llm_transformer and hasattr(self.llm_transformer, 'reconnect_model'):
+            if self.llm_transformer and self._transformer_caps.get('reconnect_model'):
                 self.set_model_state(ModelState.RECONNECTING, "Attempting to reconnect model...")
 
                 if self.llm_transformer.reconnect_model():
@@ -3822,101 +5200,335 @@ Modified: {mod_str}"""
                     self.set_model_state(ModelState.FAILED, "Model reconnection failed")
                     return False
             else:
-                print("[MODEL REFRESH] No reconnection method available")
+                logger.warning("Model refresh: no reconnection method available")
                 return False
 
         except Exception as e:
-            print(f"[MODEL REFRESH] Failed to refresh model connection: {e}")
+            logger.exception("Failed to refresh model connection")
             self.set_model_state(ModelState.FAILED, f"Refresh failed: {str(e)}")
             return False
 
+    def schedule_half_open_probe(self):
+        """Probe LMStudio once reset_timeout after the shared breaker opened (GUI thread)"""
+        self.root.after(int(self._lms_breaker.reset_timeout * 1000), self._half_open_probe)
+
+    def _half_open_probe(self):
+        """Check in the background whether LMStudio recovered while the breaker was open"""
+        if self._lms_breaker.state != CircuitBreaker.OPEN:
+            return  # Already recovered through a load
+        self._lmstudio_pool.submit(self._run_half_open_probe)
+
+    def _run_half_open_probe(self):
+        """One real LMStudio call as the half-open trial
+
+        Success closes the breaker; a failure re-opens it, which schedules
+        the next probe through on_open.
+        """
+        logger.info("Probing LMStudio after circuit breaker opened")
+        try:
+            _probe_lmstudio(self._lms_breaker)
+        except CircuitOpenError:
+            # Another call failed since this probe was scheduled; its on_open scheduled the next probe
+            logger.debug("LMStudio breaker re-opened, skipping this probe")
+        except Exception as e:
+            logger.warning("LMStudio probe failed: %s", e)
+        else:
+            logger.info("LMStudio is reachable again")
+
     def attempt_fallback_model(self):
-        """Attempt to load fallback model when selected model fails
+        """Attempt to load a model from the fallback chain when the selected model fails
+
+        Blocks until the load finishes, so only call this from a background
+        thread (e.g. enhanced_model_error_recovery during transformation);
+        the GUI thread uses start_fallback_model_load instead.
 
         Returns:
             bool: True if fallback successful, False otherwise
         """
+        if not self._can_load_fallback():
+            return False
+
+        logger.info("Attempting fallback chain: %s", self.fallback_chain)
+        self.set_model_state(ModelState.LOADING, "Loading fallback model...")
+
         try:
-            if not self.default_fallback_model:
-                print("[FALLBACK] No default fallback model configured")
-                return False
+            self._install_fallback_model(*self._load_fallback_chain())
+            return True
+        except Exception as e:
+            self._report_fallback_failure(e)
+            return False
 
-            print(f"[FALLBACK] Attempting to load fallback model: {self.default_fallback_model}")
-            self.set_model_state(ModelState.LOADING, f"Loading fallback model: {self.default_fallback_model}")
+    def start_fallback_model_load(self, failed_model):
+        """Load from the fallback chain on the worker after failed_model could not be loaded (GUI thread)"""
+        if not self._can_load_fallback():
+            # Fallback also failed
+            self.set_model_state(ModelState.FAILED, f"Failed to load {failed_model} and fallback failed")
+            return
 
-            # Import lmstudio to load the fallback model
-            import lmstudio as lms
+        logger.info("Attempting fallback chain: %s", self.fallback_chain)
+        self.set_model_state(ModelState.LOADING, "Loading fallback model...")
+        self.submit_model_load(self._load_fallback_chain, callback=self._on_fallback_loaded)
 
-            # Load the fallback model instance
-            fallback_instance = lms.llm(self.default_fallback_model)
+    def _on_fallback_loaded(self, future):
+        """Install the fallback model, or report that the whole chain failed (GUI thread)"""
+        self.update_model_health_labels()
+        try:
+            self._install_fallback_model(*future.result())
+        except Exception as e:
+            self._report_fallback_failure(e)
 
-            # Store the model instance
-            self.current_model_instance = fallback_instance
+    def _can_load_fallback(self):
+        """Check that a fallback chain is configured and lmstudio is importable"""
+        if not self.fallback_chain:
+            logger.warning("No fallback models configured")
+            return False
+
+        if lms is None:
+            logger.warning("Fallback unavailable: lmstudio package not found")
+            return False
+
+        return True
+
+    def _load_budget(self):
+        """Timeout/retry settings for lms.llm() from the model preferences"""
+        config = getattr(self, 'model_config', None) or {}
+        return {
+            'timeout': float(config.get('load_timeout', _DEFAULT_LOAD_BUDGET['timeout'])),
+            'max_retries': int(config.get('load_max_retries', _DEFAULT_LOAD_BUDGET['max_retries'])),
+            'base_backoff': float(config.get('load_base_backoff', _DEFAULT_LOAD_BUDGET['base_backoff'])),
+        }
+
+    def _model_breaker(self, model_name):
+        """Per-model circuit breaker, so a model that keeps failing is skipped for a while"""
+        breaker = self._model_breakers.get(model_name)
+        if breaker is None:
+            breaker = self._model_breakers.setdefault(
+                model_name, CircuitBreaker(fail_threshold=2, reset_timeout=30.0, name=model_name))
+        return breaker
+
+    def _load_model(self, model_name):
+        """Load model_name, or wait for a load of it already running on another thread (blocking)
 
-            # Update the transformer to use the fallback model
-            if self.llm_transformer:
-                self.llm_transformer.update_model(fallback_instance, self.default_fallback_model)
+        Concurrent requests for the same model share one lms.llm() call, so
+        recovery paths racing each other don't instantiate the model twice.
+        """
+        with self._inflight_lock:
+            future = self._inflight_loads.get(model_name)
+            owner = future is None
+            if owner:
+                future = self._inflight_loads[model_name] = concurrent.futures.Future()
+
+        if not owner:
+            logger.info("Joining in-flight load of %s", model_name)
+            return future.result()
+
+        try:
+            instance = self._load_model_tracked(model_name)
+        except BaseException as e:
+            with self._inflight_lock:
+                del self._inflight_loads[model_name]
+            future.set_exception(e)
+            raise
+        with self._inflight_lock:
+            del self._inflight_loads[model_name]
+        future.set_result(instance)
+        return instance
+
+    def _load_model_tracked(self, model_name):
+        """Load model_name behind the shared and per-model breakers, recording the outcome (blocking)"""
+        try:
+            instance = _do_load(model_name, self._lms_breaker, self._model_breaker(model_name),
+                                **self._load_budget())
+        except CircuitOpenError:
+            # Rejected without trying lms.llm(), so it says nothing new about the model
+            raise
+        except Exception:
+            self._model_health[model_name].append((time.monotonic(), False))
+            raise
+        self._model_health[model_name].append((time.monotonic(), True))
+        return instance
+
+    def failure_rate_60s(self, model_name):
+        """Share of model_name's loads that failed within the last _HEALTH_WINDOW seconds (0.0 if none)"""
+        if model_name not in self._model_health:
+            return 0.0
+        cutoff = time.monotonic() - _HEALTH_WINDOW
+        recent = [ok for ts, ok in list(self._model_health[model_name]) if ts >= cutoff]
+        if not recent:
+            return 0.0
+        return recent.count(False) / len(recent)
+
+    def update_model_health_labels(self):
+        """Mark models that have been failing in the model combobox (GUI thread)"""
+        if not hasattr(self, 'model_combobox'):
+            return
+        labels = []
+        for name in self.available_models:
+            rate = self.failure_rate_60s(name)
+            if rate > _HEALTH_MAX_FAIL_RATE:
+                labels.append(f"{name}{_HEALTH_LABEL_SEP}{rate:.0%} fail")
             else:
-                # Create new transformer with the fallback model
-                self.llm_transformer = TShirtPromptTransformer(model_instance=fallback_instance)
+                labels.append(name)
+        self.model_combobox['values'] = labels
 
-            # Update the current model display to show fallback
-            self.current_model_var.set(f"{self.default_fallback_model} (fallback)")
+    def _load_fallback_chain(self):
+        """Try each fallback model in order, skipping ones whose breaker is open or that keep failing (blocking)
 
-            # Set loaded state with fallback indication
-            self.set_model_state(ModelState.LOADED, f"Fallback model loaded: {self.default_fallback_model}")
+        Returns:
+            tuple: (model instance, model name, position in the chain)
+        """
+        last_error = None
+        for i, name in enumerate(self.fallback_chain):
+            if self._model_breaker(name).is_open():
+                logger.info("Skipping fallback %s: failed recently", name)
+                continue
 
-            print(f"[FALLBACK] Successfully loaded fallback model: {self.default_fallback_model}")
+            rate = self.failure_rate_60s(name)
+            if rate > _HEALTH_MAX_FAIL_RATE:
+                logger.info("Skipping fallback %s: %.0f%% of loads failed in the last %.0fs", name, rate * 100, _HEALTH_WINDOW)
+                continue
 
-            # Show user notification about fallback
-            self.show_user_notification(
-                "Model Fallback",
-                f"Selected model failed to load. Using fallback model:\n{self.default_fallback_model}",
-                "warning"
-            )
+            try:
+                logger.info("Trying fallback #%d: %s", i, name)
+                return self._load_model(name), name, i
+            except Exception as e:
+                logger.warning("Fallback #%d %s failed: %s", i, name, e)
+                last_error = e
 
-            return True
+        raise last_error or RuntimeError("All fallback models failed recently")
 
-        except Exception as e:
-            print(f"[FALLBACK] Failed to load fallback model: {e}")
-            self.set_model_state(ModelState.FAILED, f"Fallback model failed: {str(e)}")
+    def _set_transformer(self, transformer):
+        """Install transformer and note once which optional recovery methods it supports"""
+        self.llm_transformer = transformer
+        if transformer is None:
+            self._transformer_caps = {}
+        else:
+            self._transformer_caps = {
+                'validate_model': callable(getattr(transformer, 'validate_model', None)),
+                'reconnect_model': callable(getattr(transformer, 'reconnect_model', None)),
+                'check_and_reconnect': callable(getattr(transformer, 'check_and_reconnect', None)),
+            }
 
-            # Show error notification
-            self.show_user_notification(
-                "Model Error",
-                f"Both selected and fallback models failed to load.\nPlease check LMStudio status.",
-                "error"
-            )
+    def _bind_transformer(self, model_instance, model_name):
+        """Swap model_instance into the existing transformer, creating one only the first time
 
-            return False
+        update_model just rebinds the model reference, so the transformer's
+        own setup runs once per process rather than on every (fallback) load.
+        The transformer reconnects through _load_model, so its reconnects go
+        through the same breakers, load budget and in-flight dedupe.
+        """
+        if self.llm_transformer is None:
+            self._set_transformer(TShirtPromptTransformer(
+                model_instance=model_instance, model_name=model_name, loader=self._load_model))
+            logger.info("Created new transformer with model: %s", model_name)
+        else:
+            self.llm_transformer.update_model(model_instance, model_name)
+            logger.info("Updated transformer with new model: %s", model_name)
+
+    def _install_fallback_model(self, fallback_instance, model_name, chain_index):
+        """Make a freshly loaded fallback model the active one"""
+        # Store the model instance and which fallback served it
+        self.current_model_instance = fallback_instance
+        self.served_fallback_model = model_name
+
+        # Point the transformer at the fallback model
+        self._bind_transformer(fallback_instance, model_name)
+
+        # Update the current model display to show fallback
+        self.current_model_var.set(f"{model_name} (fallback #{chain_index})")
+
+        # Set loaded state with fallback indication
+        self.set_model_state(ModelState.LOADED, f"Fallback model loaded: {model_name}")
+
+        logger.info("Loaded fallback model #%d: %s", chain_index, model_name)
+
+        # Show user notification about fallback
+        self.show_user_notification(
+            "Model Fallback",
+            f"Selected model failed to load. Using fallback model:\n{model_name}",
+            "warning"
+        )
 
-    def show_user_notification(self, title, message, type="info"):
+    def _report_fallback_failure(self, error):
+        """Mark the model as failed after every fallback model failed too"""
+        logger.error("Failed to load fallback model: %s", error)
+        self.set_model_state(ModelState.FAILED, f"Fallback model failed: {str(error)}")
+
+        # Show error notification
+        self.show_user_notification(
+            "Model Error",
+            f"Both selected and fallback models failed to load.\nPlease check LMStudio status.",
+            "error"
+        )
+
+    def show_user_notification(self, title, message, type="info", critical=False):
         """Show user notification with model state information
 
+        Notifications appear as a toast that dismisses itself, so recovery
+        keeps running while the user reads them; critical=True uses a modal
+        message box instead. Safe to call from worker threads.
+
         Args:
             title: Notification title
             message: Notification message
             type: Notification type ("info", "warning", "error")
+            critical: Block with a message box until the user acknowledges it
         """
+        if threading.current_thread() is not threading.main_thread():
+            self.call_soon(self.show_user_notification, title, message, type, critical)
+            return
+
         try:
             # Log to console
-            print(f"[USER NOTIFICATION] {title}: {message}")
+            logger.info("User notification %s: %s", title, message)
 
             # Log to scan results for user visibility
             if hasattr(self, 'write_to_scan_results'):
                 icon = "ℹ️" if type == "info" else "⚠️" if type == "warning" else "❌"
                 self.write_to_scan_results(f"{icon} {title}: {message}")
 
-            # Show message box for important notifications
-            if type == "error":
+            if not critical:
+                self._toast(title, message, _NOTIFICATION_COLORS.get(type, SynthwaveColors.NEON_CYAN))
+            elif type == "error":
                 messagebox.showerror(title, message)
             elif type == "warning":
                 messagebox.showwarning(title, message)
             else:
                 messagebox.showinfo(title, message)
 
-        except Exception as e:
-            print(f"[ERROR] Failed to show user notification: {e}")
+        except Exception:
+            logger.exception("Failed to show user notification")
+
+    def _toast(self, title, message, color, duration_ms=4000):
+        """Show a borderless, non-modal notification at the bottom right of the main window"""
+        top = tk.Toplevel(self.root)
+        top.overrideredirect(True)
+        top.attributes('-topmost', True)
+        top.configure(bg=color)
+
+        body = tk.Frame(top, bg=SynthwaveColors.PANEL_BG, padx=12, pady=8)
+        body.pack(padx=2, pady=2)
+        tk.Label(body, text=title, font=self.fonts['button'], fg=color,
+                 bg=SynthwaveColors.PANEL_BG, anchor='w').pack(fill='x')
+        tk.Label(body, text=message, font=self.fonts['label'], fg=SynthwaveColors.TEXT,
+                 bg=SynthwaveColors.PANEL_BG, justify='left', anchor='w', wraplength=360).pack(fill='x')
+
+        # Stack above any toasts already showing
+        top.update_idletasks()
+        offset = sum(t.winfo_height() + 8 for t in self._toasts)
+        x = self.root.winfo_x() + self.root.winfo_width() - top.winfo_width() - 20
+        y = self.root.winfo_y() + self.root.winfo_height() - top.winfo_height() - 20 - offset
+        top.geometry(f"+{max(x, 0)}+{max(y, 0)}")
+
+        self._toasts.append(top)
+        top.bind('<Button-1>', lambda e: self._dismiss_toast(top))
+        top.after(duration_ms, lambda: self._dismiss_toast(top))
+
+    def _dismiss_toast(self, top):
+        """Close a toast (click or timeout, whichever comes first)"""
+        if top in self._toasts:
+            self._toasts.remove(top)
+            top.destroy()
 
     def enhanced_model_error_recovery(self, error_context="unknown"):
         """Enhanced error recovery with multiple fallback strategies
@@ -3927,25 +5539,29 @@ Modified: {mod_str}"""
         Returns:
             bool: True if recovery successful, False otherwise
         """
-        print(f"[ERROR RECOVERY] Starting recovery for context: {error_context}")
+        logger.info("Starting error recovery for context: %s", error_context)
 
-        # Strategy 1: Try to refresh current model connection
-        if self.refresh_model_connection():
-            print("[ERROR RECOVERY] Recovery successful via model refresh")
-            self.show_user_notification(
-                "Model Recovery",
-                "Model connection restored successfully.",
-                "info"
-            )
-            return True
+        if self._lms_breaker.is_open():
+            # LMStudio failed repeatedly just now; don't pay for more timeouts
+            logger.warning("LMStudio circuit open, skipping reconnect and fallback")
+        else:
+            # Strategy 1: Try to refresh current model connection
+            if self.refresh_model_connection():
+                logger.info("Recovery successful via model refresh")
+                self.show_user_notification(
+                    "Model Recovery",
+                    "Model connection restored successfully.",
+                    "info"
+                )
+                return True
 
-        # Strategy 2: Try fallback model
-        if self.attempt_fallback_model():
-            print("[ERROR RECOVERY] Recovery successful via fallback model")
-            return True
+            # Strategy 2: Try fallback model
+            if self.attempt_fallback_model():
+                logger.info("Recovery successful via fallback model")
+                return True
 
         # Strategy 3: Reset to clean state and notify user
-        print("[ERROR RECOVERY] All recovery strategies failed")
+        logger.error("All recovery strategies failed")
         self.set_model_state(ModelState.FAILED, "All recovery attempts failed")
 
         self.show_user_notification(
@@ -3954,7 +5570,8 @@ Modified: {mod_str}"""
             "1. Check that LMStudio is running\n"
             "2. Verify models are available\n"
             "3. Try manually loading a model",
-            "error"
+            "error",
+            critical=True
         )
 
         return False
@@ -3962,22 +5579,26 @@ Modified: {mod_str}"""
     def save_model_preferences(self):
         """Save current model preferences and state to config file"""
         try:
+            budget = self._load_budget()
             config = {
                 "last_selected_model": self.current_model_var.get() if hasattr(self, 'current_model_var') else None,
                 "model_state": self.current_model_state,
-                "default_fallback_model": self.default_fallback_model,
+                "fallback_chain": self.fallback_chain,
+                "load_timeout": budget['timeout'],
+                "load_max_retries": budget['max_retries'],
+                "load_base_backoff": budget['base_backoff'],
                 "last_session_timestamp": datetime.now().isoformat(),
                 "available_models": getattr(self, 'available_models', []),
-                "auto_load_last_model": True  # Feature flag for auto-loading
+                "auto_load_last_model": getattr(self, 'model_config', {}).get("auto_load_last_model", True)
             }
 
             with open(self.config_file, 'w', encoding='utf-8') as f:
                 json.dump(config, f, indent=2)
 
-            print(f"[CONFIG] Model preferences saved to {self.config_file}")
+            logger.debug("Model preferences saved to %s", self.config_file)
 
-        except Exception as e:
-            print(f"[CONFIG ERROR] Failed to save model preferences: {e}")
+        except Exception:
+            logger.exception("Failed to save model preferences")
 
     def load_model_preferences(self):
         """Load model preferences and attempt to restore previous state
@@ -3988,34 +5609,40 @@ Modified: {mod_str}"""
         default_config = {
             "last_selected_model": None,
             "model_state": ModelState.UNLOADED,
-            "default_fallback_model": self.default_fallback_model,
+            "fallback_chain": self.fallback_chain,
+            "load_timeout": _DEFAULT_LOAD_BUDGET['timeout'],
+            "load_max_retries": _DEFAULT_LOAD_BUDGET['max_retries'],
+            "load_base_backoff": _DEFAULT_LOAD_BUDGET['base_backoff'],
             "auto_load_last_model": True,
             "available_models": []
         }
 
         try:
             if not self.config_file.exists():
-                print("[CONFIG] No previous configuration found, using defaults")
+                logger.info("No previous model configuration found, using defaults")
                 return default_config
 
             with open(self.config_file, 'r', encoding='utf-8') as f:
                 config = json.load(f)
 
-            print(f"[CONFIG] Loaded model preferences from {self.config_file}")
+            logger.info("Loaded model preferences from %s", self.config_file)
+            loaded_keys = set(config)
 
             # Validate and merge with defaults
             for key, default_value in default_config.items():
                 if key not in config:
                     config[key] = default_value
 
-            # Update fallback model if it was customized
-            if config.get("default_fallback_model"):
-                self.default_fallback_model = config["default_fallback_model"]
+            # Update fallback chain if it was customized (older files store a single model)
+            if config.get("default_fallback_model") and "fallback_chain" not in loaded_keys:
+                config["fallback_chain"] = [config["default_fallback_model"]]
+            if config.get("fallback_chain"):
+                self.fallback_chain = list(config["fallback_chain"])
 
             return config
 
-        except Exception as e:
-            print(f"[CONFIG ERROR] Failed to load model preferences: {e}")
+        except Exception:
+            logger.exception("Failed to load model preferences")
             return default_config
 
     def restore_model_session(self, config):
@@ -4028,55 +5655,62 @@ Modified: {mod_str}"""
             last_model = config.get("last_selected_model")
 
             if not last_model or not config.get("auto_load_last_model", True):
-                print("[SESSION] Auto-load disabled or no previous model to restore")
+                logger.info("Auto-load disabled or no previous model to restore")
                 return
 
-            # Clean up model name if it has fallback indicator
-            if last_model and "(fallback)" in last_model:
-                last_model = last_model.replace(" (fallback)", "")
+            # Clean up model name if it has fallback indicator, e.g. "name (fallback #0)"
+            if last_model and " (fallback" in last_model:
+                last_model = last_model.split(" (fallback")[0]
 
-            print(f"[SESSION] Attempting to restore last model: {last_model}")
+            logger.info("Attempting to restore last model: %s", last_model)
 
-            # Check if the model is still available
-            self.refresh_available_models()
+            # Check if the model is still available once the model list arrives
+            self.refresh_available_models(on_complete=lambda: self.finish_model_session_restore(last_model))
 
-            if hasattr(self, 'available_models') and last_model in self.available_models:
-                # Set the model in the dropdown
-                if hasattr(self, 'model_combobox'):
-                    self.model_combobox.set(last_model)
+        except Exception:
+            logger.exception("Failed to restore model session")
 
-                # Attempt to load the model in background
-                self.root.after(2000, self.attempt_model_preload, last_model)
-            else:
-                print(f"[SESSION] Last model '{last_model}' no longer available")
-                self.show_user_notification(
-                    "Model Unavailable",
-                    f"Previously used model '{last_model}' is no longer available.",
-                    "info"
-                )
+    def finish_model_session_restore(self, last_model):
+        """Select and preload the restored model if the refreshed list still has it"""
+        if hasattr(self, 'available_models') and last_model in self.available_models:
+            # Set the model in the dropdown
+            if hasattr(self, 'model_combobox'):
+                self.model_combobox.set(last_model)
 
-        except Exception as e:
-            print(f"[SESSION ERROR] Failed to restore model session: {e}")
+            # Start loading the model in background right away
+            self.attempt_model_preload(last_model)
+        else:
+            logger.info("Last model %r no longer available", last_model)
+            self.show_user_notification(
+                "Model Unavailable",
+                f"Previously used model '{last_model}' is no longer available.",
+                "info"
+            )
 
     def attempt_model_preload(self, model_name):
-        """Attempt to preload a model for faster subsequent use
+        """Start preloading a model on the load worker for faster subsequent use (GUI thread)
 
         Args:
             model_name: Name of the model to preload
         """
-        try:
-            if self.current_model_state != ModelState.UNLOADED:
-                print("[PRELOAD] Model already loaded, skipping preload")
-                return
+        if self.current_model_state != ModelState.UNLOADED:
+            logger.debug("Model already loaded, skipping preload")
+            return
 
-            print(f"[PRELOAD] Attempting to preload model: {model_name}")
-            self.set_model_state(ModelState.LOADING, f"Preloading {model_name}...")
+        if lms is None:
+            logger.info("lmstudio package not found, skipping preload")
+            return
 
-            # Import lmstudio to load the model
-            import lmstudio as lms
+        logger.info("Preloading model: %s", model_name)
+        self.set_model_state(ModelState.LOADING, f"Preloading {model_name}...")
+        self.submit_model_load(self._load_model, model_name,
+                               callback=lambda future: self._on_model_preloaded(future, model_name))
 
-            # Load the model instance
-            model_instance = lms.llm(model_name)
+    def _on_model_preloaded(self, future, model_name):
+        """Install a model started by attempt_model_preload (GUI thread)"""
+        self.update_model_health_labels()
+        try:
+            model_instance = future.result()
 
             # Store the model instance
             self.current_model_instance = model_instance
@@ -4084,31 +5718,30 @@ Modified: {mod_str}"""
             # Update the current model display
             self.current_model_var.set(model_name)
 
-            # Create transformer with the model instance
-            self.llm_transformer = TShirtPromptTransformer(model_instance=model_instance)
+            # Point the transformer at the model instance
+            self._bind_transformer(model_instance, model_name)
 
             # Set loaded state
             self.set_model_state(ModelState.LOADED, f"Preloaded {model_name}")
 
-            print(f"[PRELOAD] Successfully preloaded model: {model_name}")
+            logger.info("Preloaded model: %s", model_name)
 
             # Show subtle notification
             if hasattr(self, 'write_to_scan_results'):
                 self.write_to_scan_results(f"✅ Model preloaded: {model_name}")
 
         except Exception as e:
-            print(f"[PRELOAD ERROR] Failed to preload model {model_name}: {e}")
+            logger.error("Failed to preload model %s: %s", model_name, e)
             self.set_model_state(ModelState.FAILED, f"Preload failed: {str(e)}")
 
-            # Try fallback model if preload fails
-            if model_name != self.default_fallback_model:
-                print(f"[PRELOAD] Attempting fallback model: {self.default_fallback_model}")
-                self.root.after(1000, self.attempt_model_preload, self.default_fallback_model)
+            # Try the fallback chain if preload fails
+            logger.info("Preload failed, attempting fallback chain")
+            self.start_fallback_model_load(model_name)
 
     def cleanup_and_save_on_exit(self):
         """Clean up resources and save state before application exit"""
         try:
-            print("[EXIT] Cleaning up and saving state...")
+            logger.info("Cleaning up and saving state...")
 
             # Save current model preferences
             self.save_model_preferences()
@@ -4116,16 +5749,23 @@ Modified: {mod_str}"""
             # Clean up model resources
             self.cleanup_model_resources()
 
+            # Stop watching the gallery output folders and drop queued thumbnails
+            self.stop_gallery_watcher()
+            if hasattr(self, '_thumb_pool'):
+                self._thumb_pool.shutdown(wait=False)
+            self._decode_pool.shutdown(wait=False)
+            self._lmstudio_pool.shutdown(wait=False)
+
             # Additional cleanup can be added here
-            print("[EXIT] Cleanup completed")
+            logger.info("Cleanup completed")
 
-        except Exception as e:
-            print(f"[EXIT ERROR] Error during cleanup: {e}")
+        except Exception:
+            logger.exception("Error during cleanup")
 
     def on_window_close(self):
         """Handle window close event with proper cleanup"""
         try:
-            print("[WINDOW CLOSE] Application closing...")
+            logger.info("Application closing...")
 
             # Save state and clean up
             self.cleanup_and_save_on_exit()
@@ -4133,15 +5773,25 @@ Modified: {mod_str}"""
             # Destroy the window
             self.root.destroy()
 
-        except Exception as e:
-            print(f"[WINDOW CLOSE ERROR] Error during window close: {e}")
+        except Exception:
+            logger.exception("Error during window close")
             # Force close even if cleanup fails
             self.root.destroy()
 
 
 def main():
     """Main entry point"""
-    app = SynthwaveGUI()
+    # Format and write log records on a listener thread so the GUI thread never blocks on the console
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, console)
+    logging.basicConfig(level=logging.INFO, handlers=[logging.handlers.QueueHandler(log_queue)])
+    listener.start()
+    try:
+        app = SynthwaveGUI()
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
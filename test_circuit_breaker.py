@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test the LMStudio circuit breaker state transitions
+"""
+
+import time
+
+from synthwave_gui import CircuitBreaker, CircuitOpenError
+
+
+def _fail(breaker):
+    """Run one failing call through the breaker"""
+    try:
+        with breaker:
+            raise ConnectionError("LMStudio refused the connection")
+    except ConnectionError:
+        pass
+
+
+def test_opens_after_threshold():
+    """Consecutive failures open the breaker only once fail_threshold is reached"""
+    opened = []
+    breaker = CircuitBreaker(fail_threshold=3, reset_timeout=30.0, on_open=lambda: opened.append(True))
+
+    _fail(breaker)
+    _fail(breaker)
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert not opened
+
+    _fail(breaker)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.is_open()
+    assert opened == [True]
+
+
+def test_success_resets_failure_count():
+    """A clean call closes the breaker and forgets earlier failures"""
+    breaker = CircuitBreaker(fail_threshold=2, reset_timeout=30.0)
+
+    _fail(breaker)
+    with breaker:
+        pass
+    _fail(breaker)
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.failure_count == 1
+
+
+def test_open_breaker_fails_fast():
+    """While open, entering the breaker raises without running the call"""
+    breaker = CircuitBreaker(fail_threshold=1, reset_timeout=30.0)
+    _fail(breaker)
+
+    ran = []
+    try:
+        with breaker:
+            ran.append(True)
+    except CircuitOpenError as e:
+        assert "retrying in" in str(e)
+    else:
+        raise AssertionError("open breaker let a call through")
+    assert not ran
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_half_open_success_closes():
+    """After reset_timeout one trial call goes through, and its success closes the breaker"""
+    breaker = CircuitBreaker(fail_threshold=1, reset_timeout=0.05)
+    _fail(breaker)
+    time.sleep(0.06)
+
+    assert not breaker.is_open()
+    with breaker:
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.failure_count == 0
+
+
+def test_half_open_failure_reopens():
+    """A failed trial re-opens the breaker and restarts the reset timeout"""
+    opened = []
+    breaker = CircuitBreaker(fail_threshold=2, reset_timeout=0.05, on_open=lambda: opened.append(True))
+    _fail(breaker)
+    _fail(breaker)
+    time.sleep(0.06)
+
+    try:
+        with breaker:
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+            raise ConnectionError("still down")
+    except ConnectionError:
+        pass
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.is_open()
+    assert len(opened) == 2
+
+
+def main():
+    print("🚀 Testing CircuitBreaker")
+    print("=" * 60)
+
+    tests = [
+        test_opens_after_threshold,
+        test_success_resets_failure_count,
+        test_open_breaker_fails_fast,
+        test_half_open_success_closes,
+        test_half_open_failure_reopens,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"  {test.__name__}: ✅ PASS")
+        except AssertionError as e:
+            failed += 1
+            print(f"  {test.__name__}: ❌ FAIL {e}")
+
+    if failed:
+        print(f"\n⚠️  {failed} test(s) failed. Check the output above for details.")
+    else:
+        print(f"\n🎉 All circuit breaker tests passed!")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test the collision handling of the fallback saver's output names
+"""
+
+import os
+import tempfile
+
+from synthwave_gui import _create_unique_png
+
+
+def _claim(directory, stem, taken):
+    """Claim a name and close the returned descriptor"""
+    fd, path = _create_unique_png(directory, stem, taken)
+    os.close(fd)
+    return os.path.basename(path)
+
+
+def test_first_name_is_plain():
+    """An unused stem gets <stem>.png, created empty and recorded in taken"""
+    with tempfile.TemporaryDirectory() as directory:
+        taken = set()
+        name = _claim(directory, "design", taken)
+        assert name == "design.png"
+        assert os.path.getsize(os.path.join(directory, name)) == 0
+        assert taken == {"design.png"}
+
+
+def test_collisions_get_counters():
+    """Repeated stems get _001, _002, ... in order"""
+    with tempfile.TemporaryDirectory() as directory:
+        taken = set()
+        names = [_claim(directory, "design", taken) for _ in range(3)]
+        assert names == ["design.png", "design_001.png", "design_002.png"]
+
+
+def test_existing_file_not_in_taken():
+    """A file created behind taken's back is caught by O_EXCL, not overwritten"""
+    with tempfile.TemporaryDirectory() as directory:
+        existing = os.path.join(directory, "design.png")
+        with open(existing, 'wb') as f:
+            f.write(b"keep me")
+
+        taken = set()
+        name = _claim(directory, "design", taken)
+        assert name == "design_001.png"
+        assert "design.png" in taken
+        with open(existing, 'rb') as f:
+            assert f.read() == b"keep me"
+
+
+def test_taken_names_are_skipped():
+    """Names already in taken are skipped even if no such file exists"""
+    with tempfile.TemporaryDirectory() as directory:
+        taken = {"design.png", "design_001.png"}
+        name = _claim(directory, "design", taken)
+        assert name == "design_002.png"
+        assert not os.path.exists(os.path.join(directory, "design.png"))
+
+
+def main():
+    print("🚀 Testing unique PNG names")
+    print("=" * 60)
+
+    tests = [
+        test_first_name_is_plain,
+        test_collisions_get_counters,
+        test_existing_file_not_in_taken,
+        test_taken_names_are_skipped,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"  {test.__name__}: ✅ PASS")
+        except AssertionError as e:
+            failed += 1
+            print(f"  {test.__name__}: ❌ FAIL {e}")
+
+    if failed:
+        print(f"\n⚠️  {failed} test(s) failed. Check the output above for details.")
+    else:
+        print(f"\n🎉 All unique PNG name tests passed!")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file